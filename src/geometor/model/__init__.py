@@ -9,9 +9,11 @@ __version__ = "0.5.0"
 
 from geometor.model.serialize import load_model
 from geometor.model.model import GeometryObject, Model
+from geometor.model.numeric import NumericModel
 
 __all__ = [
     "Model",
+    "NumericModel",
     "GeometryObject",
     "load_model",
 ]
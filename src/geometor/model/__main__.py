@@ -1,22 +1,35 @@
 """Entry point for the application.
 
-Provides a CLI REPL for building geometric models.
+Provides a CLI REPL for building geometric models, and a batch mode that runs a script of the same commands from a file or standard input.
 """
 
+import argparse
+import logging
 import re
 import sys
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
 from geometor.model import Model
+from geometor.model.cache import ScriptCache
 from geometor.model.sections import Section
 from rich.console import Console
 from rich.panel import Panel
+from rich.table import Table
+from rich.text import Text
 
 console = Console()
 
-def parse_command(model: Model, command: str) -> None:
-    """Parses and executes a single command string."""
+def parse_command(model: Model, command: str) -> bool:
+    """Parses and executes a single command string.
+
+    Returns:
+        False if the command failed or was not understood, otherwise True.
+    """
     command = command.strip()
     if not command:
-        return
+        return True
 
     # Point: A = 0, 0
     point_match = re.match(r"^([A-Za-z0-9_]+)\s*=\s*([-\d\.]+)\s*,\s*([-\d\.]+)(?:\s+(.*))?$", command)
@@ -24,10 +37,10 @@ def parse_command(model: Model, command: str) -> None:
         label, x, y, remainder = point_match.groups()
         try:
             pt = model.set_point(float(x), float(y), ID=label, classes=["given"])
-            return
+            return True
         except Exception as e:
             console.print(f"[red]Error creating point:[/red] {e}")
-            return
+            return False
 
     # Auto-Label Point: * 0, 0
     auto_point_match = re.match(r"^\*\s*([-\d\.]+)\s*,\s*([-\d\.]+)(?:\s+(.*))?$", command)
@@ -36,10 +49,10 @@ def parse_command(model: Model, command: str) -> None:
         try:
             # ID is not passed, so it will be auto-generated by the model
             pt = model.set_point(float(x), float(y), classes=["given"])
-            return
+            return True
         except Exception as e:
             console.print(f"[red]Error creating point:[/red] {e}")
-            return
+            return False
 
 
     # Line: [ A B ]
@@ -48,10 +61,10 @@ def parse_command(model: Model, command: str) -> None:
         pt1, pt2 = line_match.groups()
         try:
             line = model.construct_line_by_IDs(pt1, pt2)
-            return
+            return True
         except Exception as e:
             console.print(f"[red]Error creating line:[/red] {e}")
-            return
+            return False
 
     # Circle: ( A B )
     circle_match = re.match(r"^\(\s*([A-Za-z0-9_]+)\s+([A-Za-z0-9_]+)\s*\)$", command)
@@ -59,10 +72,10 @@ def parse_command(model: Model, command: str) -> None:
         pt1, pt2 = circle_match.groups()
         try:
             circle = model.construct_circle_by_IDs(pt1, pt2)
-            return
+            return True
         except Exception as e:
             console.print(f"[red]Error creating circle:[/red] {e}")
-            return
+            return False
 
     # Polygon: < A B C >
     if match := re.match(r"^<\s*([A-Za-z0-9\s]+?)\s*>$", command):
@@ -70,11 +83,12 @@ def parse_command(model: Model, command: str) -> None:
         if len(pts) >= 3:
             try:
                 model.set_polygon_by_IDs(pts)
+                return True
             except Exception as e:
                 print(f"Error creating polygon: {e}")
         else:
             print("Polygon requires at least 3 points")
-        return
+        return False
 
     # Linear Division: / A B ... /
     if match := re.match(r"^/\s*([A-Za-z0-9\s]+?)\s*/$", command):
@@ -83,17 +97,19 @@ def parse_command(model: Model, command: str) -> None:
             # Segment
             try:
                 model.set_segment_by_IDs(pts[0], pts[1])
+                return True
             except Exception as e:
                 print(f"Error creating segment: {e}")
         elif len(pts) == 3:
             # Section
             try:
                 model.set_section_by_IDs(pts)
+                return True
             except Exception as e:
                 print(f"Error creating section: {e}")
         else:
             print("Linear division requires 2 or 3 points (Segment or Section)")
-        return
+        return False
 
     # Wedge: < A B E )
     if match := re.match(r"^<\s*([A-Za-z0-9\s]+?)\s*\)$", command):
@@ -103,12 +119,60 @@ def parse_command(model: Model, command: str) -> None:
             # Sweep Start implicitly Radius point (pts[1])
             try:
                 model.set_wedge_by_IDs(pts[0], pts[1], pts[1], pts[2])
+                return True
             except Exception as e:
                 print(f"Error creating wedge: {e}")
         else:
             print("Wedge requires 3 points: < Center Radius SweepEnd )")
-        return 
+        return False
     console.print(f"[yellow]Unknown command:[/yellow] {command}")
+    return False
+
+
+def read_commands(lines: Iterable[str]) -> Iterator[tuple[int, str]]:
+    """Yields the numbered commands of a script.
+
+    Blank lines and ``#`` comments are skipped, and the script ends at an
+    ``exit`` or ``quit`` line.
+    """
+    for number, line in enumerate(lines, 1):
+        command = line.strip()
+        if not command or command.startswith("#"):
+            continue
+        if command.lower() in ("exit", "quit"):
+            return
+        yield number, command
+
+
+def run_commands(
+    model: Model, lines: Iterable[str], stop_on_error: bool = False
+) -> list[dict]:
+    """Executes a script of commands on a model.
+
+    Args:
+        model: The model to build.
+        lines: The lines of the script.
+        stop_on_error: Whether to stop at the first failed command.
+
+    Returns:
+        A record of each command run - its ``line`` number, ``command``,
+        ``seconds`` and whether it was ``ok``.
+    """
+    records = []
+    for number, command in read_commands(lines):
+        start = time.perf_counter()
+        ok = parse_command(model, command)
+        records.append(
+            {
+                "line": number,
+                "command": command,
+                "seconds": time.perf_counter() - start,
+                "ok": ok,
+            }
+        )
+        if stop_on_error and not ok:
+            break
+    return records
 
 
 def run() -> None:
@@ -139,5 +203,95 @@ def run() -> None:
         except Exception as e:
             console.print(f"[red]Unexpected error:[/red] {e}")
 
+def main(argv: list[str] | None = None) -> int:
+    """Runs the CLI.
+
+    With a script argument - or with commands piped to standard input - the
+    commands are run in batch mode: model logging is quiet, the model is
+    saved to JSON and the time taken by each command is printed. With
+    ``--cache``, the run resumes from the checkpoint of the longest unchanged
+    prefix of the script. Otherwise the interactive REPL is started.
+
+    Returns:
+        0 if every command succeeded, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(
+        prog="model",
+        description="Build geometric models with the geometor command language.",
+    )
+    parser.add_argument(
+        "script", nargs="?", help="command file to run, or - for standard input"
+    )
+    parser.add_argument("-o", "--output", help="JSON file the model is saved to")
+    parser.add_argument("-n", "--name", help="name of the model")
+    parser.add_argument(
+        "-b",
+        "--backend",
+        choices=["sympy", "tower"],
+        default="sympy",
+        help="coordinate backend",
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="show the model's log"
+    )
+    parser.add_argument(
+        "--stop-on-error",
+        action="store_true",
+        help="stop at the first failed command",
+    )
+    parser.add_argument(
+        "--cache",
+        nargs="?",
+        const=".geometor_cache",
+        metavar="DIR",
+        help="resume from checkpoints of unchanged command prefixes",
+    )
+    args = parser.parse_args(argv)
+
+    if args.script is None and sys.stdin.isatty():
+        run()
+        return 0
+
+    if args.script in (None, "-"):
+        name = args.name or "cli_model"
+        lines = sys.stdin.read().splitlines()
+    else:
+        name = args.name or Path(args.script).stem
+        lines = Path(args.script).read_text().splitlines()
+    output = args.output or f"{name}.json"
+
+    logger = logging.getLogger(f"geometor.model.{name}")
+    if not args.verbose:
+        logger.setLevel(logging.WARNING)
+    model = Model(name, logger=None if args.verbose else logger, backend=args.backend)
+
+    start = time.perf_counter()
+    if args.cache:
+        model, records = ScriptCache(args.cache).run(
+            model, lines, stop_on_error=args.stop_on_error
+        )
+    else:
+        records = run_commands(model, lines, stop_on_error=args.stop_on_error)
+    total = time.perf_counter() - start
+    model.save(output)
+
+    table = Table(title=f"{name}: {len(records)} commands")
+    table.add_column("line", justify="right")
+    table.add_column("command")
+    table.add_column("seconds", justify="right")
+    for record in records:
+        table.add_row(
+            str(record["line"]),
+            Text(record["command"], style="" if record["ok"] else "red"),
+            "cached" if record.get("cached") else f"{record['seconds']:.3f}",
+        )
+    console.print(table)
+    console.print(
+        f"{len(model)} elements in {total:.3f}s, saved to [cyan]{output}[/cyan]"
+    )
+
+    return 0 if all(record["ok"] for record in records) else 1
+
+
 if __name__ == "__main__":
-    run()
+    raise SystemExit(main())
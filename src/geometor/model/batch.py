@@ -0,0 +1,310 @@
+"""Provides a parallel batch runner for construction scripts and journals.
+
+This module runs a directory of construction jobs - Python scripts that build models, or journal files of CLI commands - each in its own worker process with a timeout and an optional memory limit. A job that fails, hangs in a pathological simplification or runs out of memory is stopped and recorded without affecting the others. The :attr:`Model.stats` and output files of every job are collected into a single JSON summary.
+
+Run it with::
+
+    python -m geometor.model.batch constructions/ --output batch --timeout 300
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import runpy
+import signal
+import sys
+import time
+from collections import Counter
+from multiprocessing.connection import Connection, wait
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+__all__ = [
+    "SCRIPT_SUFFIXES",
+    "JOURNAL_SUFFIXES",
+    "find_jobs",
+    "run_job",
+    "run_batch",
+    "main",
+]
+
+#: File suffixes run as Python construction scripts.
+SCRIPT_SUFFIXES = (".py",)
+
+#: File suffixes run as journals of CLI commands.
+JOURNAL_SUFFIXES = (".txt", ".journal")
+
+
+def find_jobs(directory: str | Path) -> list[Path]:
+    """Returns the construction scripts and journals in a directory, sorted by name.
+
+    Args:
+        directory: The directory to search. Subdirectories are not searched.
+
+    Returns:
+        A list of absolute paths.
+    """
+    suffixes = SCRIPT_SUFFIXES + JOURNAL_SUFFIXES
+    return sorted(
+        path.resolve()
+        for path in Path(directory).iterdir()
+        if path.is_file() and path.suffix in suffixes
+    )
+
+
+def run_job(path: str | Path, output_dir: str | Path = ".") -> dict:
+    """Runs a single job in this process.
+
+    A script is run as ``__main__``, and every :class:`Model` bound to a
+    module-level name is collected. A journal is replayed line by line into a
+    new model with :func:`geometor.model.__main__.run_commands`, and the
+    model is saved to ``output_dir``.
+
+    Args:
+        path: The script or journal to run.
+        output_dir: The directory for the job's output files.
+
+    Returns:
+        A dict with the ``stats`` of each model and the job's ``outputs``.
+    """
+    from geometor.model import Model
+    from geometor.model.__main__ import run_commands
+
+    path = Path(path)
+    output_dir = Path(output_dir)
+
+    if path.suffix in SCRIPT_SUFFIXES:
+        namespace = runpy.run_path(str(path), run_name="__main__")
+        models = [value for value in namespace.values() if isinstance(value, Model)]
+    else:
+        model = Model(path.stem)
+        with open(path) as file:
+            run_commands(model, file)
+        model.save(str(output_dir / f"{path.stem}.json"))
+        models = [model]
+
+    return {
+        "models": [model.stats for model in models],
+        "outputs": sorted(
+            str(output.relative_to(output_dir))
+            for output in output_dir.rglob("*")
+            if output.is_file() and output.name != "job.log"
+        ),
+    }
+
+
+def _job_process(
+    path: Path, job_dir: Path, memory: int | None, connection: Connection
+) -> None:
+    """Runs a job in a worker process and sends back its result."""
+    if hasattr(os, "setpgrp"):
+        # intersection pools started by the job are killed along with it
+        os.setpgrp()
+    job_dir.mkdir(parents=True, exist_ok=True)
+
+    # keep the job's console output out of the batch output
+    log = open(job_dir / "job.log", "w", buffering=1)
+    os.dup2(log.fileno(), 1)
+    os.dup2(log.fileno(), 2)
+    sys.stdout = sys.stderr = log
+    os.chdir(job_dir)
+
+    if memory:
+        try:
+            import resource
+
+            resource.setrlimit(resource.RLIMIT_AS, (memory, memory))
+        except (ImportError, ValueError, OSError):
+            pass
+
+    try:
+        result = {"status": "ok", **run_job(path, job_dir)}
+    except MemoryError:
+        result = {"status": "memory", "error": "MemoryError"}
+    except SystemExit as error:
+        if error.code in (None, 0):
+            result = {"status": "ok", "models": [], "outputs": []}
+        else:
+            result = {"status": "error", "error": f"SystemExit: {error.code}"}
+    except BaseException as error:
+        result = {"status": "error", "error": f"{type(error).__name__}: {error}"}
+
+    connection.send(result)
+    connection.close()
+
+
+def _kill(process: multiprocessing.Process) -> None:
+    """Kills a job process and any processes it started."""
+    if hasattr(os, "killpg"):
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except OSError:
+            pass
+    if process.is_alive():
+        process.kill()
+    process.join()
+
+
+def run_batch(
+    jobs: list[str | Path],
+    output_dir: str | Path = "batch",
+    workers: int | None = None,
+    timeout: float | None = 300.0,
+    memory: int | None = None,
+) -> dict:
+    """Runs jobs in parallel worker processes and writes a summary.
+
+    Each job runs in a process of its own, in its own directory under
+    ``output_dir`` where its output files and console log are kept. A job
+    still running after ``timeout`` seconds is killed.
+
+    The summary is written to ``output_dir/summary.json``. Each job's record
+    has a ``status`` of ``"ok"``, ``"error"``, ``"timeout"``, ``"memory"`` or
+    ``"crashed"``, its run time in ``seconds``, and the model ``stats`` and
+    ``outputs`` of the jobs that finished.
+
+    Args:
+        jobs: The scripts and journals to run.
+        output_dir: The directory for job outputs and the summary.
+        workers: The number of jobs run at once. Defaults to the CPU count.
+        timeout: The time limit for each job in seconds, or None.
+        memory: The address space limit for each job in bytes, or None.
+            Only enforced on platforms with the ``resource`` module.
+
+    Returns:
+        The summary dict.
+    """
+    output_dir = Path(output_dir).resolve()
+    output_dir.mkdir(parents=True, exist_ok=True)
+    workers = workers or multiprocessing.cpu_count()
+
+    pending = [Path(job).resolve() for job in jobs]
+    records = {path: None for path in pending}
+    running = {}
+    started = time.perf_counter()
+
+    def finish(connection: Connection, record: dict) -> None:
+        path, process, start = running.pop(connection)
+        process.join(1)
+        _kill(process)
+        if record is None:
+            record = {
+                "status": "crashed",
+                "error": f"exit code {process.exitcode}",
+            }
+        records[path] = {
+            "job": path.name,
+            "path": str(path),
+            "seconds": round(time.perf_counter() - start, 3),
+            **record,
+        }
+
+    try:
+        while pending or running:
+            while pending and len(running) < workers:
+                path = pending.pop(0)
+                receiver, sender = multiprocessing.Pipe(duplex=False)
+                process = multiprocessing.Process(
+                    target=_job_process,
+                    args=(path, output_dir / path.name, memory, sender),
+                )
+                process.start()
+                sender.close()
+                running[receiver] = (path, process, time.perf_counter())
+
+            wait_time = None
+            if timeout is not None:
+                now = time.perf_counter()
+                wait_time = max(
+                    0.0, min(start + timeout - now for _, _, start in running.values())
+                )
+
+            for connection in wait(list(running), wait_time):
+                try:
+                    record = connection.recv()
+                except EOFError:
+                    record = None
+                finish(connection, record)
+
+            if timeout is not None:
+                now = time.perf_counter()
+                for connection, (_, process, start) in list(running.items()):
+                    if now - start >= timeout:
+                        _kill(process)
+                        finish(
+                            connection,
+                            {"status": "timeout", "error": f"exceeded {timeout}s"},
+                        )
+
+    finally:
+        # only reached with jobs running if the batch itself was interrupted
+        for _, process, _ in running.values():
+            _kill(process)
+
+    summary = {
+        "jobs": list(records.values()),
+        "totals": dict(Counter(record["status"] for record in records.values())),
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+    with open(output_dir / "summary.json", "w") as file:
+        json.dump(summary, file, indent=4)
+
+    return summary
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Runs the batch runner from the command line.
+
+    Returns:
+        0 if every job finished, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m geometor.model.batch",
+        description="Run construction scripts and journals in parallel.",
+    )
+    parser.add_argument("directory", help="directory of scripts and journals")
+    parser.add_argument("-o", "--output", default="batch", help="output directory")
+    parser.add_argument("-j", "--workers", type=int, help="number of parallel jobs")
+    parser.add_argument(
+        "-t", "--timeout", type=float, default=300.0, help="seconds allowed per job"
+    )
+    parser.add_argument(
+        "-m", "--memory", type=int, help="memory limit per job in megabytes"
+    )
+    args = parser.parse_args(argv)
+
+    summary = run_batch(
+        find_jobs(args.directory),
+        args.output,
+        workers=args.workers,
+        timeout=args.timeout,
+        memory=args.memory * 1024 * 1024 if args.memory else None,
+    )
+
+    table = Table(title=f"batch: {args.directory}")
+    table.add_column("job")
+    table.add_column("status", justify="center")
+    table.add_column("seconds", justify="right")
+    table.add_column("points", justify="right")
+    table.add_column("error")
+    for record in summary["jobs"]:
+        status = record["status"]
+        table.add_row(
+            record["job"],
+            f"[{'green' if status == 'ok' else 'red'}]{status}",
+            f"{record['seconds']:.2f}",
+            str(sum(stats["points"] for stats in record.get("models", []))),
+            record.get("error", ""),
+        )
+    Console().print(table)
+
+    return 0 if set(summary["totals"]) <= {"ok"} else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,159 @@
+"""Provides incrementally maintained bounding boxes for the Model class.
+
+This module keeps the bounds of a model's points and circles up to date as elements are added, so renderers can ask for the limits of a growing model on every redraw without a scan. Bounds are kept per query - all elements, elements of some classes, with or without guides - and only rescanned after a deletion that touched one of their extremes.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+import sympy.geometry as spg
+
+if TYPE_CHECKING:
+    from geometor.model.element import Element
+
+__all__ = ["BoundsMixin"]
+
+
+class _Bounds:
+    """The extent of the elements matching one query, and how far it is up to date."""
+
+    __slots__ = ("min_x", "max_x", "min_y", "max_y", "position", "valid")
+
+    def __init__(self) -> None:
+        self.min_x = self.min_y = math.inf
+        self.max_x = self.max_y = -math.inf
+        self.position = 0
+        self.valid = True
+
+    def copy(self) -> _Bounds:
+        bounds = _Bounds()
+        bounds.min_x, bounds.max_x = self.min_x, self.max_x
+        bounds.min_y, bounds.max_y = self.min_y, self.max_y
+        bounds.valid = self.valid
+        return bounds
+
+    def include(self, extent: tuple[float, float, float, float]) -> None:
+        min_x, max_x, min_y, max_y = extent
+        if min_x < self.min_x:
+            self.min_x = min_x
+        if max_x > self.max_x:
+            self.max_x = max_x
+        if min_y < self.min_y:
+            self.min_y = min_y
+        if max_y > self.max_y:
+            self.max_y = max_y
+
+    def touches(self, extent: tuple[float, float, float, float]) -> bool:
+        min_x, max_x, min_y, max_y = extent
+        return (
+            min_x <= self.min_x
+            or max_x >= self.max_x
+            or min_y <= self.min_y
+            or max_y >= self.max_y
+        )
+
+
+def _extent(key: object, element: Element) -> tuple[float, float, float, float] | None:
+    """Returns ``(min_x, max_x, min_y, max_y)`` of a point or circle, else None."""
+    if isinstance(key, spg.Point):
+        x, y = element.numeric
+        x, y = float(x), float(y)
+        return x, x, y, y
+    if isinstance(key, spg.Circle):
+        x, y, radius = element.numeric
+        x, y, radius = float(x), float(y), float(radius)
+        return x - radius, x + radius, y - radius, y + radius
+    return None
+
+
+def _is_guide(element: Element) -> bool:
+    return bool(element.guide) or "guide" in element.classes
+
+
+class BoundsMixin:
+    """Mixin for the Model class maintaining the bounds of points and circles.
+
+    Every key added to the model - or handed out for modification by :meth:`_writable`, since it may gain classes - is appended to a log. The bounds cached for a query catch up on the log when they are next asked for, so adding elements costs nothing until the limits are needed. Deleting an element only invalidates the bounds it was on the edge of.
+    """
+
+    def _bounds_added(self, key: object) -> None:
+        """Records a key that was added or may have changed."""
+        self._bounds_log.append(key)
+
+    def _bounds_removed(self, key: object, element: Element) -> None:
+        """Invalidates the bounds that a removed element was on the edge of."""
+        extent = _extent(key, element)
+        if extent is None:
+            return
+        for bounds in self._bounds.values():
+            if bounds.valid and bounds.touches(extent):
+                bounds.valid = False
+
+    def _bounds_reset(self) -> None:
+        """Drops all cached bounds, after the model was rebuilt directly."""
+        self._bounds = {}
+        self._bounds_log = []
+
+    def limits(
+        self, classes: list[str] | None = None, guides: bool = True
+    ) -> list[list[float]]:
+        """Find x, y limits from points and circles of the model.
+
+        The bounds of each distinct query are cached and maintained
+        incrementally as elements are added, so repeated calls on a growing
+        model only look at the new elements.
+
+        Args:
+            classes: Only include elements with at least one of these classes.
+                Defaults to all elements.
+            guides: Whether to include guide elements.
+
+        Returns:
+            ``[[min_x, max_x], [min_y, max_y]]``
+
+        Raises:
+            ValueError: If no points or circles match.
+        """
+        query = (frozenset(classes) if classes else None, guides)
+
+        def matches(element: Element) -> bool:
+            if not guides and _is_guide(element):
+                return False
+            return query[0] is None or not query[0].isdisjoint(element.classes)
+
+        log = self._bounds_log
+        bounds = self._bounds.get(query)
+        if bounds is None or not bounds.valid:
+            bounds = _Bounds()
+            for key, element in self.items():
+                extent = _extent(key, element)
+                if extent is not None and matches(element):
+                    bounds.include(extent)
+            self._bounds[query] = bounds
+        else:
+            for key in log[bounds.position :]:
+                element = self.get(key)
+                if element is None:
+                    continue
+                extent = _extent(key, element)
+                if extent is not None and matches(element):
+                    bounds.include(extent)
+        bounds.position = len(log)
+
+        # once every cached query has caught up, the log can start over
+        if all(
+            not cached.valid or cached.position == len(log)
+            for cached in self._bounds.values()
+        ):
+            log.clear()
+            for cached in self._bounds.values():
+                cached.position = 0
+
+        if bounds.min_x > bounds.max_x:
+            raise ValueError(
+                "Model contains no geometric elements to determine limits."
+            )
+
+        return [[bounds.min_x, bounds.max_x], [bounds.min_y, bounds.max_y]]
@@ -0,0 +1,141 @@
+"""Provides copy-on-write branching for the Model class.
+
+This module lets a model be branched for "what-if" constructions. A branch starts as a shallow copy that shares every element with its parent; an element is only copied when either model is about to modify it. A branch can be discarded at no cost, or committed back into its parent.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sympy.geometry.entity import GeometryEntity
+
+from geometor.model.element import Element
+
+if TYPE_CHECKING:
+    from geometor.model.model import Model
+
+__all__ = ["BranchesMixin"]
+
+
+class BranchesMixin:
+    """Mixin for the Model class containing branching operations.
+
+    Elements that may be shared with a branch are tracked through an ``owned`` set of keys. Code that modifies an element in place - adding parents or classes - gets it through :meth:`_writable`, which copies shared elements first.
+    """
+
+    def _writable(self, key: GeometryEntity) -> Element:
+        """Returns the element for ``key``, ready to be modified in place.
+
+        If the element may be shared with a branch or parent, it is replaced
+        by a private copy first.
+
+        Args:
+            key: The key of the element.
+
+        Returns:
+            The element, owned by this model.
+        """
+        element = self[key]
+        if self._owned is not None and key not in self._owned:
+            element = element.copy()
+            dict.__setitem__(self, key, element)
+            self._owned.add(key)
+        self._version += 1
+        # the element may gain classes, which changes its bounds queries
+        self._bounds_added(key)
+        return element
+
+    @property
+    def branch_parent(self) -> Model | None:
+        """The model this branch was made from, if it is an open branch."""
+        return self._branch_parent
+
+    def branch(self, name: str = "") -> Model:
+        """Returns a copy-on-write branch of the model.
+
+        The branch shares all elements with this model and only copies an
+        element when it modifies it, so branching costs a shallow copy of the
+        keys. From then on this model also copies shared elements before
+        modifying them, so neither side sees the other's changes.
+
+        Args:
+            name: The name of the branch. Defaults to the name of this model.
+
+        Returns:
+            A new :class:`Model` instance.
+        """
+        from geometor.model.model import Model
+
+        child = Model(name or self.name, logger=self._logger)
+        dict.update(child, self)
+        child.last_point_id = self.last_point_id
+        child.ID_gen = child.point_ID_generator(self.last_point_id)
+        child._analysis_hook = self._analysis_hook
+        child._simplify_budget = self._simplify_budget
+        child._interned = self._interned
+        child._numeric_digits = self._numeric_digits
+        child._tower = self._tower
+        child._tower_signatures = self._tower_signatures
+        if self._tower_index is not None:
+            child._tower_index = dict(self._tower_index)
+        child._poly_count = self._poly_count
+        child._bounds = {
+            query: bounds.copy()
+            for query, bounds in self._bounds.items()
+            if bounds.position == len(self._bounds_log)
+        }
+        child._branch_parent = self
+        child._branch_version = self._version
+        child._owned = set()
+
+        # every element is now shared with the branch
+        self._owned = set()
+
+        return child
+
+    def discard(self) -> None:
+        """Discard a branch, leaving its parent untouched."""
+        self._branch_parent = None
+        dict.clear(self)
+
+    def commit(self) -> Model:
+        """Commit a branch back into its parent.
+
+        The parent takes the branch's elements, in the branch's order, along
+        with its ID state. The branch is closed afterwards.
+
+        Returns:
+            The parent model.
+
+        Raises:
+            ValueError: If the model is not an open branch, or the parent has
+                changed since the branch was made.
+        """
+        parent = self._branch_parent
+        if parent is None:
+            raise ValueError(f"Model {self.name!r} is not an open branch")
+        if parent._version != self._branch_version:
+            raise ValueError(
+                f"Model {parent.name!r} has changed since the branch was made"
+            )
+
+        dict.clear(parent)
+        dict.update(parent, self)
+        parent.last_point_id = self.last_point_id
+        parent.ID_gen = parent.point_ID_generator(self.last_point_id)
+        parent._poly_count = self._poly_count
+        parent._tower_index = self._tower_index
+        parent._bounds = self._bounds
+        parent._bounds_log = self._bounds_log
+        parent._spatial = self._spatial
+        parent._spatial_size = self._spatial_size
+        parent._owned = self._owned
+        parent._version += 1
+
+        # the branch no longer owns anything - it shares it all with the parent
+        self._owned = set()
+        self._bounds_reset()
+        self._spatial = None
+        self._branch_parent = None
+
+        return parent
@@ -0,0 +1,160 @@
+"""Provides a content-addressed checkpoint cache for command scripts.
+
+This module stores models built by scripts of CLI commands under a hash of the commands that built them. Each checkpoint key chains the hash of the previous prefix with the next command, so when a script is edited, the run resumes from the checkpoint of the longest unchanged prefix and only the commands after it are executed again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from geometor.model.model import Model
+
+__all__ = ["ScriptCache"]
+
+
+class ScriptCache:
+    """A directory of model checkpoints keyed by command prefix.
+
+    Checkpoints are pickled models, with whether each command that built
+    them succeeded, written after every ``every`` commands and after the
+    last one - so a resumed run reports the same failures as the run that
+    stored it. Keys also cover the package version and the model's backend,
+    so a checkpoint is never resumed by a different build.
+
+    Args:
+        directory: The cache directory, created if needed.
+        every: The number of commands between checkpoints.
+    """
+
+    def __init__(self, directory: str | Path, every: int = 10) -> None:
+        self.directory = Path(directory)
+        self.every = max(1, every)
+
+    def keys(self, commands: list[str], backend: str = "sympy") -> list[str]:
+        """Returns the checkpoint key of each prefix of a script.
+
+        Args:
+            commands: The commands of the script.
+            backend: The coordinate backend of the model.
+
+        Returns:
+            A list where ``keys[i]`` is the key of the first ``i + 1`` commands.
+        """
+        from geometor.model import __version__
+
+        digest = hashlib.sha256(f"geometor.model {__version__} {backend}".encode())
+        keys = []
+        for command in commands:
+            digest = hashlib.sha256(digest.digest() + b"\n" + command.encode())
+            keys.append(digest.hexdigest())
+        return keys
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.pickle"
+
+    def load(self, key: str) -> tuple[Model, list[bool]] | None:
+        """Returns the model and command results stored under a key, or None."""
+        try:
+            with open(self._path(key), "rb") as file:
+                model, ok = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except (
+            pickle.UnpicklingError,
+            EOFError,
+            AttributeError,
+            ImportError,
+            TypeError,
+            ValueError,
+        ):
+            # a damaged or stale checkpoint is rebuilt
+            return None
+        return model, list(ok)
+
+    def store(self, key: str, model: Model, ok: list[bool]) -> None:
+        """Stores a model and its command results under a key, atomically."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        handle, temp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as file:
+                pickle.dump((model, ok), file, pickle.HIGHEST_PROTOCOL)
+            os.replace(temp, self._path(key))
+        except BaseException:
+            os.unlink(temp)
+            raise
+
+    def run(
+        self, model: Model, lines: Iterable[str], stop_on_error: bool = False
+    ) -> tuple[Model, list[dict]]:
+        """Runs a script of commands, resuming from the longest cached prefix.
+
+        Args:
+            model: A new model to build. If a checkpoint is resumed, the
+                checkpoint's model is used instead, with this model's name
+                and logger.
+            lines: The lines of the script.
+            stop_on_error: Whether to stop at the first failed command.
+
+        Returns:
+            The model built and a record for each command, as from
+            :func:`geometor.model.__main__.run_commands`. Commands restored from
+            the cache are marked ``cached``.
+        """
+        from geometor.model.__main__ import parse_command, read_commands
+
+        numbered = list(read_commands(lines))
+        commands = [command for _, command in numbered]
+        keys = self.keys(commands, model.backend)
+
+        resumed = 0
+        ok = []
+        for count in range(len(keys), 0, -1):
+            cached = self.load(keys[count - 1])
+            if cached is not None:
+                cached_model, ok = cached
+                cached_model.name = model.name
+                cached_model._logger = model._logger
+                model = cached_model
+                resumed = count
+                break
+
+        records = [
+            {
+                "line": number,
+                "command": command,
+                "seconds": 0.0,
+                "ok": command_ok,
+                "cached": True,
+            }
+            for (number, command), command_ok in zip(numbered[:resumed], ok)
+        ]
+        if stop_on_error and not all(ok):
+            return model, records[: ok.index(False) + 1]
+        for index in range(resumed, len(numbered)):
+            number, command = numbered[index]
+            start = time.perf_counter()
+            command_ok = parse_command(model, command)
+            ok.append(command_ok)
+            records.append(
+                {
+                    "line": number,
+                    "command": command,
+                    "seconds": time.perf_counter() - start,
+                    "ok": command_ok,
+                    "cached": False,
+                }
+            )
+            if stop_on_error and not command_ok:
+                break
+            if (index + 1) % self.every == 0 or index + 1 == len(numbered):
+                self.store(keys[index], model, ok)
+
+        return model, records
@@ -4,13 +4,135 @@
 This module defines the `Chain` class, which facilitates the study of sequences of connected geometric sections. It offers tools for extracting segments and points, analyzing the flow of segment lengths, and exploring symmetries within the structure.
 """
 
+from __future__ import annotations
+
+from functools import cached_property
+from typing import TYPE_CHECKING
+
 import sympy as sp
 import sympy.geometry as spg
+from rich.table import Table
 
+from geometor.model.colors import COLORS
 from geometor.model.sections import Section
-from geometor.model.utils import clean_expr
+from geometor.model.utils import classify_lengths, clean_expr, sort_points
+
+if TYPE_CHECKING:
+    from geometor.model.model import Model
+
+__all__ = ["ChainsMixin", "Chain", "segment_key"]
+
+
+def segment_key(pt_1: spg.Point, pt_2: spg.Point) -> frozenset[spg.Point]:
+    """Returns an orientation-independent hash key for a segment.
+
+    Points in a model are deduplicated by :meth:`Model.set_point`, so equal
+    segments share the same endpoint objects and can be matched by hashing
+    instead of symbolic comparison.
+
+    Args:
+        pt_1: The first endpoint.
+        pt_2: The second endpoint.
+
+    Returns:
+        A frozenset of the two endpoints.
+    """
+    return frozenset((pt_1, pt_2))
+
+
+class ChainsMixin:
+    """Mixin for the Model class containing chain discovery operations.
+
+    This mixin assembles the golden sections of a model into :class:`Chain` objects. Sections are linked when the trailing segment of one is the leading segment of the next, and every maximal run of linked sections along a line is reported as a chain.
+    """
+
+    def find_chains(
+        self, sections: list[Section] | None = None, min_sections: int = 2
+    ) -> list[Chain]:
+        """Find all maximal chains of connected golden sections.
+
+        Each section is oriented along its line so its points run in
+        ascending order. The sections are then indexed by their leading
+        segment, keyed on the endpoint points, so linking ``n`` sections
+        costs ``O(n)`` hash lookups rather than ``O(n²)`` symbolic
+        comparisons. The links form a directed acyclic graph; every path
+        from a section with no predecessor to one with no successor is a
+        maximal chain.
+
+        Args:
+            sections: The sections to assemble. If None, the golden sections
+                of the model are used.
+            min_sections: The minimum number of sections for a chain to be
+                reported.
+
+        Returns:
+            A list of :class:`Chain` objects.
+        """
+        if sections is None:
+            sections = [
+                el
+                for el, details in self.items()
+                if isinstance(el, Section)
+                and ("golden" in details.classes or el.is_golden)
+            ]
+
+        oriented = [_orient_section(self, section) for section in sections]
+        oriented = [section for section in oriented if section is not None]
+
+        by_leading = {}
+        for section in oriented:
+            key = segment_key(section.points[0], section.points[1])
+            by_leading.setdefault(key, []).append(section)
+
+        successors = {}
+        has_predecessor = set()
+        for section in oriented:
+            key = segment_key(section.points[1], section.points[2])
+            following = by_leading.get(key, [])
+            successors[section] = following
+            has_predecessor.update(following)
 
-__all__ = ["Chain"]
+        chains = []
+        for start in oriented:
+            if start in has_predecessor:
+                continue
+            stack = [[start]]
+            while stack:
+                path = stack.pop()
+                following = successors[path[-1]]
+                if not following:
+                    if len(path) >= min_sections:
+                        chains.append(Chain(path))
+                    continue
+                for section in reversed(following):
+                    stack.append(path + [section])
+
+        if chains:
+            self.log(
+                f"[{COLORS['golden']} bold]chains[/{COLORS['golden']} bold] : {len(chains)}"
+            )
+            table = Table(show_header=False, box=None, padding=(0, 4))
+            for chain in chains:
+                IDs = " ".join(str(self[pt].ID or pt) for pt in chain.points)
+                table.add_row(f"    {IDs}", f"[cyan]{chain.flow}[/cyan]")
+            self.log(table)
+
+        return chains
+
+
+def _orient_section(model: Model, section: Section) -> Section | None:
+    """Returns the section with its points in ascending order along its line.
+
+    Returns None if the inner point does not lie between the outer points.
+    """
+    ordered = sort_points(
+        section.points, [model[pt].numeric for pt in section.points]
+    )
+    if ordered == list(section.points):
+        return section
+    if ordered == list(reversed(section.points)):
+        return Section(ordered)
+    return None
 
 
 class Chain:
@@ -34,17 +156,18 @@ class Chain:
     def extract_segments(self) -> list[spg.Segment]:
         """Extracts unique segments from the chain.
         
-        This method iterates through all sections in the chain and collects every unique segment involved. It ensures that no duplicate segments are stored in the chain's segment list.
+        This method iterates through all sections in the chain and collects every unique segment involved. Segments are matched by their endpoints regardless of orientation, so extraction is linear in the number of sections.
 
         Returns:
             A list containing the unique segments in the chain.
         """
-        segments = []
+        segments = {}
         for section in self.sections:
             for segment in section.segments:
-                if not any(segment.equals(existing) for existing in segments):
-                    segments.append(segment)
-        return segments
+                key = segment_key(*segment.points)
+                if key not in segments:
+                    segments[key] = segment
+        return list(segments.values())
 
     def extract_points(self) -> list[spg.Point]:
         """Extracts unique points from the chain while maintaining order.
@@ -69,7 +192,7 @@ class Chain:
         Returns:
             A list containing the symbolic lengths of each segment in the chain.
         """
-        return [clean_expr(segment.length) for segment in self.segments]
+        return [length for length, _ in self._evaluated_lengths]
 
     @property
     def numerical_lengths(self) -> list[float]:
@@ -80,7 +203,20 @@ class Chain:
         Returns:
             A list containing the evaluated numerical lengths of each segment in the chain.
         """
-        return [float(segment.length.evalf()) for segment in self.segments]
+        return [value for _, value in self._evaluated_lengths]
+
+    @cached_property
+    def _evaluated_lengths(self) -> list[tuple[sp.Expr, float]]:
+        """The cleaned symbolic and numerical length of each segment.
+
+        Evaluated once per chain and shared by :attr:`lengths`,
+        :attr:`numerical_lengths` and the properties built on them.
+        """
+        evaluated = []
+        for segment in self.segments:
+            length = clean_expr(segment.length)
+            evaluated.append((length, float(length.evalf())))
+        return evaluated
 
     @property
     def flow(self) -> list[str]:
@@ -92,18 +228,29 @@ class Chain:
              A list of symbols representing the flow of segment lengths. '>' indicates that the previous segment is longer, '<' indicates that the next segment is longer.
         """
         flow_symbols = []
-        lengths = self.numerical_lengths  # Using numerical lengths for comparison
+        classes = self.length_classes
 
-        for i in range(len(lengths) - 1):
-            if lengths[i] > lengths[i + 1]:
+        for i in range(len(classes) - 1):
+            if classes[i] > classes[i + 1]:
                 flow_symbols.append(">")
-            elif lengths[i] < lengths[i + 1]:
+            elif classes[i] < classes[i + 1]:
                 flow_symbols.append("<")
             else:
                 flow_symbols.append("=")  # Equal lengths
 
         return "".join(flow_symbols)
 
+    @cached_property
+    def length_classes(self) -> list[int]:
+        """The equal-length class of each segment in the chain.
+
+        Segments are classified with :func:`geometor.model.utils.classify_lengths`, so lengths that only differ by floating-point noise share a class. Classes are numbered in ascending order of length.
+
+        Returns:
+            A list containing the class index of each segment in the chain.
+        """
+        return classify_lengths(self.lengths, self.numerical_lengths)
+
     def count_symmetry_lines(self) -> int:
         symmetry_count = 0
         flow = self.flow
@@ -131,20 +278,16 @@ class Chain:
 
         # Step 2: Generate Expressions
         expressions = [a, b]
-        unique_lengths = sorted(set(self.numerical_lengths))
-        for _ in range(2, len(unique_lengths)):
+        classes = self.length_classes
+        class_count = max(classes) + 1 if classes else 0
+        for _ in range(2, class_count):
             next_expr = expressions[-1] + expressions[-2]
             expressions.append(next_expr)
 
         # Step 3: Mapping Expressions
-        length_to_expr = {
-            length: str(expr).replace(" ", "")
-            for length, expr in zip(unique_lengths, expressions)
-        }
+        class_to_expr = [str(expr).replace(" ", "") for expr in expressions]
 
         # Assign expressions to segments
-        segment_expressions = [
-            str(length_to_expr[length]) for length in self.numerical_lengths
-        ]
+        segment_expressions = [class_to_expr[length_class] for length_class in classes]
 
         return segment_expressions
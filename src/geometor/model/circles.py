@@ -77,14 +77,17 @@ class CirclesMixin:
         if classes is None:
             classes = []
         # find radius length for sympy.Circle
-        radius_len = pt_center.distance(pt_radius)
-
         if not isinstance(pt_center, spg.Point) or not isinstance(pt_radius, spg.Point):
             raise TypeError(
                 "Both pt_center and pt_radius must be instances of sympy.geometry.point.Point"
             )
 
-        struct = spg.Circle(pt_center, radius_len)
+        # work from the quadrance - the radius is only its square root, kept
+        # on the key because model keys are sympy objects
+        quadrance = self.intern(
+            (pt_radius.x - pt_center.x) ** 2 + (pt_radius.y - pt_center.y) ** 2
+        )
+        struct = spg.Circle(pt_center, sp.sqrt(quadrance))
 
         if not ID:
             pt_1_ID = self[pt_center].ID
@@ -98,14 +101,19 @@ class CirclesMixin:
             ID=ID,
             pt_radius=pt_radius,
             guide=guide,
+            quadrance=quadrance,
+            numeric_digits=self._numeric_digits,
         )
         #  details.pt_radius = pt_radius
 
-        exists, existing_circle = check_existence(self, struct, self.circles)
+        exists, existing_circle = check_existence(
+            self, struct, self.circles, quadrance
+        )
         if exists:
             # handle the logic for an existing circle
-            self[existing_circle].parents[details.pt_radius] = ""
-            self[existing_circle].classes.update(details.classes)
+            existing = self._writable(existing_circle)
+            existing.parents[details.pt_radius] = ""
+            existing.classes.update(details.classes)
             return existing_circle
         else:
             # add the new circle to the model
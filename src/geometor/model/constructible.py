@@ -0,0 +1,518 @@
+"""Provides exact arithmetic on constructible numbers for the Model class.
+
+Every coordinate of a ruler-and-compass construction lies in a tower of quadratic extensions of the rationals, ``Q ⊂ Q(√d₁) ⊂ Q(√d₁)(√d₂) ⊂ ...``. This module represents such numbers explicitly - each as ``a + b√dₖ`` with ``a`` and ``b`` in the field below - which gives exact arithmetic, a canonical form, and equality and hashing without calling ``simplify``.
+
+Models created with ``backend="tower"`` use it for points, existence checks and intersections, converting to and from sympy at the Model boundary.
+"""
+
+from __future__ import annotations
+
+import math
+from fractions import Fraction
+from math import isqrt
+
+import sympy as sp
+import sympy.geometry as spg
+
+__all__ = ["QuadraticTower", "TowerNumber", "ConstructibleMixin"]
+
+_ZERO = Fraction(0)
+_HALF = Fraction(1, 2)
+
+# A raw number is a Fraction at level 0, or a tuple ``(k, a, b)`` for
+# ``a + b√dₖ`` with ``a`` and ``b`` raw numbers below level ``k`` and ``b``
+# nonzero. Every number has exactly one raw form in a given tower.
+
+
+def _level(x: Fraction | tuple) -> int:
+    return 0 if isinstance(x, Fraction) else x[0]
+
+
+def _split(x: Fraction | tuple, k: int) -> tuple:
+    if _level(x) == k:
+        return x[1], x[2]
+    return x, _ZERO
+
+
+def _make(k: int, a: Fraction | tuple, b: Fraction | tuple) -> Fraction | tuple:
+    return a if b == 0 else (k, a, b)
+
+
+def _add(x: Fraction | tuple, y: Fraction | tuple) -> Fraction | tuple:
+    if isinstance(x, Fraction) and isinstance(y, Fraction):
+        return x + y
+    k = max(_level(x), _level(y))
+    a1, b1 = _split(x, k)
+    a2, b2 = _split(y, k)
+    return _make(k, _add(a1, a2), _add(b1, b2))
+
+
+def _neg(x: Fraction | tuple) -> Fraction | tuple:
+    if isinstance(x, Fraction):
+        return -x
+    return (x[0], _neg(x[1]), _neg(x[2]))
+
+
+def _mul(x: Fraction | tuple, y: Fraction | tuple, radicands: list) -> Fraction | tuple:
+    if isinstance(x, Fraction) and isinstance(y, Fraction):
+        return x * y
+    level_x, level_y = _level(x), _level(y)
+    if level_x < level_y:
+        return _make(level_y, _mul(x, y[1], radicands), _mul(x, y[2], radicands))
+    if level_y < level_x:
+        return _make(level_x, _mul(x[1], y, radicands), _mul(x[2], y, radicands))
+    k = level_x
+    a1, b1 = x[1], x[2]
+    a2, b2 = y[1], y[2]
+    d = radicands[k - 1]
+    a = _add(_mul(a1, a2, radicands), _mul(_mul(b1, b2, radicands), d, radicands))
+    b = _add(_mul(a1, b2, radicands), _mul(b1, a2, radicands))
+    return _make(k, a, b)
+
+
+def _inv(x: Fraction | tuple, radicands: list) -> Fraction | tuple:
+    if isinstance(x, Fraction):
+        return 1 / x
+    k, a, b = x
+    d = radicands[k - 1]
+    norm = _add(_mul(a, a, radicands), _neg(_mul(_mul(b, b, radicands), d, radicands)))
+    inverse = _inv(norm, radicands)
+    return _make(k, _mul(a, inverse, radicands), _mul(_neg(b), inverse, radicands))
+
+
+def _sign(x: Fraction | tuple, radicands: list) -> int:
+    if isinstance(x, Fraction):
+        return (x > 0) - (x < 0)
+    k, a, b = x
+    sign_a = _sign(a, radicands)
+    sign_b = _sign(b, radicands)
+    if sign_a == 0 or sign_a == sign_b:
+        return sign_b if sign_a == 0 else sign_a
+    # opposite signs - compare a² with b²d
+    d = radicands[k - 1]
+    difference = _add(
+        _mul(a, a, radicands), _neg(_mul(_mul(b, b, radicands), d, radicands))
+    )
+    return sign_a * _sign(difference, radicands)
+
+
+def _sqrt_in(x: Fraction | tuple, k: int, radicands: list) -> Fraction | tuple | None:
+    """Returns a square root of ``x`` in the field at level ``k``, or None."""
+    if k == 0:
+        if x < 0:
+            return None
+        p, q = isqrt(x.numerator), isqrt(x.denominator)
+        if p * p == x.numerator and q * q == x.denominator:
+            return Fraction(p, q)
+        return None
+
+    a, b = _split(x, k)
+    d = radicands[k - 1]
+    if b == 0:
+        root = _sqrt_in(a, k - 1, radicands)
+        if root is not None:
+            return root
+        # x may be a square multiple of dₖ
+        root = _sqrt_in(_mul(a, _inv(d, radicands), radicands), k - 1, radicands)
+        return None if root is None else _make(k, _ZERO, root)
+
+    # (c + e√d)² = a + b√d gives c² = (a ± √(a² - b²d)) / 2 and e = b / 2c
+    norm = _add(_mul(a, a, radicands), _neg(_mul(_mul(b, b, radicands), d, radicands)))
+    root = _sqrt_in(norm, k - 1, radicands)
+    if root is None:
+        return None
+    for term in (root, _neg(root)):
+        c = _sqrt_in(_mul(_add(a, term), _HALF, radicands), k - 1, radicands)
+        if c is not None and c != 0:
+            e = _mul(b, _inv(_mul(Fraction(2), c, radicands), radicands), radicands)
+            return _make(k, c, e)
+    return None
+
+
+class QuadraticTower:
+    """A tower of quadratic extensions of the rationals.
+
+    The tower starts as ``Q`` and grows a level each time :meth:`sqrt` is
+    taken of a number that has no square root in the current top field.
+    Numbers from the same tower are compared and hashed by their canonical
+    form, so equal values are always equal objects.
+    """
+
+    def __init__(self) -> None:
+        self.radicands = []
+        #: The raw radicand of each level, from the bottom.
+
+        self._roots = []
+        self._sympy_roots = []
+        self._from_sympy = {}
+        self._to_sympy = {}
+
+    def __len__(self) -> int:
+        return len(self.radicands)
+
+    def __repr__(self) -> str:
+        roots = ", ".join(str(root) for root in self._sympy_root_list())
+        return f"QuadraticTower([{roots}])"
+
+    def __getstate__(self) -> dict:
+        # the conversion caches hold sympy expressions - rebuild them on demand
+        return {"radicands": self.radicands}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__()
+        for radicand in state["radicands"]:
+            self._extend(radicand)
+
+    def number(self, value: int | Fraction | sp.Expr) -> TowerNumber:
+        """Returns a value as a number of this tower.
+
+        Args:
+            value: An int, Fraction, float, or sympy expression built from
+                rationals with ``+``, ``-``, ``*``, ``/`` and square roots.
+
+        Returns:
+            The :class:`TowerNumber`.
+
+        Raises:
+            ValueError: If the value is not a constructible number.
+        """
+        if isinstance(value, TowerNumber):
+            return value
+        if isinstance(value, (int, Fraction)):
+            return TowerNumber(self, Fraction(value))
+        return TowerNumber(self, self._convert(sp.sympify(value)))
+
+    def sqrt(self, number: TowerNumber) -> TowerNumber:
+        """Returns the non-negative square root of a number.
+
+        The root is found in the tower if it is there, denesting where
+        possible; otherwise the tower is extended with a new level.
+
+        Raises:
+            ValueError: If the number is negative.
+        """
+        raw = number.raw
+        if _sign(raw, self.radicands) < 0:
+            raise ValueError(f"{number} has no real square root")
+        root = _sqrt_in(raw, len(self.radicands), self.radicands)
+        if root is None:
+            self._extend(raw)
+            root = (len(self.radicands), _ZERO, Fraction(1))
+        if _sign(root, self.radicands) < 0:
+            root = _neg(root)
+        return TowerNumber(self, root)
+
+    def _extend(self, radicand: Fraction | tuple) -> None:
+        self.radicands.append(radicand)
+        self._roots.append(math.sqrt(self._float(radicand)))
+        self._sympy_roots.append(None)
+
+    def _sympy_root_list(self) -> list[sp.Expr]:
+        return [self._sympy_root(k) for k in range(1, len(self.radicands) + 1)]
+
+    def _sympy_root(self, k: int) -> sp.Expr:
+        if self._sympy_roots[k - 1] is None:
+            self._sympy_roots[k - 1] = sp.sqrt(self._sympy(self.radicands[k - 1]))
+        return self._sympy_roots[k - 1]
+
+    def _float(self, raw: Fraction | tuple) -> float:
+        if isinstance(raw, Fraction):
+            return float(raw)
+        k, a, b = raw
+        return self._float(a) + self._float(b) * self._roots[k - 1]
+
+    def _sympy(self, raw: Fraction | tuple) -> sp.Expr:
+        expr = self._to_sympy.get(raw)
+        if expr is None:
+            if isinstance(raw, Fraction):
+                expr = sp.Rational(raw.numerator, raw.denominator)
+            else:
+                k, a, b = raw
+                expr = self._sympy(a) + self._sympy(b) * self._sympy_root(k)
+            self._to_sympy[raw] = expr
+            self._from_sympy.setdefault(expr, raw)
+        return expr
+
+    def _convert(self, expr: sp.Expr) -> Fraction | tuple:
+        raw = self._from_sympy.get(expr)
+        if raw is not None:
+            return raw
+
+        radicands = self.radicands
+        if expr.is_Rational:
+            raw = Fraction(int(expr.p), int(expr.q))
+        elif expr.is_Float:
+            raw = self._convert(sp.nsimplify(expr, rational=True))
+        elif expr.is_Add:
+            raw = _ZERO
+            for arg in expr.args:
+                raw = _add(raw, self._convert(arg))
+        elif expr.is_Mul:
+            raw = Fraction(1)
+            for arg in expr.args:
+                raw = _mul(raw, self._convert(arg), radicands)
+        elif expr.is_Pow and expr.exp.is_Rational and expr.exp.q in (1, 2):
+            base = self._convert(expr.base)
+            if expr.exp.q == 2:
+                base = self.sqrt(TowerNumber(self, base)).raw
+            raw = Fraction(1)
+            for _ in range(abs(int(expr.exp.p))):
+                raw = _mul(raw, base, radicands)
+            if expr.exp.p < 0:
+                raw = _inv(raw, radicands)
+        else:
+            raise ValueError(f"{expr} is not a constructible number")
+
+        self._from_sympy[expr] = raw
+        return raw
+
+
+class TowerNumber:
+    """An exact number in a :class:`QuadraticTower`.
+
+    Supports ``+``, ``-``, ``*``, ``/``, comparison, ``float`` and hashing.
+    Use :meth:`QuadraticTower.number` to create one.
+
+    Args:
+        tower: The tower the number belongs to.
+        raw: The canonical form of the number in the tower.
+    """
+
+    __slots__ = ("tower", "raw")
+
+    def __init__(self, tower: QuadraticTower, raw: Fraction | tuple) -> None:
+        self.tower = tower
+        self.raw = raw
+
+    def _other(self, other: object) -> Fraction | tuple:
+        if isinstance(other, TowerNumber):
+            if other.tower is not self.tower:
+                raise ValueError("numbers belong to different towers")
+            return other.raw
+        return self.tower.number(other).raw
+
+    def __add__(self, other: object) -> TowerNumber:
+        return TowerNumber(self.tower, _add(self.raw, self._other(other)))
+
+    __radd__ = __add__
+
+    def __sub__(self, other: object) -> TowerNumber:
+        return TowerNumber(self.tower, _add(self.raw, _neg(self._other(other))))
+
+    def __rsub__(self, other: object) -> TowerNumber:
+        return TowerNumber(self.tower, _add(self._other(other), _neg(self.raw)))
+
+    def __neg__(self) -> TowerNumber:
+        return TowerNumber(self.tower, _neg(self.raw))
+
+    def __mul__(self, other: object) -> TowerNumber:
+        return TowerNumber(
+            self.tower, _mul(self.raw, self._other(other), self.tower.radicands)
+        )
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: object) -> TowerNumber:
+        radicands = self.tower.radicands
+        return TowerNumber(
+            self.tower, _mul(self.raw, _inv(self._other(other), radicands), radicands)
+        )
+
+    def __rtruediv__(self, other: object) -> TowerNumber:
+        radicands = self.tower.radicands
+        return TowerNumber(
+            self.tower, _mul(self._other(other), _inv(self.raw, radicands), radicands)
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TowerNumber):
+            return other.tower is self.tower and other.raw == self.raw
+        if isinstance(other, (int, Fraction)):
+            return self.raw == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.raw)
+
+    def __lt__(self, other: object) -> bool:
+        return (self - other).sign < 0
+
+    def __le__(self, other: object) -> bool:
+        return (self - other).sign <= 0
+
+    def __gt__(self, other: object) -> bool:
+        return (self - other).sign > 0
+
+    def __ge__(self, other: object) -> bool:
+        return (self - other).sign >= 0
+
+    def __bool__(self) -> bool:
+        return self.raw != 0
+
+    def __float__(self) -> float:
+        return self.tower._float(self.raw)
+
+    def __repr__(self) -> str:
+        return f"TowerNumber({self.to_sympy()})"
+
+    @property
+    def sign(self) -> int:
+        """The exact sign of the number: -1, 0 or 1."""
+        return _sign(self.raw, self.tower.radicands)
+
+    @property
+    def level(self) -> int:
+        """The lowest level of the tower containing the number."""
+        return _level(self.raw)
+
+    def sqrt(self) -> TowerNumber:
+        """Returns the non-negative square root - see :meth:`QuadraticTower.sqrt`."""
+        return self.tower.sqrt(self)
+
+    def to_sympy(self) -> sp.Expr:
+        """Returns the number as a sympy expression."""
+        return self.tower._sympy(self.raw)
+
+
+Coords = tuple[TowerNumber, TowerNumber]
+
+
+class ConstructibleMixin:
+    """Mixin for the Model class containing the quadratic tower backend.
+
+    With ``backend="tower"``, point coordinates are converted to :class:`TowerNumber` values, so duplicate points are found with a dict lookup, lines and circles are compared by their exact coefficients, and intersections are computed in the tower instead of with sympy's solvers. Values that cannot be converted fall back to the sympy path.
+    """
+
+    @property
+    def tower(self) -> QuadraticTower | None:
+        """The quadratic tower of the model, if it uses the tower backend."""
+        return self._tower
+
+    def _tower_coords(self, x_val: sp.Expr, y_val: sp.Expr) -> Coords | None:
+        """Returns coordinates as tower numbers, or None if they are not constructible."""
+        try:
+            return self._tower.number(x_val), self._tower.number(y_val)
+        except (ValueError, TypeError, ZeroDivisionError):
+            return None
+
+    def _tower_points(self) -> dict[tuple, spg.Point]:
+        """Returns the index of the model's points by their raw tower coordinates."""
+        if self._tower_index is None:
+            self._tower_index = {}
+            for pt in self.points:
+                coords = self._tower_coords(pt.x, pt.y)
+                if coords is not None:
+                    self._tower_index[(coords[0].raw, coords[1].raw)] = pt
+        return self._tower_index
+
+    def _tower_find_point(self, coords: Coords) -> spg.Point | None:
+        pt = self._tower_points().get((coords[0].raw, coords[1].raw))
+        # the index is not updated on deletion
+        return pt if pt is not None and pt in self else None
+
+    def _tower_add_point(self, coords: Coords, pt: spg.Point) -> None:
+        self._tower_points()[(coords[0].raw, coords[1].raw)] = pt
+
+    def _tower_struct(self, struct: spg.Line | spg.Circle) -> tuple | None:
+        """Returns the exact signature of a line or circle, or None.
+
+        A line ``ax + by + c = 0`` is scaled so its first nonzero coefficient
+        of ``a, b`` is 1. A circle is its center and quadrance.
+        """
+        signature = self._tower_signatures.get(struct)
+        if signature is not None:
+            return signature
+
+        tower = self._tower
+        try:
+            if isinstance(struct, spg.Circle):
+                center = struct.center
+                signature = (
+                    "circle",
+                    tower.number(center.x),
+                    tower.number(center.y),
+                    tower.number(struct.radius**2),
+                )
+            else:
+                pt_1, pt_2 = struct.points
+                x_1, y_1 = tower.number(pt_1.x), tower.number(pt_1.y)
+                x_2, y_2 = tower.number(pt_2.x), tower.number(pt_2.y)
+                a = y_2 - y_1
+                b = x_1 - x_2
+                c = -(a * x_1 + b * y_1)
+                scale = a if a else b
+                signature = ("line", a / scale, b / scale, c / scale)
+        except (ValueError, TypeError, ZeroDivisionError):
+            return None
+
+        self._tower_signatures[struct] = signature
+        return signature
+
+    def _tower_intersection(
+        self, struct_1: spg.Line | spg.Circle, struct_2: spg.Line | spg.Circle
+    ) -> list[spg.Point] | None:
+        """Intersect two structs in the tower.
+
+        Returns:
+            The intersection points, or None if a struct is not constructible.
+        """
+        sig_1 = self._tower_struct(struct_1)
+        sig_2 = self._tower_struct(struct_2)
+        if sig_1 is None or sig_2 is None:
+            return None
+
+        if sig_1[0] == "line" and sig_2[0] == "line":
+            coords = _line_line(sig_1[1:], sig_2[1:])
+        elif sig_1[0] == "line":
+            coords = _line_circle(sig_1[1:], sig_2[1:])
+        elif sig_2[0] == "line":
+            coords = _line_circle(sig_2[1:], sig_1[1:])
+        else:
+            coords = _circle_circle(sig_1[1:], sig_2[1:])
+
+        # sympy orders its intersections the same way, which keeps point IDs
+        # in step with the sympy backend wherever the expressions agree
+        points = [spg.Point(x.to_sympy(), y.to_sympy()) for x, y in coords]
+        return list(sp.ordered(points))
+
+
+def _line_line(line_1: tuple, line_2: tuple) -> list[Coords]:
+    a_1, b_1, c_1 = line_1
+    a_2, b_2, c_2 = line_2
+    det = a_1 * b_2 - a_2 * b_1
+    if not det:
+        return []
+    return [((b_1 * c_2 - b_2 * c_1) / det, (c_1 * a_2 - c_2 * a_1) / det)]
+
+
+def _line_circle(line: tuple, circle: tuple) -> list[Coords]:
+    a, b, c = line
+    center_x, center_y, quadrance = circle
+    # the foot of the perpendicular from the center, and the line direction
+    norm = a * a + b * b
+    offset = (a * center_x + b * center_y + c) / norm
+    foot_x = center_x - a * offset
+    foot_y = center_y - b * offset
+    # squared half chord over the squared direction length
+    remainder = (quadrance - offset * offset * norm) / norm
+    if remainder.sign < 0:
+        return []
+    if not remainder:
+        return [(foot_x, foot_y)]
+    root = remainder.sqrt()
+    return [
+        (foot_x - b * root, foot_y + a * root),
+        (foot_x + b * root, foot_y - a * root),
+    ]
+
+
+def _circle_circle(circle_1: tuple, circle_2: tuple) -> list[Coords]:
+    x_1, y_1, q_1 = circle_1
+    x_2, y_2, q_2 = circle_2
+    a = 2 * (x_2 - x_1)
+    b = 2 * (y_2 - y_1)
+    if not a and not b:
+        return []
+    # the radical line of the two circles
+    c = q_2 - q_1 + x_1 * x_1 + y_1 * y_1 - x_2 * x_2 - y_2 * y_2
+    return _line_circle((a, b, c), circle_1)
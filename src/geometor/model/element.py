@@ -5,6 +5,8 @@ This module defines the foundational :class:`Element` container which wraps SymP
 
 from __future__ import annotations
 
+import copy
+from collections.abc import Iterable, Iterator, MutableMapping
 from multiprocessing import Pool, cpu_count
 
 import sympy.geometry as spg
@@ -14,7 +16,12 @@ from typing import TYPE_CHECKING
 import sympy as sp
 from sympy.geometry.entity import GeometryEntity
 
-from geometor.model.utils import clean_expr
+from geometor.model.utils import (
+    NUMERIC_DIGITS,
+    clean_expr,
+    exact_sign,
+    numeric_coords,
+)
 
 if TYPE_CHECKING:
     from geometor.model.model import Model
@@ -27,22 +34,98 @@ __all__ = [
     "Struct",
     "check_existence",
     "find_all_intersections",
+    "quadrance_intersection",
 ]
 
 
+#: Interned class tuples, shared by every element with the same classes.
+_CLASS_SETS = {}
+
+
+def _intern_classes(classes: Iterable[str]) -> tuple[str, ...]:
+    classes = tuple(dict.fromkeys(classes))
+    return _CLASS_SETS.setdefault(classes, classes)
+
+
+class _TupleView(MutableMapping):
+    """A dict-like view of the interned classes tuple of an element.
+
+    Keys map to ``""`` as in the dict the tuple replaces. Changes build a
+    new tuple and store it back on the element.
+    """
+
+    __slots__ = ("_element",)
+
+    def __init__(self, element: Element) -> None:
+        self._element = element
+
+    def _keys(self) -> tuple:
+        return self._element._classes
+
+    def _store(self, keys: Iterable) -> None:
+        self._element._classes = _intern_classes(keys)
+
+    def __getitem__(self, key: object) -> str:
+        if key in self._keys():
+            return ""
+        raise KeyError(key)
+
+    def __setitem__(self, key: object, value: str = "") -> None:
+        keys = self._keys()
+        if key not in keys:
+            self._store(keys + (key,))
+
+    def __delitem__(self, key: object) -> None:
+        keys = self._keys()
+        if key not in keys:
+            raise KeyError(key)
+        self._store(other for other in keys if other != key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys()
+
+    def __iter__(self) -> Iterator:
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
+    def __repr__(self) -> str:
+        return repr(dict.fromkeys(self._keys(), ""))
+
+    def update(self, other: Iterable = (), **kwargs: str) -> None:
+        """Add the keys of a mapping or iterable, in one new tuple."""
+        keys = self._keys()
+        self._store(keys + tuple(other) + tuple(kwargs))
+
+
 class Element:
     """A container for special attributes of an element of a model.
     
     The Element class extends the functionality of standard SymPy geometry objects by attaching model-specific metadata. It maintains a record of the element's lineage (parents), classification (classes), and identification (ID), which are essential for the constructive geometry framework.
 
+    Elements use ``__slots__`` to stay small in large models. Parents are kept in a dict, as structs gain a parent for every intersection point, and classes as a tuple interned among all elements behind a dict-like view.
+
     Args:
         sympy_obj: The sympy object representing the geometric entity.
         parents: A list of parent elements.
         classes: A list of class labels.
         ID: A string ID for the element. If empty, an ID is generated.
         guide: If True, the element is a guide and excluded from intersections.
+        numeric_digits: The decimal digits of the cached :attr:`numeric` values.
     """
 
+    __slots__ = (
+        "object",
+        "_parents",
+        "_classes",
+        "ID",
+        "guide",
+        "unsimplified",
+        "numeric",
+        "side_lengths",
+    )
+
     def __init__(
         self,
         sympy_obj: GeometryEntity,
@@ -50,22 +133,19 @@ class Element:
         classes: list[str] | None = None,
         ID: str = "",
         guide: bool = False,
+        numeric_digits: int = NUMERIC_DIGITS,
     ) -> None:
         """Initializes an Element of the model.
 
-        This method normalizes input arguments, ensuring classes and parents are stored as dictionary keys for efficient lookup and uniqueness. It prepares the element for integration into the model's dependency graph.
+        This method normalizes input arguments, ensuring classes and parents are stored once each and in order. It prepares the element for integration into the model's dependency graph.
         """
         self.object = sympy_obj
-        if classes is None:
-            classes = []
-        if parents is None:
-            parents = []
 
-        self.parents = {key: "" for key in parents}
+        self.parents = parents or ()
         #: Dict with keys as parent sympy objects.
 
-        self.classes = {key: "" for key in classes}
-        #: Dict with strings for class name.
+        self.classes = classes or ()
+        #: Dict-like view with strings for class name.
 
         self.ID = ID
         #: Name used in presentation and reports.
@@ -73,14 +153,49 @@ class Element:
         self.guide = guide
         #: Whether the element is a guide.
 
+        self.unsimplified = False
+        #: Whether simplification ran out of budget - see :meth:`Model.resimplify`.
+
+        self.numeric = numeric_coords(sympy_obj, numeric_digits)
+        #: Cached high-precision ``(x, y)`` of a point or ``(x, y, radius)`` of a circle.
+
+    @property
+    def parents(self) -> dict:
+        """The parents of the element, as a dict with ``""`` values."""
+        return self._parents
+
+    @parents.setter
+    def parents(self, parents: Iterable) -> None:
+        self._parents = dict.fromkeys(parents, "")
+
+    @property
+    def classes(self) -> _TupleView:
+        """The class names of the element, as a dict-like view with ``""`` values."""
+        return _TupleView(self)
+
+    @classes.setter
+    def classes(self, classes: Iterable[str]) -> None:
+        self._classes = _intern_classes(classes)
+
+    def copy(self) -> Element:
+        """Returns a copy of the element.
+
+        Classes are an immutable tuple, so the copy shares them; parents are
+        copied.
+        """
+        element = copy.copy(self)
+        element._parents = dict(self._parents)
+        return element
+
     @property
     def length(self) -> sp.Expr | None:
         """Returns the cleaned length of the element.
         
         This property computes or retrieves the geometric length of the element, applying symbolic cleanup to ensure the expression is simplified. For polygons, it returns a list of side lengths.
         """
-        if hasattr(self, "side_lengths"):
-            return self.side_lengths
+        side_lengths = getattr(self, "side_lengths", None)
+        if side_lengths is not None:
+            return side_lengths
         if hasattr(self.object, "length"):
             return clean_expr(self.object.length)
         return None
@@ -98,8 +213,13 @@ class CircleElement(Element):
         classes: A list of class labels.
         ID: A string ID for the element.
         guide: If True, the element is a guide.
+        quadrance: The squared radius. Defaults to the quadrance from the
+            center to ``pt_radius``.
+        numeric_digits: The decimal digits of the cached :attr:`numeric` values.
     """
 
+    __slots__ = ("pt_radius", "quadrance")
+
     def __init__(
         self,
         sympy_obj: spg.Circle,
@@ -108,14 +228,25 @@ class CircleElement(Element):
         classes: list[str] | None = None,
         ID: str = "",
         guide: bool = False,
+        quadrance: sp.Expr | None = None,
+        numeric_digits: int = NUMERIC_DIGITS,
     ) -> None:
-        super().__init__(sympy_obj, parents, classes, ID, guide)
+        super().__init__(sympy_obj, parents, classes, ID, guide, numeric_digits)
         self.pt_radius = pt_radius
         #: The point defining the radius.
 
+        if quadrance is None:
+            center = getattr(sympy_obj, "center", None) or sympy_obj.pt_center
+            quadrance = (pt_radius.x - center.x) ** 2 + (pt_radius.y - center.y) ** 2
+        self.quadrance = quadrance
+        #: The squared radius, free of the square root in ``radius``.
+
 
 def check_existence(
-    self: Model, struct: Struct, existing_structs: list[Struct]
+    self: Model,
+    struct: Struct,
+    existing_structs: list[Struct],
+    quadrance: sp.Expr | None = None,
 ) -> tuple[bool, Struct | None]:
     """Check if a geometric structure exists in the model.
     
@@ -124,6 +255,7 @@ def check_existence(
     Args:
         struct: The structure to check.
         existing_structs: List of existing structures in the model.
+        quadrance: The quadrance of a circle, if already known.
 
     Returns:
         tuple[bool, Struct]: A tuple containing a boolean indicating existence and the existing structure if found (otherwise None).
@@ -132,6 +264,27 @@ def check_existence(
     if struct in existing_structs:
         return True, struct
 
+    if self._tower is not None:
+        # Check by exact coefficients
+        signature = self._tower_struct(struct)
+        if signature is not None:
+            for prev in existing_structs:
+                if self._tower_struct(prev) == signature:
+                    return True, prev
+            return False, None
+
+    if isinstance(struct, spg.Circle):
+        # Check by center and quadrance - centers are points of the model
+        if quadrance is None:
+            quadrance = _quadrance(self, struct)
+        for prev in existing_structs:
+            if prev.center != struct.center:
+                continue
+            prev_quadrance = _quadrance(self, prev)
+            if prev_quadrance == quadrance or exact_sign(prev_quadrance - quadrance) == 0:
+                return True, prev
+        return False, None
+
     # Check by value
     for prev in existing_structs:
         diff = (prev.equation().simplify() - struct.equation().simplify()).simplify()
@@ -154,28 +307,137 @@ def find_all_intersections(self: Model, struct: Struct) -> None:
     test_structs = [
         (el, struct)
         for el in self.structs
-        if not el.equals(struct) and not self[el].guide
+        if not self[el].guide
+        and (el != struct if self._tower is not None else not el.equals(struct))
+    ]
+
+    results = []
+    if self._tower is not None:
+        # exact and fast enough to run in process
+        remaining = []
+        for prev, struct in test_structs:
+            points = self._tower_intersection(prev, struct)
+            if points is None:
+                remaining.append((prev, struct))
+            else:
+                results.append((prev, struct, points))
+        test_structs = remaining
+
+    # circles go to the workers with their stored quadrances
+    test_structs = [
+        (prev, struct, _quadrance(self, prev), _quadrance(self, struct))
+        for prev, struct in test_structs
     ]
 
     # check intersections
-    with Pool(cpu_count()) as pool:
-        results = pool.map(find_intersection, test_structs)
+    if test_structs:
+        with Pool(cpu_count()) as pool:
+            results.extend(pool.map(find_intersection, test_structs))
 
     for prev, struct, result in results:
         for pt in result:
             pt_new = self.set_point(pt.x, pt.y, parents=[prev, struct])
-            self[prev].parents[pt_new] = ""
-            self[struct].parents[pt_new] = ""
+            self._writable(prev).parents[pt_new] = ""
+            self._writable(struct).parents[pt_new] = ""
 
 
-def find_intersection(test_tuple: tuple[Struct, Struct]) -> tuple[Struct, Struct, list[spg.Point]]:
-    """Find intersection for two structs."""
-    prev, struct = test_tuple
-    result = struct.intersection(prev)
+def find_intersection(
+    test_tuple: tuple[Struct, Struct, sp.Expr | None, sp.Expr | None],
+) -> tuple[Struct, Struct, list[spg.Point]]:
+    """Find intersection for two structs, given the quadrances of circles."""
+    prev, struct, prev_quadrance, quadrance = test_tuple
+    if isinstance(prev, spg.Circle) or isinstance(struct, spg.Circle):
+        result = quadrance_intersection(prev, struct, prev_quadrance, quadrance)
+    else:
+        result = struct.intersection(prev)
 
     return prev, struct, result
 
 
+def quadrance_intersection(
+    struct_1: Struct,
+    struct_2: Struct,
+    quadrance_1: sp.Expr | None = None,
+    quadrance_2: sp.Expr | None = None,
+) -> list[spg.Point]:
+    """Intersect a circle with a line or circle, using quadrances.
+
+    Each circle is taken as its center and quadrance, so no square root is
+    needed except the one of the discriminant. Two circles meet on their
+    radical line, which reduces their intersection to a line and a circle.
+
+    Args:
+        struct_1: A line or circle.
+        struct_2: A line or circle. At least one of the structs is a circle.
+        quadrance_1: The stored quadrance of ``struct_1``, if it is a circle.
+            Taken from its radius if not given.
+        quadrance_2: The stored quadrance of ``struct_2``, if it is a circle.
+
+    Returns:
+        The intersection points, in sympy's canonical order.
+    """
+    if isinstance(struct_1, spg.Line):
+        points = _line_circle(
+            struct_1.coefficients, _circle_form(struct_2, quadrance_2)
+        )
+    elif isinstance(struct_2, spg.Line):
+        points = _line_circle(
+            struct_2.coefficients, _circle_form(struct_1, quadrance_1)
+        )
+    else:
+        x_1, y_1, q_1 = _circle_form(struct_1, quadrance_1)
+        x_2, y_2, q_2 = _circle_form(struct_2, quadrance_2)
+        a = 2 * (x_2 - x_1)
+        b = 2 * (y_2 - y_1)
+        if a == 0 and b == 0:
+            return []
+        c = q_2 - q_1 + x_1**2 + y_1**2 - x_2**2 - y_2**2
+        points = _line_circle((a, b, c), (x_1, y_1, q_1))
+    return list(sp.ordered(points))
+
+
+def _quadrance(self: Model, struct: Struct) -> sp.Expr | None:
+    """Returns the stored quadrance of a circle, or None for a line."""
+    if not isinstance(struct, spg.Circle):
+        return None
+    quadrance = getattr(self[struct], "quadrance", None) if struct in self else None
+    return struct.radius**2 if quadrance is None else quadrance
+
+
+def _circle_form(
+    circle: spg.Circle, quadrance: sp.Expr | None = None
+) -> tuple[sp.Expr, sp.Expr, sp.Expr]:
+    center = circle.center
+    if quadrance is None:
+        quadrance = circle.radius**2
+    return center.x, center.y, quadrance
+
+
+def _line_circle(
+    line: tuple[sp.Expr, sp.Expr, sp.Expr],
+    circle: tuple[sp.Expr, sp.Expr, sp.Expr],
+) -> list[spg.Point]:
+    a, b, c = line
+    x, y, quadrance = circle
+    # the foot of the perpendicular from the center
+    norm = a**2 + b**2
+    offset = (a * x + b * y + c) / norm
+    foot_x = x - a * offset
+    foot_y = y - b * offset
+    # the squared half chord, over the norm of the direction
+    remainder = (quadrance - offset**2 * norm) / norm
+    sign = exact_sign(remainder)
+    if sign < 0:
+        return []
+    if sign == 0:
+        return [spg.Point(foot_x, foot_y)]
+    root = sp.sqrt(remainder)
+    return [
+        spg.Point(foot_x - b * root, foot_y + a * root),
+        spg.Point(foot_x + b * root, foot_y - a * root),
+    ]
+
+
 def _get_element_by_ID(self: Model, ID: str) -> GeometryEntity | None:
     """Finds and returns the element with the given ID.
     
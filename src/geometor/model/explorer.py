@@ -0,0 +1,258 @@
+"""Provides a construction-space explorer for geometric models.
+
+This module defines the :class:`Explorer`, which performs a breadth-first search over "all lines and circles constructible from the current points". Candidate steps are evaluated on :class:`geometor.model.numeric.NumericModel` copies in worker processes, equivalent figures are deduplicated, and results are streamed back as they are found so a user scoring callback can prune the search.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Callable, Iterator
+from multiprocessing import Pool, cpu_count
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from geometor.model.fingerprint import ConfigurationTable, fingerprint, invariants
+from geometor.model.numeric import NumericModel
+
+if TYPE_CHECKING:
+    from geometor.model.model import Model
+
+__all__ = ["Explorer", "ExplorerResult", "Step"]
+
+#: A candidate step - ``("line", pt_1, pt_2)`` or ``("circle", pt_center, pt_radius)`` with point element indexes.
+Step = tuple[str, int, int]
+
+Score = Callable[[NumericModel, tuple[Step, ...]], float | None]
+
+
+class ExplorerResult:
+    """A construction found by the :class:`Explorer`.
+
+    Args:
+        path: The steps applied to the starting model.
+        model: The numeric model after the steps.
+        score: The score given by the scoring callback.
+        signature: The deduplication key of the resulting figure - its
+            :func:`signature`, or its :func:`geometor.model.fingerprint.fingerprint`
+            when similar figures are merged.
+        invariants: The :func:`geometor.model.fingerprint.invariants` of the
+            figure, when similar figures are merged.
+    """
+
+    def __init__(
+        self,
+        path: tuple[Step, ...],
+        model: NumericModel,
+        score: float,
+        signature: str,
+        invariants: dict[str, np.ndarray] | None = None,
+    ) -> None:
+        self.path = path
+        self.model = model
+        self.score = score
+        self.signature = signature
+        self.invariants = invariants
+
+    def __repr__(self) -> str:
+        return f"ExplorerResult({self.describe()}, score={self.score})"
+
+    @property
+    def depth(self) -> int:
+        return len(self.path)
+
+    def describe(self) -> str:
+        """Returns the path in the CLI command language, e.g. ``[ A B ] ( B A )``."""
+        commands = []
+        for kind, pt_1, pt_2 in self.path:
+            IDs = f"{self.model[pt_1].ID} {self.model[pt_2].ID}"
+            commands.append(f"[ {IDs} ]" if kind == "line" else f"( {IDs} )")
+        return " ".join(commands)
+
+
+class Explorer:
+    """Breadth-first search over ruler-and-compass construction steps.
+
+    At each depth every line through two points and every circle about one point through another is a candidate step. Candidates are applied to copies of the model in a process pool and each distinct resulting figure is scored. Results with a score of None, or below ``min_score``, are pruned; the best ``beam`` results of each depth are expanded at the next depth.
+
+    The scoring callback runs in the worker processes, so it must be picklable - a module-level function.
+
+    Args:
+        model: The starting model. Symbolic models are converted with :meth:`NumericModel.from_model`.
+        score: A callback ``score(model, path)`` returning a number or None. Defaults to the number of points.
+        depth: The number of steps to search.
+        min_score: Results scoring below this value are pruned.
+        beam: The number of results expanded at each depth. None expands all.
+        workers: The number of worker processes. ``0`` evaluates in this process.
+        lines: Whether to consider line steps.
+        circles: Whether to consider circle steps.
+        similar: If True, figures that are the same up to translation, rotation, reflection and scale are merged, using a :class:`geometor.model.fingerprint.ConfigurationTable`.
+    """
+
+    def __init__(
+        self,
+        model: Model | NumericModel,
+        score: Score | None = None,
+        depth: int = 1,
+        min_score: float | None = None,
+        beam: int | None = None,
+        workers: int | None = None,
+        lines: bool = True,
+        circles: bool = True,
+        similar: bool = False,
+    ) -> None:
+        if not isinstance(model, NumericModel):
+            model = NumericModel.from_model(model)
+        self.model = model
+        self.score = score
+        self.depth = depth
+        self.min_score = min_score
+        self.beam = beam
+        self.workers = cpu_count() if workers is None else workers
+        self.lines = lines
+        self.circles = circles
+        self.similar = similar
+
+    def candidates(self, model: NumericModel) -> list[Step]:
+        """Returns every line and circle step on the points of a model.
+
+        Args:
+            model: The model to extend.
+
+        Returns:
+            A list of steps.
+        """
+        points = [pt.index for pt in model.points]
+        steps = []
+        for i, pt_1 in enumerate(points):
+            for pt_2 in points[i + 1 :]:
+                if self.lines:
+                    steps.append(("line", pt_1, pt_2))
+                if self.circles:
+                    steps.append(("circle", pt_1, pt_2))
+                    steps.append(("circle", pt_2, pt_1))
+        return steps
+
+    def explore(self) -> Iterator[ExplorerResult]:
+        """Run the search, yielding each distinct, unpruned result as it is found.
+
+        Yields:
+            :class:`ExplorerResult` objects, in completion order within each depth.
+        """
+        seen = {signature(self.model)}
+        similar = ConfigurationTable(exact=False)
+        if self.similar:
+            similar.add(self.model)
+        frontier = [()]
+        models = {(): self.model}
+
+        pool = None
+        if self.workers:
+            pool = Pool(
+                self.workers, _init_worker, (self.model, self.score, self.similar)
+            )
+        else:
+            _init_worker(self.model, self.score, self.similar)
+
+        try:
+            for _ in range(self.depth):
+                tasks = [
+                    path + (step,)
+                    for path in frontier
+                    for step in self.candidates(models[path])
+                ]
+                if pool:
+                    chunksize = max(1, len(tasks) // (self.workers * 4))
+                    results = pool.imap_unordered(_evaluate, tasks, chunksize)
+                else:
+                    results = map(_evaluate, tasks)
+
+                level = []
+                for result in results:
+                    if result is None:
+                        continue
+                    if self.similar:
+                        # the worker computed the invariants
+                        if not similar.add(result.model, values=result.invariants):
+                            continue
+                    elif result.signature in seen:
+                        continue
+                    else:
+                        seen.add(result.signature)
+                    if result.score is None or (
+                        self.min_score is not None and result.score < self.min_score
+                    ):
+                        continue
+                    level.append(result)
+                    yield result
+
+                level.sort(key=lambda result: result.score, reverse=True)
+                if self.beam is not None:
+                    level = level[: self.beam]
+                frontier = [result.path for result in level]
+                models = {result.path: result.model for result in level}
+                if not frontier:
+                    break
+        finally:
+            if pool:
+                pool.terminate()
+
+
+def signature(model: NumericModel, decimals: int = 9) -> str:
+    """Returns a key for the figure of a model, independent of construction order.
+
+    The point, line and circle rows are rounded, sorted and hashed, so two
+    paths that produce the same figure share a signature.
+
+    Args:
+        model: The numeric model.
+        decimals: The number of decimals kept when rounding.
+
+    Returns:
+        A hex digest.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for rows in (model._points.view, model._lines.view[:, :3], model._circles.view[:, :3]):
+        rounded = np.round(rows, decimals) + 0.0  # drop negative zeros
+        rounded = rounded[np.lexsort(rounded.T[::-1])] if len(rounded) else rounded
+        digest.update(rounded.tobytes())
+        digest.update(b"|")
+    return digest.hexdigest()
+
+
+_BASE = None
+_SCORE = None
+_SIMILAR = False
+
+
+def _init_worker(model: NumericModel, score: Score | None, similar: bool) -> None:
+    global _BASE, _SCORE, _SIMILAR
+    _BASE = model
+    _SCORE = score
+    _SIMILAR = similar
+
+
+def _evaluate(path: tuple[Step, ...]) -> ExplorerResult | None:
+    """Apply a path to a copy of the base model and score the result.
+
+    Returns None if the last step adds nothing to the model.
+    """
+    model = _BASE.copy()
+    for kind, pt_1, pt_2 in path:
+        count = len(model)
+        try:
+            if kind == "line":
+                model.construct_line(pt_1, pt_2)
+            else:
+                model.construct_circle(pt_1, pt_2)
+        except ValueError:
+            return None
+        if len(model) == count:
+            return None
+
+    score = _SCORE(model, path) if _SCORE else len(model.points)
+    if _SIMILAR:
+        values = invariants(model)
+        key = fingerprint(model, values=values)
+        return ExplorerResult(path, model, score, key, values)
+    return ExplorerResult(path, model, score, signature(model))
@@ -0,0 +1,331 @@
+"""Provides machine-readable exports of the Model class.
+
+This module writes the data shown by the console reports - ID, type, classes, parents, coordinates or equation and lengths - as one record per element, in CSV or JSON lines, and the construction graph as Graphviz DOT or GraphML. Records and graph lines are produced and written one at a time, so large models are exported without building a table or document in memory.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import csv
+import json
+import math
+from collections.abc import Iterator
+from typing import IO, TYPE_CHECKING
+from xml.sax.saxutils import quoteattr
+
+import sympy.geometry as spg
+from sympy.geometry.entity import GeometryEntity
+
+from .element import CircleElement
+from .memory import element_type
+from .sections import Section
+
+if TYPE_CHECKING:
+    from geometor.model.model import Model
+
+__all__ = ["ExportMixin", "EXPORT_FIELDS", "DOT_SHAPES"]
+
+#: The record fields of each group, in CSV column order.
+EXPORT_FIELDS = {
+    "base": ["ID", "type", "classes", "parents", "guide"],
+    "exact": ["x", "y", "equation", "length"],
+    "floats": ["x_float", "y_float", "radius_float", "length_float"],
+}
+
+#: Graphviz node shapes by element type. Other types are drawn as boxes.
+DOT_SHAPES = {"point": "point", "line": "rectangle", "circle": "ellipse"}
+
+
+@contextlib.contextmanager
+def _open(target: str | IO[str]) -> Iterator[IO[str]]:
+    """Opens a path for writing, or passes an open stream through."""
+    if isinstance(target, str):
+        with open(target, "w", newline="") as file:
+            yield file
+    else:
+        yield target
+
+
+class ExportMixin:
+    """Mixin for the Model class containing record and graph exports."""
+
+    def export_records(
+        self,
+        floats: bool = False,
+        exact: bool = True,
+        types: list[str] | None = None,
+        classes: list[str] | None = None,
+    ) -> Iterator[dict]:
+        """Yields one record per element, in model order.
+
+        Every record has the ID, type, class names, parent IDs and guide flag
+        of its element. Coordinates, equations and lengths are added as exact
+        strings and/or as floats from the cached numeric values - fields that
+        do not apply to an element are left out.
+
+        Args:
+            floats: Whether to add the ``*_float`` fields.
+            exact: Whether to add the exact ``x``, ``y``, ``equation`` and
+                ``length`` strings. Lengths are simplified, which makes the
+                exact fields the slow part of an export.
+            types: Only include these element types, such as ``"point"``.
+            classes: Only include elements with at least one of these classes.
+
+        Yields:
+            dicts keyed by the names in :data:`EXPORT_FIELDS`.
+        """
+        for el, details in self._report_elements(types, classes):
+            record = {
+                "ID": details.ID,
+                "type": element_type(el, details),
+                "classes": list(details.classes),
+                "parents": [self[parent].ID for parent in details.parents],
+                "guide": details.guide,
+            }
+
+            if exact:
+                if isinstance(el, spg.Point):
+                    record["x"] = str(el.x)
+                    record["y"] = str(el.y)
+                elif isinstance(el, (spg.Line, spg.Circle)):
+                    record["equation"] = str(el.equation())
+                elif isinstance(el, spg.Segment):
+                    record["length"] = str(details.length)
+
+            if floats:
+                if isinstance(el, spg.Point):
+                    x, y = details.numeric
+                    record["x_float"] = float(x)
+                    record["y_float"] = float(y)
+                elif isinstance(details, CircleElement) and details.numeric:
+                    x, y, radius = details.numeric
+                    record["x_float"] = float(x)
+                    record["y_float"] = float(y)
+                    record["radius_float"] = float(radius)
+                elif isinstance(el, spg.Segment):
+                    (x1, y1), (x2, y2) = (self[pt].numeric for pt in el.points)
+                    record["length_float"] = math.hypot(x2 - x1, y2 - y1)
+
+            yield record
+
+    def export_csv(
+        self,
+        target: str | IO[str],
+        floats: bool = False,
+        exact: bool = True,
+        types: list[str] | None = None,
+        classes: list[str] | None = None,
+    ) -> int:
+        """Writes the model as CSV, one row per element.
+
+        Classes and parents are written space separated. The columns are the
+        :data:`EXPORT_FIELDS` of the groups selected.
+
+        Args:
+            target: A file path, or a stream open for writing.
+            floats: Whether to write the float columns.
+            exact: Whether to write the exact columns.
+            types: Only include these element types, such as ``"point"``.
+            classes: Only include elements with at least one of these classes.
+
+        Returns:
+            The number of rows written.
+        """
+        fields = list(EXPORT_FIELDS["base"])
+        if exact:
+            fields += EXPORT_FIELDS["exact"]
+        if floats:
+            fields += EXPORT_FIELDS["floats"]
+
+        count = 0
+        with _open(target) as file:
+            writer = csv.DictWriter(file, fields)
+            writer.writeheader()
+            for record in self.export_records(floats, exact, types, classes):
+                record["classes"] = " ".join(record["classes"])
+                record["parents"] = " ".join(record["parents"])
+                writer.writerow(record)
+                count += 1
+        return count
+
+    def export_jsonl(
+        self,
+        target: str | IO[str],
+        floats: bool = False,
+        exact: bool = True,
+        types: list[str] | None = None,
+        classes: list[str] | None = None,
+    ) -> int:
+        """Writes the model as JSON lines, one object per element.
+
+        Args:
+            target: A file path, or a stream open for writing.
+            floats: Whether to write the float fields.
+            exact: Whether to write the exact fields.
+            types: Only include these element types, such as ``"point"``.
+            classes: Only include elements with at least one of these classes.
+
+        Returns:
+            The number of records written.
+        """
+        count = 0
+        with _open(target) as file:
+            for record in self.export_records(floats, exact, types, classes):
+                file.write(json.dumps(record) + "\n")
+                count += 1
+        return count
+
+    def _graph_parents(
+        self, el: GeometryEntity, all_parents: bool
+    ) -> list[GeometryEntity]:
+        """The parents an element is drawn from in the construction graph.
+
+        As in :meth:`get_ancestors`, given elements have none and only the
+        first two parents - the ones that made it - are followed, unless
+        ``all_parents`` is set. Sections and polygons come from their points.
+        """
+        details = self[el]
+        if isinstance(el, Section):
+            parents = el.points
+        elif isinstance(el, spg.Polygon):
+            parents = el.vertices
+        elif "given" in details.classes and not all_parents:
+            parents = []
+        else:
+            parents = list(details.parents)
+            if not all_parents:
+                parents = parents[:2]
+        return [parent for parent in parents if parent in self]
+
+    def graph(
+        self,
+        elements: list[GeometryEntity] | None = None,
+        all_parents: bool = False,
+    ) -> tuple[list[GeometryEntity], list[tuple[GeometryEntity, GeometryEntity]]]:
+        """Returns the nodes and edges of the construction graph.
+
+        The flat parent graph is walked once, and each edge appears once
+        however many elements share it.
+
+        Args:
+            elements: Restrict the graph to the ancestor closure of these
+                elements. Defaults to the whole model.
+            all_parents: Whether to follow every parent, rather than only the
+                ones that constructed each element.
+
+        Returns:
+            The nodes in model order, and the ``(element, parent)`` edges.
+        """
+        if elements is None:
+            selected = set(self)
+        else:
+            selected = set()
+            stack = list(elements)
+            while stack:
+                el = stack.pop()
+                if el in selected:
+                    continue
+                selected.add(el)
+                stack.extend(self._graph_parents(el, all_parents))
+
+        nodes = [el for el in self if el in selected]
+        edges = []
+        seen = set()
+        for el in nodes:
+            for parent in self._graph_parents(el, all_parents):
+                if (el, parent) not in seen and parent in selected:
+                    seen.add((el, parent))
+                    edges.append((el, parent))
+        return nodes, edges
+
+    def export_dot(
+        self,
+        target: str | IO[str],
+        elements: list[GeometryEntity] | None = None,
+        all_parents: bool = False,
+    ) -> None:
+        """Writes the construction graph in Graphviz DOT format.
+
+        Nodes are drawn with the :data:`DOT_SHAPES` of their type, and edges
+        run from each element to its parents, as in
+        :func:`geometor.model.reports.generate_dot`.
+
+        Args:
+            target: A file path, or a stream open for writing.
+            elements: Restrict the graph to the ancestor closure of these
+                elements. Defaults to the whole model.
+            all_parents: Whether to follow every parent, rather than only the
+                ones that constructed each element.
+        """
+        nodes, edges = self.graph(elements, all_parents)
+        with _open(target) as file:
+            file.write("digraph {\n")
+            for el in nodes:
+                details = self[el]
+                shape = DOT_SHAPES.get(element_type(el, details), "box")
+                label = str(details.ID)
+                if shape in ("rectangle", "ellipse"):
+                    label = label[1:-1].strip()
+                node = _dot_ID(details.ID)
+                file.write(f"    {node} [shape={shape}, label={_dot_ID(label)}];\n")
+            for el, parent in edges:
+                node, parent_node = _dot_ID(self[el].ID), _dot_ID(self[parent].ID)
+                file.write(f"    {node} -> {parent_node};\n")
+            file.write("}\n")
+
+    def export_graphml(
+        self,
+        target: str | IO[str],
+        elements: list[GeometryEntity] | None = None,
+        all_parents: bool = False,
+    ) -> None:
+        """Writes the construction graph as GraphML.
+
+        Each node carries the ID, type and space-separated classes of its
+        element; edges run from each element to its parents.
+
+        Args:
+            target: A file path, or a stream open for writing.
+            elements: Restrict the graph to the ancestor closure of these
+                elements. Defaults to the whole model.
+            all_parents: Whether to follow every parent, rather than only the
+                ones that constructed each element.
+        """
+        nodes, edges = self.graph(elements, all_parents)
+        with _open(target) as file:
+            file.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            file.write('<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n')
+            for key in ("label", "type", "classes"):
+                file.write(
+                    f'  <key id="{key}" for="node" attr.name="{key}"'
+                    ' attr.type="string"/>\n'
+                )
+            file.write(
+                f'  <graph id={quoteattr(str(self.name))} edgedefault="directed">\n'
+            )
+            for el in nodes:
+                details = self[el]
+                data = {
+                    "label": details.ID,
+                    "type": element_type(el, details),
+                    "classes": " ".join(details.classes),
+                }
+                file.write(f"    <node id={quoteattr(str(details.ID))}>")
+                for key, value in data.items():
+                    file.write(f'<data key="{key}">{_xml_text(value)}</data>')
+                file.write("</node>\n")
+            for el, parent in edges:
+                file.write(
+                    f"    <edge source={quoteattr(str(self[el].ID))}"
+                    f" target={quoteattr(str(self[parent].ID))}/>\n"
+                )
+            file.write("  </graph>\n</graphml>\n")
+
+
+def _dot_ID(ID: object) -> str:
+    """Returns an ID as a quoted DOT string."""
+    return '"' + str(ID).replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _xml_text(text: object) -> str:
+    return quoteattr(str(text))[1:-1]
@@ -0,0 +1,292 @@
+"""Provides canonical fingerprints for geometric configurations.
+
+This module computes a fingerprint of a model's points and structs that is invariant under similarity transforms - translation, rotation, reflection and scale. Invariants are taken about the centroid of the points and normalized by their mean quadrance, so the cost is dominated by a sort and scales near-linearly with model size. A :class:`ConfigurationTable` skips configurations that were already seen: it buckets the invariants with a tolerance, checking neighbouring buckets so that equal figures are never split by a bucket boundary, and confirms symbolic matches exactly.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+from typing import TYPE_CHECKING
+
+import numpy as np
+import sympy as sp
+import sympy.geometry as spg
+
+from geometor.model.numeric import NumericModel
+from geometor.model.utils import clean_expr, spread
+
+if TYPE_CHECKING:
+    from geometor.model.model import Model
+
+__all__ = ["fingerprint", "invariants", "exact_invariants", "ConfigurationTable"]
+
+
+def invariants(model: Model | NumericModel) -> dict[str, np.ndarray]:
+    """Returns the similarity invariants of a model as sorted float64 arrays.
+
+    With ``c`` the centroid of the points and ``m`` the mean quadrance of the
+    points from ``c``, the invariants are:
+
+    - ``points``: the quadrance of each point from ``c``, over ``m``
+    - ``lines``: the quadrance of each line from ``c``, over ``m``
+    - ``circles``: each circle's radius² and center quadrance from ``c``, over ``m``
+    - ``spreads``: the spreads between neighbouring line directions
+
+    Guide structs are ignored.
+
+    Args:
+        model: A symbolic or numeric model.
+
+    Returns:
+        A dict of invariant arrays.
+    """
+    points, lines, circles = _numeric_rows(model)
+
+    center = points.mean(axis=0) if len(points) else np.zeros(2)
+    offsets = points - center
+    quadrances = np.einsum("ij,ij->i", offsets, offsets)
+    scale = quadrances.mean() if len(points) and quadrances.mean() > 0 else 1.0
+
+    normals = np.hypot(lines[:, 0], lines[:, 1])
+    line_q = (lines[:, :2] @ center + lines[:, 2]) ** 2 / normals**2 / scale
+
+    circle_offsets = circles[:, :2] - center
+    circle_q = np.einsum("ij,ij->i", circle_offsets, circle_offsets) / scale
+    circle_pairs = np.column_stack([circles[:, 2] ** 2 / scale, circle_q])
+    if len(circle_pairs):
+        circle_pairs = circle_pairs[np.lexsort(circle_pairs.T[::-1])]
+
+    # neighbouring gaps between line directions are rotation and reflection invariant
+    angles = np.sort(np.mod(np.arctan2(lines[:, 1], lines[:, 0]), math.pi))
+    gaps = np.diff(np.append(angles, angles[:1] + math.pi)) if len(angles) else angles
+    spreads = np.sort(np.sin(gaps) ** 2)
+
+    return {
+        "points": np.sort(quadrances / scale),
+        "lines": np.sort(line_q),
+        "circles": circle_pairs,
+        "spreads": spreads,
+    }
+
+
+def fingerprint(
+    model: Model | NumericModel,
+    decimals: int = 9,
+    values: dict[str, np.ndarray] | None = None,
+) -> str:
+    """Returns a fingerprint of a model that is invariant under similarity.
+
+    The :func:`invariants` are rounded and hashed, so figures that are the
+    same up to translation, rotation, reflection and scale share a
+    fingerprint. Invariants of equal figures that fall on either side of a
+    rounding boundary still give different fingerprints - use a
+    :class:`ConfigurationTable` to deduplicate figures reliably.
+
+    Args:
+        model: A symbolic or numeric model.
+        decimals: The number of decimals kept when rounding.
+        values: The model's :func:`invariants`, if already computed.
+
+    Returns:
+        A hex digest.
+    """
+    if values is None:
+        values = invariants(model)
+    digest = hashlib.blake2b(digest_size=16)
+    for name, array in values.items():
+        digest.update(name.encode())
+        digest.update(str(len(array)).encode())
+        digest.update((np.round(array, decimals) + 0.0).tobytes())
+    return digest.hexdigest()
+
+
+def exact_invariants(model: Model) -> dict[str, list[sp.Expr]]:
+    """Returns the similarity invariants of a symbolic model as exact expressions.
+
+    The values match :func:`invariants` and are ordered by their numerical
+    value so two models can be compared element by element.
+
+    Args:
+        model: A symbolic model.
+
+    Returns:
+        A dict of lists of expressions.
+    """
+    points = model.points
+    count = len(points)
+    cx = sp.Add(*[pt.x for pt in points]) / count if count else sp.Integer(0)
+    cy = sp.Add(*[pt.y for pt in points]) / count if count else sp.Integer(0)
+    quadrances = [(pt.x - cx) ** 2 + (pt.y - cy) ** 2 for pt in points]
+    scale = clean_expr(sp.Add(*quadrances) / count) if count else sp.Integer(1)
+    if scale == 0:
+        scale = sp.Integer(1)
+
+    lines = [el for el in model.structs if isinstance(el, spg.Line)]
+    circles = [el for el in model.structs if isinstance(el, spg.Circle)]
+
+    line_q = []
+    for line in lines:
+        a, b, c = line.coefficients
+        line_q.append((a * cx + b * cy + c) ** 2 / ((a**2 + b**2) * scale))
+
+    circle_q = []
+    for circle in circles:
+        center = circle.center
+        circle_q.append(circle.radius**2 / scale)
+        circle_q.append(((center.x - cx) ** 2 + (center.y - cy) ** 2) / scale)
+
+    by_angle = sorted(
+        lines,
+        key=lambda line: math.atan2(*[float(coef) for coef in line.coefficients[1::-1]])
+        % math.pi,
+    )
+    spreads = [
+        spread(by_angle[i], by_angle[(i + 1) % len(by_angle)])
+        for i in range(len(by_angle) if len(by_angle) > 1 else 0)
+    ]
+
+    ordered = {}
+    for name, values in (
+        ("points", [q / scale for q in quadrances]),
+        ("lines", line_q),
+        ("circles", circle_q),
+        ("spreads", spreads),
+    ):
+        ordered[name] = sorted(values, key=lambda value: float(value.evalf()))
+    return ordered
+
+
+def _numeric_rows(model: Model | NumericModel) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Returns the float64 point, line and circle rows of a model, without guides."""
+    if isinstance(model, NumericModel):
+        lines = model._lines.view
+        circles = model._circles.view
+        return (
+            model._points.view,
+            lines[lines[:, 3] == 0, :3],
+            circles[circles[:, 3] == 0, :3],
+        )
+
+    points = [model[pt].numeric for pt in model.points]
+    lines = []
+    circles = []
+    for struct in model.structs:
+        if isinstance(struct, spg.Line):
+            lines.append([float(coef) for coef in struct.coefficients])
+        else:
+            center = struct.center
+            circles.append((float(center.x), float(center.y), float(struct.radius)))
+    return (
+        np.array(points, dtype=np.float64).reshape(-1, 2),
+        np.array(lines, dtype=np.float64).reshape(-1, 3),
+        np.array(circles, dtype=np.float64).reshape(-1, 3),
+    )
+
+
+class ConfigurationTable:
+    """A lookup table of configurations keyed by their similarity :func:`invariants`.
+
+    Configurations match when they have the same number of each invariant and every invariant agrees within ``10 ** -decimals``. Entries are bucketed by the floor of a weighted sum of their invariants, in buckets wide enough that matching configurations always land in the same or a neighbouring bucket, and all three are checked - so a rounding boundary never splits equal figures.
+
+    When a symbolic model matches a stored symbolic model, the match is confirmed by comparing their :func:`exact_invariants`, so floating-point agreement can never merge configurations whose invariants differ. Equal invariants are necessary for two figures to be similar but not sufficient: distinct figures that share every invariant are still merged. Numeric models are matched within the tolerance alone.
+
+    Args:
+        decimals: The number of decimals the invariants must agree to.
+        exact: Whether to confirm symbolic matches exactly.
+    """
+
+    def __init__(self, decimals: int = 9, exact: bool = True) -> None:
+        self.decimals = decimals
+        self.exact = exact
+        self._entries = {}
+        self._count = 0
+
+    def _keys(self, values: dict[str, np.ndarray]) -> list[tuple]:
+        """Returns the bucket of a configuration and its two neighbours."""
+        shape = tuple(array.shape for array in values.values())
+        flat = np.concatenate([array.ravel() for array in values.values()])
+        # normalized point quadrances always sum to their count, so weight them
+        weights = 1.0 + np.arange(len(flat)) / max(1, len(flat))
+        width = 10.0**-self.decimals * max(1.0, float(weights.sum()))
+        bucket = math.floor(float(flat @ weights) / width)
+        return [(shape, bucket + offset) for offset in (0, -1, 1)]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, model: Model | NumericModel) -> bool:
+        return self.get(model) is not None
+
+    def _match(
+        self, model: Model | NumericModel, values: dict | None = None
+    ) -> tuple[tuple, dict, dict | None, tuple | None]:
+        if values is None:
+            values = invariants(model)
+        keys = self._keys(values)
+        tolerance = 10.0**-self.decimals
+        exact = None
+        for key in keys:
+            for entry in self._entries.get(key, []):
+                if not all(
+                    np.allclose(array, entry[0][name], rtol=0, atol=tolerance)
+                    for name, array in values.items()
+                ):
+                    continue
+                if self.exact and exact is None and not isinstance(model, NumericModel):
+                    exact = exact_invariants(model)
+                stored = entry[1]
+                if exact is None or stored is None or _same_invariants(exact, stored):
+                    return keys[0], values, exact, entry
+        if self.exact and exact is None and not isinstance(model, NumericModel):
+            exact = exact_invariants(model)
+        return keys[0], values, exact, None
+
+    def get(
+        self, model: Model | NumericModel, values: dict | None = None
+    ) -> object | None:
+        """Returns the value stored for an equivalent configuration, if any.
+
+        Args:
+            model: The model to look up.
+            values: The model's :func:`invariants`, if already computed.
+        """
+        *_, entry = self._match(model, values)
+        return entry[2] if entry else None
+
+    def add(
+        self,
+        model: Model | NumericModel,
+        value: object = True,
+        values: dict | None = None,
+    ) -> bool:
+        """Add a configuration to the table.
+
+        Args:
+            model: The model to add.
+            value: A value to store with the configuration.
+            values: The model's :func:`invariants`, if already computed - by
+                a worker process, for instance.
+
+        Returns:
+            True if the configuration is new, False if an equivalent one was already stored.
+        """
+        key, values, exact, entry = self._match(model, values)
+        if entry is not None:
+            return False
+        self._entries.setdefault(key, []).append((values, exact, value))
+        self._count += 1
+        return True
+
+
+def _same_invariants(
+    first: dict[str, list[sp.Expr]], second: dict[str, list[sp.Expr]]
+) -> bool:
+    for name, values in first.items():
+        others = second[name]
+        if len(values) != len(others):
+            return False
+        for value, other in zip(values, others):
+            if value != other and clean_expr(value - other) != 0:
+                return False
+    return True
@@ -73,8 +73,8 @@ def set_equilateral_poles(
         for pt in pts:
             pt = model.set_point(pt.x, pt.y)
             set_points.append(pt)
-            model[pt].parents[c1] = ""
-            model[pt].parents[c2] = ""
+            model._writable(pt).parents[c1] = ""
+            model._writable(pt).parents[c2] = ""
 
         return set_points
 
@@ -0,0 +1,161 @@
+"""Provides model-wide equal-length analysis for the Model class.
+
+This module answers the question "which point pairs are the same distance apart?" for a whole model. Pairwise squared distances are computed in a single vectorized pass, bucketed by tolerance, and each bucket is confirmed exactly with quadrances so no square roots are taken until a length is requested.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import sympy as sp
+import sympy.geometry as spg
+from rich.table import Table
+
+from geometor.model.chains import segment_key
+from geometor.model.colors import COLORS
+from geometor.model.utils import (
+    clean_expr,
+    group_equal_exprs,
+    tolerance_buckets,
+)
+
+__all__ = ["LengthsMixin", "LengthClass"]
+
+
+class LengthsMixin:
+    """Mixin for the Model class containing equal-length analysis.
+
+    This mixin adds :meth:`find_equal_lengths`, which classifies every pair of points in the model by the distance between them and maps each class to the segments that span it.
+    """
+
+    def find_equal_lengths(
+        self,
+        points: list[spg.Point] | None = None,
+        tolerance: float = 1e-9,
+        min_size: int = 2,
+        set_segments: bool = False,
+        classes: list[str] | None = None,
+    ) -> list[LengthClass]:
+        """Find classes of point pairs separated by the same distance.
+
+        All pairwise squared distances are computed in float64 with NumPy and
+        bucketed with :func:`geometor.model.utils.tolerance_buckets`. The
+        members of each bucket are then confirmed exactly by comparing their
+        symbolic quadrances, so a bucket holding distinct values that happen
+        to evaluate closely is split correctly.
+
+        Args:
+            points: The points to compare. If None, all points of the model
+                are used.
+            tolerance: The relative gap that separates two buckets.
+            min_size: The minimum number of pairs for a class to be reported.
+            set_segments: If True, pairs without a segment in the model are
+                added with :meth:`Model.set_segment`.
+            classes: A list of class labels for segments added to the model.
+
+        Returns:
+            A list of :class:`LengthClass` objects in ascending order of length.
+        """
+        if points is None:
+            points = self.points
+
+        count = len(points)
+        if count < 2:
+            return []
+
+        coords = np.array(
+            [self[pt].numeric for pt in points], dtype=np.float64
+        )
+        first, second = np.triu_indices(count, k=1)
+        deltas = coords[first] - coords[second]
+        quadrances = np.einsum("ij,ij->i", deltas, deltas)
+
+        existing = {
+            segment_key(*el.points): el for el in self if isinstance(el, spg.Segment)
+        }
+
+        length_classes = []
+        for bucket in tolerance_buckets(quadrances, tolerance):
+            if len(bucket) < min_size:
+                continue
+
+            pairs = [(points[first[i]], points[second[i]]) for i in bucket]
+            exact = [quadrance(pt_1, pt_2) for pt_1, pt_2 in pairs]
+
+            for group in group_equal_exprs(exact):
+                if len(group) < min_size:
+                    continue
+                group_pairs = [pairs[i] for i in group]
+                segments = []
+                for pt_1, pt_2 in group_pairs:
+                    segment = existing.get(segment_key(pt_1, pt_2))
+                    if segment is None:
+                        if set_segments:
+                            segment = self.set_segment(pt_1, pt_2, classes=classes)
+                        else:
+                            segment = spg.Segment(pt_1, pt_2)
+                    segments.append(segment)
+
+                length_classes.append(
+                    LengthClass(
+                        self.intern(clean_expr(exact[group[0]])),
+                        group_pairs,
+                        segments,
+                    )
+                )
+
+        self.log(
+            f"[{COLORS['segment']} bold]equal lengths[/{COLORS['segment']} bold] : {len(length_classes)}"
+        )
+        table = Table(show_header=False, box=None, padding=(0, 4))
+        for length_class in length_classes:
+            table.add_row(
+                f"    {len(length_class)}:",
+                f"[cyan]{sp.pretty(length_class.length)}[/cyan]",
+            )
+        self.log(table)
+
+        return length_classes
+
+
+class LengthClass:
+    """A set of point pairs separated by the same distance.
+
+    Args:
+        quadrance: The exact squared distance shared by every pair.
+        pairs: The point pairs in the class.
+        segments: A segment for each pair, either from the model or new.
+    """
+
+    def __init__(
+        self,
+        quadrance: sp.Expr,
+        pairs: list[tuple[spg.Point, spg.Point]],
+        segments: list[spg.Segment],
+    ) -> None:
+        self.quadrance = quadrance
+        self.pairs = pairs
+        self.segments = segments
+
+    def __len__(self) -> int:
+        return len(self.pairs)
+
+    def __repr__(self) -> str:
+        return f"LengthClass({self.length}, {len(self)} pairs)"
+
+    @property
+    def length(self) -> sp.Expr:
+        """The exact length shared by every pair in the class."""
+        return clean_expr(sp.sqrt(self.quadrance))
+
+
+def quadrance(pt_1: spg.Point, pt_2: spg.Point) -> sp.Expr:
+    """Returns the exact squared distance between two points.
+
+    Args:
+        pt_1: The first point.
+        pt_2: The second point.
+
+    Returns:
+        The expanded quadrance as a symbolic expression.
+    """
+    return sp.expand((pt_1.x - pt_2.x) ** 2 + (pt_1.y - pt_2.y) ** 2)
@@ -97,9 +97,10 @@ class LinesMixin:
 
         if exists:
             # handle the logic for an existing circle
+            existing = self._writable(existing_line)
             for parent in struct.points:
-                self[existing_line].parents[parent] = ""
-            self[existing_line].classes.update(details.classes)
+                existing.parents[parent] = ""
+            existing.classes.update(details.classes)
         else:
             # add struct
             self[struct] = details
@@ -0,0 +1,172 @@
+"""Provides memory accounting for the Model class.
+
+This module measures the deep size of a model and attributes it by element type, by class and to the caches kept by the model's subsystems. Objects are counted once, by the first owner that reaches them, so sub-expressions shared between elements - as interned expressions are - are not counted twice.
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+import types
+from typing import TYPE_CHECKING
+
+import sympy.geometry as spg
+from sympy.core.facts import FactRules
+
+from geometor.model.polynomials import Polynomial
+from geometor.model.sections import Section
+from geometor.model.wedges import Wedge
+
+if TYPE_CHECKING:
+    from geometor.model.model import Model
+
+__all__ = ["deep_size", "memory_usage", "element_type"]
+
+_ATOMIC = (str, bytes, int, float, complex, bool, type(None))
+#: Shared by the whole process - sympy's assumption rules, for instance.
+_SKIP = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    logging.Logger,
+    FactRules,
+)
+
+_SLOTS = {}
+
+
+def _slot_names(cls: type) -> tuple[str, ...]:
+    names = _SLOTS.get(cls)
+    if names is None:
+        names = []
+        for base in cls.__mro__:
+            slots = base.__dict__.get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            names.extend(
+                name for name in slots if name not in ("__dict__", "__weakref__")
+            )
+        names = _SLOTS[cls] = tuple(names)
+    return names
+
+
+def deep_size(obj: object, seen: set[int]) -> int:
+    """Returns the size in bytes of an object and everything it references.
+
+    Objects whose ``id`` is in ``seen`` are skipped, and every object counted
+    is added to it - so sizes taken with one ``seen`` set never overlap.
+    Types, modules, functions, loggers and sympy's assumption rules are not
+    followed.
+
+    Args:
+        obj: The object to measure.
+        seen: The ids of objects already counted, updated in place.
+
+    Returns:
+        The number of bytes not counted before.
+    """
+    size = 0
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, _SKIP):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, _ATOMIC):
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        for name in _slot_names(type(obj)):
+            value = getattr(obj, name, None)
+            if value is not None:
+                stack.append(value)
+        attrs = getattr(obj, "__dict__", None)
+        if attrs is not None:
+            stack.append(attrs)
+    return size
+
+
+def element_type(key: object, element: object) -> str:
+    """Returns the report name of an element's type, such as ``"point"``."""
+    if isinstance(element, Polynomial):
+        return "polynomial"
+    for cls, name in (
+        (spg.Point, "point"),
+        (spg.Line, "line"),
+        (spg.Circle, "circle"),
+        (spg.Segment, "segment"),
+        (spg.Polygon, "polygon"),
+        (Section, "section"),
+        (Wedge, "wedge"),
+    ):
+        if isinstance(key, cls):
+            return name
+    return "other"
+
+
+def memory_usage(model: Model) -> dict:
+    """Attributes the deep size of a model by element type, class and subsystem.
+
+    Elements are measured in model order, so a sub-expression shared by
+    several elements is counted with the first one. The caches of the
+    subsystems are measured afterwards and are only charged for what the
+    elements do not already hold - an intern table, for instance, only costs
+    its own dict. Class sizes overlap when elements have several classes.
+
+    Args:
+        model: The model to measure.
+
+    Returns:
+        A dict with the ``total`` bytes, ``types`` - the ``count``, ``sympy``
+        and ``metadata`` bytes of each element type - and the bytes of each
+        of the ``classes`` and ``subsystems``.
+    """
+    seen = {id(model)}
+    total = sys.getsizeof(model)
+
+    by_type = {}
+    by_class = {}
+    for key, element in model.items():
+        sympy_size = deep_size(key, seen)
+        meta_size = deep_size(element, seen)
+        entry = by_type.setdefault(
+            element_type(key, element), {"count": 0, "sympy": 0, "metadata": 0}
+        )
+        entry["count"] += 1
+        entry["sympy"] += sympy_size
+        entry["metadata"] += meta_size
+        for class_name in element.classes:
+            by_class[class_name] = by_class.get(class_name, 0) + sympy_size + meta_size
+        total += sympy_size + meta_size
+
+    buffers = []
+    if model._logger:
+        for handler in model._logger.handlers:
+            buffers.append(getattr(handler, "buffer", None))
+            console = getattr(handler, "console", None)
+            buffers.append(getattr(console, "_record_buffer", None))
+
+    subsystems = {}
+    for name, parts in (
+        ("intern table", (model._interned,)),
+        ("bounds", (model._bounds, model._bounds_log)),
+        ("spatial index", (model._spatial,)),
+        ("tower", (model._tower, model._tower_index, model._tower_signatures)),
+        ("new points", (model._new_points,)),
+        ("logging buffers", buffers),
+    ):
+        size = sum(deep_size(part, seen) for part in parts if part is not None)
+        subsystems[name] = size
+        total += size
+
+    return {
+        "total": total,
+        "types": by_type,
+        "classes": by_class,
+        "subsystems": subsystems,
+    }
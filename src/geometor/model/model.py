@@ -15,10 +15,15 @@ import sympy.geometry as spg
 from rich.logging import RichHandler
 
 from .ancestors import AncestorsMixin
-from .chains import Chain
+from .bounds import BoundsMixin
+from .branches import BranchesMixin
+from .chains import Chain, ChainsMixin
 from .circles import CirclesMixin
+from .constructible import ConstructibleMixin, QuadraticTower
 from .delete import DeleteMixin
 from .element import Element, Struct, _get_element_by_ID
+from .export import ExportMixin
+from .lengths import LengthsMixin
 from .lines import LinesMixin
 from .points import PointsMixin
 from .polygons import PolygonsMixin
@@ -27,6 +32,9 @@ from .reports import ReportMixin
 from .sections import Section, SectionsMixin
 from .segments import SegmentsMixin
 from .serialize import SerializeMixin
+from .spatial import SpatialMixin
+from .spreads import SpreadsMixin
+from .utils import NUMERIC_DIGITS, intern_expr, numeric_coords
 from .wedges import Wedge, WedgesMixin
 
 GeometryObject = (
@@ -60,13 +68,27 @@ class Model(
     SectionsMixin,
     WedgesMixin,
     AncestorsMixin,
+    ChainsMixin,
+    LengthsMixin,
+    SpreadsMixin,
+    BranchesMixin,
+    ConstructibleMixin,
+    BoundsMixin,
+    SpatialMixin,
+    ExportMixin,
 ):
     """The central class representing a collection of geometric elements.
     
     The Model class is a comprehensive container that inherits from `dict` to store geometric elements mapped to their symbolic representations. It composes multiple mixins to provide a rich feature set, including point plotting, circle/line construction, serialization, reporting, and more.
     """
 
-    def __init__(self, name: str = "", logger: logging.Logger | None = None) -> None:
+    def __init__(
+        self,
+        name: str = "",
+        logger: logging.Logger | None = None,
+        backend: str = "sympy",
+        numeric_digits: int = NUMERIC_DIGITS,
+    ) -> None:
         """Initialize the Model.
         
         The constructor sets up the model's environment, initializing identifiers, logging, and state containers for points and analysis hooks.
@@ -74,7 +96,17 @@ class Model(
         Args:
             name: The name of the model.
             logger: An optional logger instance. If None, a default logger is created.
+            backend: The coordinate backend - ``"sympy"`` simplifies coordinates
+                as general expressions, ``"tower"`` computes them exactly in a
+                :class:`geometor.model.constructible.QuadraticTower`.
+            numeric_digits: The decimal digits of the numeric values cached
+                on points and circles - see :attr:`numeric_digits`.
+
+        Raises:
+            ValueError: If the backend is not known.
         """
+        if backend not in ("sympy", "tower"):
+            raise ValueError(f"Unknown backend {backend!r}")
         super().__init__()
         self._name = name
         if logger:
@@ -88,11 +120,29 @@ class Model(
         self.ID_gen = self.point_ID_generator()
         self.last_point_id = ""
         self._analysis_hook = None
+        self._simplify_budget = {"seconds": None, "ops": None}
+        self._interned = {}
+        self._numeric_digits = numeric_digits
         self._new_points = []
         self._poly_count = 0
 
+        self._tower = QuadraticTower() if backend == "tower" else None
+        self._tower_index = None
+        self._tower_signatures = {}
+
+        self._bounds = {}
+        self._bounds_log = []
+        self._spatial = None
+        self._spatial_size = 0
+
+        self._version = 0
+        self._owned = None
+        self._branch_parent = None
+        self._branch_version = 0
+
     def log(self, message: object) -> None:
-        if self._logger:
+        # rich tables follow the logger level too, so a quiet logger is silent
+        if self._logger and self._logger.isEnabledFor(logging.INFO):
             if hasattr(message, "__rich_console__"):
                 rich.print(message)
             else:
@@ -101,6 +151,62 @@ class Model(
     def set_analysis_hook(self, hook_function: Callable) -> None:
         self._analysis_hook = hook_function
 
+    def set_simplify_budget(
+        self, seconds: float | None = None, ops: int | None = None
+    ) -> None:
+        """Limit the simplification of each new point coordinate.
+
+        Coordinates that exceed the budget are kept exact but unsimplified,
+        and their points are flagged for :meth:`resimplify`. See
+        :func:`geometor.model.utils.clean_expr_checked`.
+
+        Args:
+            seconds: The time allowed per coordinate, or None for no limit.
+            ops: The largest operation count simplified, or None for no limit.
+        """
+        self._simplify_budget = {"seconds": seconds, "ops": ops}
+
+    def intern(self, expr: sp.Expr) -> sp.Expr:
+        """Returns the model's shared instance of an expression.
+
+        Coordinates, quadrances and lengths are interned as they are added,
+        so equal values - and equal sub-expressions - across the model are a
+        single object. See :func:`geometor.model.utils.intern_expr`.
+
+        Args:
+            expr: The expression to intern.
+
+        Returns:
+            The shared instance.
+        """
+        return intern_expr(expr, self._interned)
+
+    @property
+    def numeric_digits(self) -> int:
+        """The decimal digits of the numeric values cached on points and circles.
+
+        The values order points, bound the model and pre-filter exact checks.
+        Setting a new precision evaluates them again for every point and
+        circle already in the model.
+        """
+        return self._numeric_digits
+
+    @numeric_digits.setter
+    def numeric_digits(self, digits: int) -> None:
+        if digits == self._numeric_digits:
+            return
+        self._numeric_digits = digits
+        for key, element in list(self.items()):
+            if element.numeric is not None:
+                self._writable(key).numeric = numeric_coords(key, digits)
+        self._bounds_reset()
+        self._spatial = None
+
+    @property
+    def backend(self) -> str:
+        """The coordinate backend of the model."""
+        return "sympy" if self._tower is None else "tower"
+
     @property
     def new_points(self) -> list[spg.Point]:
         """The new_points of the model."""
@@ -135,6 +241,22 @@ class Model(
         if not isinstance(value, Element):
             raise TypeError(f"{ value= } must be an instance of Element class")
         super().__setitem__(key, value)
+        self._version += 1
+        if self._owned is not None:
+            self._owned.add(key)
+        self._bounds_added(key)
+        if self._spatial is not None:
+            self._spatial_add(key, value)
+
+    def __delitem__(self, key: GeometryObject) -> None:
+        element = self[key]
+        super().__delitem__(key)
+        self._bounds_removed(key, element)
+        if self._spatial is not None:
+            self._spatial.remove(key)
+        self._version += 1
+        if self._owned is not None:
+            self._owned.discard(key)
 
     def remove_by_ID(self, ID: str) -> None:
         el = self.get_element_by_ID(ID)
@@ -167,38 +289,4 @@ class Model(
         """Returns circle elements from model as list."""
         return [el for el in self if isinstance(el, spg.Circle)]
 
-    def limits(self) -> tuple[tuple[float, float], tuple[float, float]]:
-        """Find x, y limits from points and circles of the model.
-        
-        This method calculates the bounding box of all geometric elements currently in the model. It iterates through points and circles (accounting for radii) to determine the minimum and maximum coordinates.
-
-        Returns:
-            tuple: A tuple containing ((min_x, max_x), (min_y, max_y)).
-
-        Raises:
-            ValueError: If the model contains no geometric elements.
-        """
-        x_vals = []
-        y_vals = []
-
-        for el in self:
-            if isinstance(el, spg.Point):
-                x_vals.append(float(el.x))
-                y_vals.append(float(el.y))
-
-            elif isinstance(el, spg.Circle):
-                x_vals.extend(
-                    [float(el.center.x - el.radius), float(el.center.x + el.radius)]
-                )
-                y_vals.extend(
-                    [float(el.center.y - el.radius), float(el.center.y + el.radius)]
-                )
-
-        if not x_vals or not y_vals:
-            raise ValueError(
-                "Model contains no geometric elements to determine limits."
-            )
-
-        return [[min(x_vals), max(x_vals)], [min(y_vals), max(y_vals)]]
-
     get_element_by_ID = _get_element_by_ID
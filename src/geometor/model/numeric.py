@@ -0,0 +1,841 @@
+"""Provides a float64 numeric shadow of the :class:`geometor.model.model.Model` class.
+
+This module defines :class:`NumericModel`, which mirrors the construction API of the symbolic model but stores coordinates, lines and circles as float64 rows in NumPy arrays. Intersections are computed numerically against all structs at once and points are deduplicated within a tolerance. Every call is recorded, so an interesting numeric model, or any part of it, can be promoted to a fully symbolic :class:`Model` by replaying its construction.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+import numpy as np
+import sympy as sp
+import sympy.geometry as spg
+from sympy.geometry.entity import GeometryEntity
+
+from geometor.model.sections import Section, phi
+
+if TYPE_CHECKING:
+    from geometor.model.model import Model
+
+__all__ = ["NumericModel", "NumericElement"]
+
+PHI = float(phi)
+
+
+class NumericElement:
+    """A handle for an element of a :class:`NumericModel`.
+
+    Handles are resolved by :attr:`index`, so a handle from one model can be used with any copy of it.
+
+    Args:
+        index: The position of the element in the model.
+        kind: The element type - ``point``, ``line``, ``circle``, ``segment``, ``section`` or ``polygon``.
+        row: The row of the element in the storage array for its kind.
+        parents: Indexes of the parent elements.
+        classes: A list of class labels.
+        ID: A string ID for the element.
+        guide: If True, the element is a guide and excluded from intersections.
+    """
+
+    __slots__ = ("index", "kind", "row", "parents", "classes", "ID", "guide")
+
+    def __init__(
+        self,
+        index: int,
+        kind: str,
+        row: int,
+        parents: list[int] | None = None,
+        classes: list[str] | None = None,
+        ID: str = "",
+        guide: bool = False,
+    ) -> None:
+        self.index = index
+        self.kind = kind
+        self.row = row
+        self.parents = {key: "" for key in parents or []}
+        #: Dict with keys as parent element indexes.
+        self.classes = {key: "" for key in classes or []}
+        #: Dict with strings for class name.
+        self.ID = ID
+        self.guide = guide
+
+    def __repr__(self) -> str:
+        return f"NumericElement({self.kind} {self.ID!r})"
+
+    def copy(self) -> NumericElement:
+        el = NumericElement(self.index, self.kind, self.row, ID=self.ID, guide=self.guide)
+        el.parents = dict(self.parents)
+        el.classes = dict(self.classes)
+        return el
+
+
+class _Rows:
+    """A growable float64 array of fixed-width rows."""
+
+    __slots__ = ("data", "count")
+
+    def __init__(self, width: int, capacity: int = 64) -> None:
+        self.data = np.empty((capacity, width), dtype=np.float64)
+        self.count = 0
+
+    def append(self, row: tuple[float, ...]) -> int:
+        if self.count == len(self.data):
+            self.data = np.concatenate([self.data, np.empty_like(self.data)])
+        self.data[self.count] = row
+        self.count += 1
+        return self.count - 1
+
+    @property
+    def view(self) -> np.ndarray:
+        return self.data[: self.count]
+
+    def copy(self) -> _Rows:
+        rows = _Rows.__new__(_Rows)
+        rows.data = self.data.copy()
+        rows.count = self.count
+        return rows
+
+
+class NumericModel:
+    """A float64 model with the construction API of :class:`Model`.
+
+    Points are stored as ``(x, y)`` rows, lines as normalized ``(a, b, c, guide)`` rows with ``a² + b² = 1`` and circles as ``(x, y, r, guide)`` rows. Elements are returned as :class:`NumericElement` handles. Values within ``tolerance`` of each other are treated as equal.
+
+    Args:
+        name: The name of the model.
+        tolerance: The absolute tolerance used to merge points and structs.
+        logger: An optional logger. Numeric models are silent by default.
+    """
+
+    def __init__(
+        self,
+        name: str = "",
+        tolerance: float = 1e-9,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self.name = name
+        self.tolerance = tolerance
+        self._logger = logger
+
+        self._elements = []
+        self._points = _Rows(2)
+        self._lines = _Rows(4)
+        self._circles = _Rows(4)
+        self._point_elements = []
+        self._line_elements = []
+        self._circle_elements = []
+        self._grid = {}
+        self._steps = []
+        self._new_points = []
+        self._ID_count = 0
+        self.last_point_id = ""
+
+    def log(self, message: object) -> None:
+        if self._logger:
+            self._logger.info(message)
+
+    def copy(self, name: str = "") -> NumericModel:
+        """Returns an independent copy of the model.
+
+        Storage arrays are copied as contiguous blocks, so copying is cheap
+        compared to copying a symbolic model.
+        """
+        model = NumericModel.__new__(NumericModel)
+        model.name = name or self.name
+        model.tolerance = self.tolerance
+        model._logger = self._logger
+        model._elements = [el.copy() for el in self._elements]
+        model._points = self._points.copy()
+        model._lines = self._lines.copy()
+        model._circles = self._circles.copy()
+        model._point_elements = list(self._point_elements)
+        model._line_elements = list(self._line_elements)
+        model._circle_elements = list(self._circle_elements)
+        model._grid = {key: list(rows) for key, rows in self._grid.items()}
+        model._steps = list(self._steps)
+        model._new_points = []
+        model._ID_count = self._ID_count
+        model.last_point_id = self.last_point_id
+        return model
+
+    # elements ******************************
+
+    def __len__(self) -> int:
+        return len(self._elements)
+
+    def __iter__(self) -> Iterator[NumericElement]:
+        return iter(self._elements)
+
+    def __getitem__(self, el: NumericElement | int) -> NumericElement:
+        return self._elements[self._index(el)]
+
+    def _index(self, el: NumericElement | int) -> int:
+        return el.index if isinstance(el, NumericElement) else el
+
+    def get_element_by_ID(self, ID: str) -> NumericElement | None:
+        for el in self._elements:
+            if el.ID == ID:
+                return el
+        return None
+
+    @property
+    def points(self) -> list[NumericElement]:
+        """Returns point elements from model as list."""
+        return [self._elements[i] for i in self._point_elements]
+
+    @property
+    def lines(self) -> list[NumericElement]:
+        """Returns line elements from model as list."""
+        return [self._elements[i] for i in self._line_elements]
+
+    @property
+    def circles(self) -> list[NumericElement]:
+        """Returns circle elements from model as list."""
+        return [self._elements[i] for i in self._circle_elements]
+
+    @property
+    def structs(self) -> list[NumericElement]:
+        """Returns struct elements (line or circle) from model as list."""
+        return [
+            el
+            for el in self._elements
+            if el.kind in ("line", "circle") and not el.guide
+        ]
+
+    @property
+    def new_points(self) -> list[NumericElement]:
+        """The points added by the latest construction."""
+        return self._new_points
+
+    def clear_new_points(self) -> None:
+        self._new_points = []
+
+    @property
+    def coordinates(self) -> np.ndarray:
+        """The ``(n, 2)`` array of point coordinates, in point order."""
+        return self._points.view
+
+    def point_coords(self, pt: NumericElement | int) -> tuple[float, float]:
+        """Returns the ``(x, y)`` coordinates of a point element."""
+        x, y = self._points.data[self[pt].row]
+        return float(x), float(y)
+
+    def limits(self) -> tuple[tuple[float, float], tuple[float, float]]:
+        """Find x, y limits from points and circles of the model.
+
+        Returns:
+            tuple: A tuple containing ((min_x, max_x), (min_y, max_y)).
+
+        Raises:
+            ValueError: If the model contains no points or circles.
+        """
+        points = self._points.view
+        circles = self._circles.view
+        if not len(points) and not len(circles):
+            raise ValueError(
+                "Model contains no geometric elements to determine limits."
+            )
+        x_vals = np.concatenate(
+            [points[:, 0], circles[:, 0] - circles[:, 2], circles[:, 0] + circles[:, 2]]
+        )
+        y_vals = np.concatenate(
+            [points[:, 1], circles[:, 1] - circles[:, 2], circles[:, 1] + circles[:, 2]]
+        )
+        return [
+            [float(x_vals.min()), float(x_vals.max())],
+            [float(y_vals.min()), float(y_vals.max())],
+        ]
+
+    def _add_element(
+        self,
+        kind: str,
+        row: int,
+        parents: list[int],
+        classes: list[str] | None,
+        ID: str,
+        guide: bool = False,
+    ) -> NumericElement:
+        el = NumericElement(len(self._elements), kind, row, parents, classes, ID, guide)
+        self._elements.append(el)
+        return el
+
+    def _next_ID(self) -> str:
+        letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+        repeat, offset = divmod(self._ID_count, len(letters))
+        self._ID_count += 1
+        return letters[offset] * (repeat + 1)
+
+    # points ******************************
+
+    def set_point(
+        self,
+        x_val: sp.Expr | float,
+        y_val: sp.Expr | float,
+        parents: list | None = None,
+        classes: list[str] | None = None,
+        ID: str = "",
+        guide: bool = False,
+    ) -> NumericElement:
+        """Adds a point to the model, merging it with any point within tolerance.
+
+        Args:
+            x_val: The x-value of the point.
+            y_val: The y-value of the point.
+            parents: A list of parent elements.
+            classes: A list of class labels.
+            ID: A text ID for the point. If empty, one is generated.
+            guide: If True, the point is a guide.
+
+        Returns:
+            The new or existing point element.
+        """
+        el = self._set_point(float(x_val), float(y_val), parents, classes, ID, guide)
+        self._steps.append(
+            (
+                "set_point",
+                (x_val, y_val),
+                dict(
+                    parents=[self._index(parent) for parent in parents or []],
+                    classes=classes,
+                    ID=ID,
+                    guide=guide,
+                ),
+                el.index,
+            )
+        )
+        return el
+
+    def _set_point(
+        self,
+        x: float,
+        y: float,
+        parents: list | None = None,
+        classes: list[str] | None = None,
+        ID: str = "",
+        guide: bool = False,
+    ) -> NumericElement:
+        parents = [self._index(parent) for parent in parents or []]
+
+        existing = self._find_point(x, y)
+        if existing is not None:
+            for parent in parents:
+                existing.parents[parent] = ""
+            existing.classes.update({key: "" for key in classes or []})
+            return existing
+
+        if not ID:
+            ID = self._next_ID()
+            self.last_point_id = ID
+
+        row = self._points.append((x, y))
+        el = self._add_element("point", row, parents, classes, ID, guide)
+        self._point_elements.append(el.index)
+        self._grid.setdefault(self._cell(x, y), []).append(row)
+        self._new_points.append(el)
+        self.log(f"    {ID} = {x}, {y}")
+        return el
+
+    def _cell(self, x: float, y: float) -> tuple[int, int]:
+        return (math.floor(x / self.tolerance), math.floor(y / self.tolerance))
+
+    def _find_point(self, x: float, y: float) -> NumericElement | None:
+        cx, cy = self._cell(x, y)
+        data = self._points.data
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for row in self._grid.get((cx + dx, cy + dy), ()):
+                    px, py = data[row]
+                    if abs(px - x) <= self.tolerance and abs(py - y) <= self.tolerance:
+                        return self._elements[self._point_elements[row]]
+        return None
+
+    # structs ******************************
+
+    def construct_line_by_IDs(
+        self, pt_1_ID: str, pt_2_ID: str, classes: list[str] | None = None, ID: str = ""
+    ) -> NumericElement:
+        """Find points by ID and use them with :meth:`construct_line`."""
+        pt_1 = self.get_element_by_ID(pt_1_ID)
+        pt_2 = self.get_element_by_ID(pt_2_ID)
+        return self.construct_line(pt_1, pt_2, classes, ID)
+
+    def construct_line(
+        self,
+        pt_1: NumericElement,
+        pt_2: NumericElement,
+        classes: list[str] | None = None,
+        ID: str = "",
+        guide: bool = False,
+    ) -> NumericElement:
+        """Constructs a line from two points and intersects it with all structs.
+
+        Args:
+            pt_1: The first point of the line.
+            pt_2: The second point of the line.
+            classes: A list of class labels.
+            ID: A string ID for the line. If empty, one is generated.
+            guide: If True, the line is a guide.
+
+        Returns:
+            The new or existing line element.
+        """
+        self.clear_new_points()
+        pt_1, pt_2 = self[pt_1], self[pt_2]
+        x1, y1 = self.point_coords(pt_1)
+        x2, y2 = self.point_coords(pt_2)
+
+        a, b = y1 - y2, x2 - x1
+        norm = math.hypot(a, b)
+        if norm <= self.tolerance:
+            raise ValueError("A line requires two distinct points")
+        a, b = a / norm, b / norm
+        c = -(a * x1 + b * y1)
+        # canonical orientation so equal lines have equal rows
+        if a < -self.tolerance or (abs(a) <= self.tolerance and b < 0):
+            a, b, c = -a, -b, -c
+
+        self._steps.append(
+            (
+                "construct_line",
+                (pt_1.index, pt_2.index),
+                dict(classes=classes, ID=ID, guide=guide),
+                len(self._elements),
+            )
+        )
+
+        existing = self._find_struct(self._lines, self._line_elements, (a, b, c))
+        if existing is not None:
+            existing.parents.update({pt_1.index: "", pt_2.index: ""})
+            existing.classes.update({key: "" for key in classes or []})
+            self._steps[-1] = self._steps[-1][:3] + (existing.index,)
+            return existing
+
+        if not ID:
+            ID = f"[ {pt_1.ID} {pt_2.ID} ]"
+
+        row = self._lines.append((a, b, c, float(guide)))
+        el = self._add_element("line", row, [pt_1.index, pt_2.index], classes, ID, guide)
+        self._line_elements.append(el.index)
+        self.log(f"{ID}")
+
+        if not guide:
+            self._intersect_line(el)
+        return el
+
+    def construct_circle_by_IDs(
+        self, pt_1_ID: str, pt_2_ID: str, classes: list[str] | None = None, ID: str = ""
+    ) -> NumericElement:
+        """Find points by ID and use them with :meth:`construct_circle`."""
+        pt_1 = self.get_element_by_ID(pt_1_ID)
+        pt_2 = self.get_element_by_ID(pt_2_ID)
+        return self.construct_circle(pt_1, pt_2, classes, ID)
+
+    def construct_circle(
+        self,
+        pt_center: NumericElement,
+        pt_radius: NumericElement,
+        classes: list[str] | None = None,
+        ID: str = "",
+        guide: bool = False,
+    ) -> NumericElement:
+        """Constructs a circle from two points and intersects it with all structs.
+
+        Args:
+            pt_center: The center point of the circle.
+            pt_radius: A point on the circumference of the circle.
+            classes: A list of class labels.
+            ID: A string ID for the circle. If empty, one is generated.
+            guide: If True, the circle is a guide.
+
+        Returns:
+            The new or existing circle element.
+        """
+        self.clear_new_points()
+        pt_center, pt_radius = self[pt_center], self[pt_radius]
+        x1, y1 = self.point_coords(pt_center)
+        x2, y2 = self.point_coords(pt_radius)
+        r = math.hypot(x2 - x1, y2 - y1)
+        if r <= self.tolerance:
+            raise ValueError("A circle requires two distinct points")
+
+        self._steps.append(
+            (
+                "construct_circle",
+                (pt_center.index, pt_radius.index),
+                dict(classes=classes, ID=ID, guide=guide),
+                len(self._elements),
+            )
+        )
+
+        existing = self._find_struct(self._circles, self._circle_elements, (x1, y1, r))
+        if existing is not None:
+            existing.parents[pt_radius.index] = ""
+            existing.classes.update({key: "" for key in classes or []})
+            self._steps[-1] = self._steps[-1][:3] + (existing.index,)
+            return existing
+
+        if not ID:
+            ID = f"( {pt_center.ID} {pt_radius.ID} )"
+
+        row = self._circles.append((x1, y1, r, float(guide)))
+        el = self._add_element(
+            "circle", row, [pt_center.index, pt_radius.index], classes, ID, guide
+        )
+        self._circle_elements.append(el.index)
+        self.log(f"{ID}")
+
+        if not guide:
+            self._intersect_circle(el)
+        return el
+
+    def _find_struct(
+        self, rows: _Rows, elements: list[int], values: tuple[float, ...]
+    ) -> NumericElement | None:
+        data = rows.view[:, : len(values)]
+        if not len(data):
+            return None
+        matches = np.flatnonzero(
+            np.all(np.abs(data - np.array(values)) <= self.tolerance, axis=1)
+        )
+        if not len(matches):
+            return None
+        return self._elements[elements[matches[0]]]
+
+    # intersections ******************************
+
+    def _intersect_line(self, el: NumericElement) -> None:
+        a, b, c, _ = self._lines.data[el.row]
+
+        lines = self._lines.view
+        mask = lines[:, 3] == 0
+        mask[el.row] = False
+        rows = np.flatnonzero(mask)
+        a2, b2, c2 = lines[rows, 0], lines[rows, 1], lines[rows, 2]
+        det = a * b2 - a2 * b
+        hit = np.abs(det) > self.tolerance
+        xs = (b * c2 - b2 * c)[hit] / det[hit]
+        ys = (a2 * c - a * c2)[hit] / det[hit]
+        for row, x, y in zip(rows[hit], xs, ys):
+            other = self._line_elements[row]
+            self._add_intersection(x, y, other, el.index)
+
+        circles = self._circles.view
+        rows = np.flatnonzero(circles[:, 3] == 0)
+        self._line_circle_points(a, b, c, rows, el.index, line_first=True)
+
+    def _intersect_circle(self, el: NumericElement) -> None:
+        x1, y1, r1, _ = self._circles.data[el.row]
+
+        lines = self._lines.view
+        for row in np.flatnonzero(lines[:, 3] == 0):
+            a, b, c, _ = lines[row]
+            self._line_circle_points(
+                a, b, c, np.array([el.row]), self._line_elements[row], line_first=False
+            )
+
+        circles = self._circles.view
+        mask = circles[:, 3] == 0
+        mask[el.row] = False
+        rows = np.flatnonzero(mask)
+        dx = circles[rows, 0] - x1
+        dy = circles[rows, 1] - y1
+        dist = np.hypot(dx, dy)
+        valid = dist > self.tolerance
+        rows, dx, dy, dist = rows[valid], dx[valid], dy[valid], dist[valid]
+        r2 = circles[rows, 2]
+        along = (r1 * r1 - r2 * r2 + dist * dist) / (2 * dist)
+        h_sq = r1 * r1 - along * along
+        meets = h_sq >= -self.tolerance
+        for row, ux, uy, d, t, h in zip(
+            rows[meets], dx[meets], dy[meets], dist[meets], along[meets], h_sq[meets]
+        ):
+            ux, uy = ux / d, uy / d
+            bx, by = x1 + t * ux, y1 + t * uy
+            other = self._circle_elements[row]
+            if h <= self.tolerance:
+                self._add_intersection(bx, by, other, el.index)
+                continue
+            h = math.sqrt(h)
+            self._add_intersection(bx - h * uy, by + h * ux, other, el.index)
+            self._add_intersection(bx + h * uy, by - h * ux, other, el.index)
+
+    def _line_circle_points(
+        self,
+        a: float,
+        b: float,
+        c: float,
+        rows: np.ndarray,
+        line_index: int,
+        line_first: bool,
+    ) -> None:
+        circles = self._circles.data[rows]
+        dist = a * circles[:, 0] + b * circles[:, 1] + c
+        h_sq = circles[:, 2] ** 2 - dist**2
+        meets = h_sq >= -self.tolerance
+        for row, cx, cy, d, h in zip(
+            rows[meets], circles[meets, 0], circles[meets, 1], dist[meets], h_sq[meets]
+        ):
+            fx, fy = cx - a * d, cy - b * d
+            circle_index = self._circle_elements[row]
+            parents = (
+                (circle_index, line_index) if line_first else (line_index, circle_index)
+            )
+            if h <= self.tolerance:
+                self._add_intersection(fx, fy, *parents)
+                continue
+            h = math.sqrt(h)
+            self._add_intersection(fx - h * b, fy + h * a, *parents)
+            self._add_intersection(fx + h * b, fy - h * a, *parents)
+
+    def _add_intersection(self, x: float, y: float, prev: int, struct: int) -> None:
+        pt = self._set_point(float(x), float(y), parents=[prev, struct])
+        self._elements[prev].parents[pt.index] = ""
+        self._elements[struct].parents[pt.index] = ""
+
+    # sections, segments and polygons ******************************
+
+    def set_segment_by_IDs(
+        self, pt_1_ID: str, pt_2_ID: str, classes: list[str] | None = None, ID: str = ""
+    ) -> NumericElement:
+        """Find points by ID and use them with :meth:`set_segment`."""
+        pt_1 = self.get_element_by_ID(pt_1_ID)
+        pt_2 = self.get_element_by_ID(pt_2_ID)
+        return self.set_segment(pt_1, pt_2, classes, ID)
+
+    def set_segment(
+        self,
+        pt_1: NumericElement,
+        pt_2: NumericElement,
+        classes: list[str] | None = None,
+        ID: str = "",
+    ) -> NumericElement:
+        """Set segment between two points."""
+        return self._set_points_element("segment", [pt_1, pt_2], classes, ID, "/")
+
+    def set_section_by_IDs(
+        self, points_IDs: list[str], classes: list[str] | None = None, ID: str = ""
+    ) -> NumericElement:
+        """Find points by ID and use them with :meth:`set_section`."""
+        points = [self.get_element_by_ID(point_ID) for point_ID in points_IDs]
+        return self.set_section(points, classes, ID)
+
+    def set_section(
+        self, points: list[NumericElement], classes: list[str] | None = None, ID: str = ""
+    ) -> NumericElement:
+        """Set section (list of 3 points on a line)."""
+        assert len(points) == 3, "A section must be defined by three points."
+        return self._set_points_element("section", points, classes, ID, "/")
+
+    def set_polygon_by_IDs(
+        self, poly_pts_IDs: list[str], classes: list[str] | None = None, ID: str = ""
+    ) -> NumericElement:
+        """Find points by ID and use them with :meth:`set_polygon`."""
+        poly_pts = [self.get_element_by_ID(poly_ID) for poly_ID in poly_pts_IDs]
+        return self.set_polygon(poly_pts, classes, ID)
+
+    def set_polygon(
+        self, poly_pts: list[NumericElement], classes: list[str] | None = None, ID: str = ""
+    ) -> NumericElement:
+        """Set polygon (list of 3 or more points)."""
+        return self._set_points_element("polygon", poly_pts, classes, ID, "<")
+
+    def _set_points_element(
+        self,
+        kind: str,
+        points: list[NumericElement],
+        classes: list[str] | None,
+        ID: str,
+        bracket: str,
+    ) -> NumericElement:
+        points = [self[pt] for pt in points]
+        self._steps.append(
+            (
+                f"set_{kind}",
+                tuple(pt.index for pt in points),
+                dict(classes=classes, ID=ID),
+                len(self._elements),
+            )
+        )
+        if not ID:
+            closing = ">" if bracket == "<" else bracket
+            ID = f"{bracket} {' '.join(pt.ID for pt in points)} {closing}"
+        el = self._add_element(kind, -1, [pt.index for pt in points], classes, ID)
+        self.log(f"{ID}")
+        return el
+
+    def section_lengths(self, section: NumericElement) -> list[float]:
+        """Returns the lengths of the two segments of a section."""
+        pts = [self.point_coords(pt) for pt in self[section].parents]
+        return [math.dist(pts[0], pts[1]), math.dist(pts[1], pts[2])]
+
+    def is_golden(self, section: NumericElement) -> bool:
+        """Whether the segments of a section are in the golden ratio, within tolerance."""
+        l1, l2 = sorted(self.section_lengths(section), reverse=True)
+        if l2 <= self.tolerance:
+            return False
+        return abs(l1 / l2 - PHI) <= max(self.tolerance, 1e-9) * PHI
+
+    # promotion ******************************
+
+    def ancestors(self, elements: list[NumericElement | int]) -> set[int]:
+        """Returns the indexes of the elements and all of their ancestors."""
+        closure = set()
+        stack = [self._index(el) for el in elements]
+        while stack:
+            index = stack.pop()
+            if index in closure:
+                continue
+            closure.add(index)
+            # parents are also linked to the points they produce later on
+            earlier = [parent for parent in self._elements[index].parents if parent < index]
+            if self._elements[index].kind == "point":
+                # derived points only need the two structs that first made them
+                earlier = earlier[:2]
+            stack.extend(earlier)
+        return closure
+
+    def promote(
+        self,
+        elements: list[NumericElement | int] | None = None,
+        name: str = "",
+        logger: logging.Logger | None = None,
+    ) -> Model:
+        """Promote the model, or part of it, to a fully symbolic :class:`Model`.
+
+        The recorded construction calls are replayed on a new symbolic model.
+        Points added with :meth:`set_point` - with or without parents - are
+        set from their original values, so a model built
+        from exact inputs promotes to exact coordinates. When ``elements`` is
+        given, only the calls needed to build those elements and their
+        ancestors are replayed.
+
+        Args:
+            elements: The elements to promote. If None, the whole model is promoted.
+            name: The name of the symbolic model. Defaults to the numeric model's name.
+            logger: An optional logger instance for the symbolic model.
+
+        Returns:
+            A new :class:`Model` instance.
+        """
+        from geometor.model.model import Model
+
+        keep = None if elements is None else self.ancestors(elements)
+        model = Model(name or self.name, logger=logger)
+        symbolic = {}
+        # symbolic points by tolerance cell, as in _find_point
+        grid = {}
+
+        def resolve(index: int) -> GeometryEntity:
+            if index in symbolic:
+                return symbolic[index]
+            x, y = self.point_coords(index)
+            cx, cy = self._cell(x, y)
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    for pt, px, py in grid.get((cx + dx, cy + dy), ()):
+                        if abs(px - x) <= self.tolerance and abs(py - y) <= self.tolerance:
+                            symbolic[index] = pt
+                            return pt
+            raise ValueError(f"point {self[index].ID} was not reproduced symbolically")
+
+        for method, args, kwargs, result in self._steps:
+            if keep is not None and result not in keep:
+                continue
+            model.clear_new_points()
+            if method == "set_point":
+                parents = [resolve(index) for index in kwargs["parents"]]
+                symbolic[result] = model.set_point(
+                    *args, **dict(kwargs, parents=parents)
+                )
+            elif method in ("construct_line", "construct_circle", "set_segment"):
+                pt_1, pt_2 = (resolve(index) for index in args)
+                symbolic[result] = getattr(model, method)(pt_1, pt_2, **kwargs)
+            else:
+                symbolic[result] = getattr(model, method)(
+                    [resolve(index) for index in args], **kwargs
+                )
+            for pt in model.new_points:
+                px, py = map(float, model[pt].numeric)
+                grid.setdefault(self._cell(px, py), []).append((pt, px, py))
+
+        return model
+
+    @classmethod
+    def from_model(cls, model: Model, tolerance: float = 1e-9) -> NumericModel:
+        """Build a numeric shadow of a symbolic :class:`Model`.
+
+        Given points, structs, segments, sections and polygons are replayed
+        in order; intersection points are recomputed numerically.
+
+        Args:
+            model: The symbolic model.
+            tolerance: The absolute tolerance of the numeric model.
+
+        Returns:
+            A new :class:`NumericModel` instance.
+        """
+        numeric = cls(model.name, tolerance=tolerance)
+        handles = {}
+
+        def handle(pt: spg.Point) -> NumericElement:
+            if pt not in handles:
+                handles[pt] = numeric._find_point(*map(float, model[pt].numeric))
+            return handles[pt]
+
+        seen = set()
+        for el, details in model.items():
+            seen.add(el)
+            classes = list(details.classes)
+            if isinstance(el, spg.Point):
+                if details.parents and next(iter(details.parents)) in seen:
+                    # derived from earlier structs - recomputed numerically
+                    continue
+                handles[el] = numeric.set_point(
+                    el.x, el.y, classes=classes, ID=details.ID, guide=details.guide
+                )
+            elif isinstance(el, spg.Line):
+                pt_1, pt_2 = el.points
+                numeric.construct_line(
+                    handle(pt_1), handle(pt_2), classes, details.ID, details.guide
+                )
+            elif isinstance(el, spg.Circle):
+                numeric.construct_circle(
+                    handle(el.center),
+                    handle(details.pt_radius),
+                    classes,
+                    details.ID,
+                    details.guide,
+                )
+            elif isinstance(el, spg.Segment):
+                numeric.set_segment(
+                    *(handle(pt) for pt in el.points), classes, details.ID
+                )
+            elif isinstance(el, spg.Polygon):
+                numeric.set_polygon(
+                    [handle(pt) for pt in el.vertices], classes, details.ID
+                )
+            elif isinstance(el, Section):
+                numeric.set_section(
+                    [handle(pt) for pt in el.points], classes, details.ID
+                )
+
+        # carry the symbolic IDs over to the recomputed points
+        for pt in model.points:
+            el = handle(pt)
+            if el is not None:
+                el.ID = model[pt].ID
+        numeric.last_point_id = model.last_point_id
+        numeric._ID_count = _ID_position(model.last_point_id) + 1
+
+        return numeric
+
+
+def _ID_position(ID: str) -> int:
+    """Returns the position of a generated point ID (A, B, ... Z, AA, BB, ...)."""
+    letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    if not ID or ID[0] not in letters or ID != ID[0] * len(ID):
+        return -1
+    return (len(ID) - 1) * len(letters) + letters.index(ID[0])
@@ -13,8 +13,10 @@ import sympy.geometry as spg
 from rich.table import Table
 
 from geometor.model.colors import get_color
-from geometor.model.element import Element
-from geometor.model.utils import clean_expr
+from geometor.model.element import CircleElement, Element
+from geometor.model.sections import Section
+from geometor.model.utils import clean_expr_checked, numerically_distinct
+from geometor.model.wedges import Wedge
 
 if TYPE_CHECKING:
     pass
@@ -28,13 +30,23 @@ class PointsMixin:
     This mixin augments the Model class with methods specific to point handling, particularly the `set_point` method which is the primary entry point for adding points to the model. It also manages point ID generation.
     """
 
-    def point_ID_generator(self) -> Iterator[str]:
+    def point_ID_generator(self, last_ID: str = "") -> Iterator[str]:
+        """Generate point IDs - A, B, ... Z, AA, BB, ...
+
+        Args:
+            last_ID: If given, the generator resumes after this ID.
+        """
         letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
         repeat = 1
+        start = 0
+        if last_ID and last_ID == last_ID[0] * len(last_ID) and last_ID[0] in letters:
+            repeat = len(last_ID)
+            start = letters.index(last_ID[0]) + 1
 
         while True:
-            for letter in letters:
+            for letter in letters[start:]:
                 yield str(letter) * repeat
+            start = 0
             repeat += 1
 
     def set_point(
@@ -77,40 +89,68 @@ class PointsMixin:
         if parents is None:
             parents = []
 
-        # simplify values before adding
-        x_val = clean_expr(x_val)
-        y_val = clean_expr(y_val)
+        coords = None
+        if self._tower is not None:
+            # exact canonical values need no simplification
+            coords = self._tower_coords(x_val, y_val)
 
+        if coords is not None:
+            x_val, y_val = coords[0].to_sympy(), coords[1].to_sympy()
+            x_clean = y_clean = True
+        else:
+            # simplify values before adding
+            x_val, x_clean = clean_expr_checked(x_val, **self._simplify_budget)
+            y_val, y_clean = clean_expr_checked(y_val, **self._simplify_budget)
+
+        # shared values make the lookup below compare by identity
+        x_val, y_val = self.intern(x_val), self.intern(y_val)
         pt = spg.Point(x_val, y_val)
 
-        details = Element(pt, parents, classes, ID, guide)
+        details = Element(
+            pt, parents, classes, ID, guide, numeric_digits=self._numeric_digits
+        )
+
+        if coords is not None:
+            existing_pt = self._tower_find_point(coords)
+        else:
+            existing_pt = pt if pt in self else None
 
-        if pt in self.points:
+        if existing_pt is not None:
             # add attributes
+            existing = self._writable(existing_pt)
             for parent in details.parents:
-                self[pt].parents[parent] = ""
-            self[pt].classes.update(details.classes)
-            return pt
+                existing.parents[parent] = ""
+            existing.classes.update(details.classes)
+            return existing_pt
 
-        else:
+        elif coords is None:
             for prev_pt in self.points:
+                # only points that agree numerically need the exact check
+                if numerically_distinct(details.numeric, self[prev_pt].numeric):
+                    continue
                 if pt.equals(prev_pt):
+                    existing = self._writable(prev_pt)
                     for parent in details.parents:
-                        self[prev_pt].parents[parent] = ""
-                    self[prev_pt].classes.update(details.classes)
+                        existing.parents[parent] = ""
+                    existing.classes.update(details.classes)
                     return prev_pt
 
         if not ID:
             ID = next(self.ID_gen)
             self.last_point_id = ID
 
-        details = Element(pt, parents, classes, ID, guide)
+        details.ID = ID
+        details.unsimplified = not (x_clean and y_clean)
         self[pt] = details
+        if coords is not None:
+            self._tower_add_point(coords, pt)
         self._new_points.append(pt)
 
         color = get_color(pt, classes)
         classes_str = " : " + " ".join(classes) if classes else ""
         self.log(f"    [{color} bold]{ID}[/{color} bold]{classes_str}")
+        if details.unsimplified:
+            self.log("    [yellow]simplification budget exceeded[/yellow]")
 
         table = Table(show_header=False, box=None, padding=(0, 4))
         table.add_row("    x:", f"[cyan]{sp.pretty(pt.x)}[/cyan]")
@@ -123,3 +163,118 @@ class PointsMixin:
         #  console.print(f"[gold3]{text_ID}[/gold3] = {{ {sp.pretty(pt.x)}, {sp.pretty(pt.y)} }}")
         #  print(f"{text_ID} = {{ {sp.pprint(pt.x)}, {str(pt.y)} }}")
         return pt
+
+    def resimplify(
+        self, seconds: float | None = None, ops: int | None = None
+    ) -> list[spg.Point]:
+        """Simplify the coordinates of points flagged as unsimplified.
+
+        Points whose coordinates ran out of simplification budget in
+        :meth:`set_point` are flagged with ``unsimplified``. This method tries
+        them again - typically offline, with a larger or no budget. Points
+        that simplify to a new form are replaced in place, along with the
+        lines, circles and other elements built on them, and every parent
+        reference is updated.
+
+        Args:
+            seconds: The time allowed per coordinate, or None for no limit.
+            ops: The largest operation count simplified, or None for no limit.
+
+        Returns:
+            The points that are still unsimplified.
+        """
+        points = {}
+        remaining = []
+        for pt in self.points:
+            if not self[pt].unsimplified:
+                continue
+            x_val, x_clean = clean_expr_checked(pt.x, seconds, ops)
+            y_val, y_clean = clean_expr_checked(pt.y, seconds, ops)
+            new_pt = spg.Point(self.intern(x_val), self.intern(y_val))
+            points[pt] = (new_pt, x_clean and y_clean)
+            if not (x_clean and y_clean):
+                remaining.append(new_pt)
+
+        if not points:
+            return remaining
+
+        # keys are built from earlier keys, so one pass in order finds them all
+        mapping = {}
+        quadrances = {}
+        for key, element in self.items():
+            if key in points:
+                new_key = points[key][0]
+            elif isinstance(key, spg.Circle):
+                center = mapping.get(key.center, key.center)
+                pt_radius = mapping.get(element.pt_radius, element.pt_radius)
+                new_key = key
+                if center is not key.center or pt_radius is not element.pt_radius:
+                    # rebuilt from the quadrance, as in construct_circle
+                    quadrance, _ = clean_expr_checked(
+                        (pt_radius.x - center.x) ** 2 + (pt_radius.y - center.y) ** 2,
+                        seconds,
+                        ops,
+                    )
+                    quadrance = self.intern(quadrance)
+                    new_key = spg.Circle(center, sp.sqrt(quadrance))
+                    quadrances[key] = quadrance
+            elif isinstance(key, (Section, Wedge)):
+                new_key = key
+                if any(pt in mapping for pt in key.points):
+                    new_points = [mapping.get(pt, pt) for pt in key.points]
+                    if isinstance(key, Section):
+                        new_key = Section(new_points)
+                    else:
+                        new_key = Wedge(new_points, key.direction)
+            elif isinstance(key, sp.Basic):
+                new_key = key.xreplace(mapping)
+            else:
+                new_key = key
+            if new_key is not key:
+                mapping[key] = new_key
+
+        items = list(self.items())
+        dict.clear(self)
+        for key, element in items:
+            new_key = mapping.get(key, key)
+            changed = new_key is not key or key in points
+            changed = changed or any(parent in mapping for parent in element.parents)
+            if isinstance(element, CircleElement):
+                changed = changed or element.pt_radius in mapping
+
+            if changed:
+                element = element.copy()
+                element.object = new_key
+                element.parents = {
+                    mapping.get(parent, parent): "" for parent in element.parents
+                }
+                if isinstance(element, CircleElement):
+                    element.pt_radius = mapping.get(
+                        element.pt_radius, element.pt_radius
+                    )
+                    if key in quadrances:
+                        element.quadrance = quadrances[key]
+                if key in points:
+                    element.unsimplified = not points[key][1]
+
+            if new_key in self:
+                # simplified onto an existing point - merge into it
+                existing = self._writable(new_key)
+                existing.parents.update(element.parents)
+                existing.classes.update(element.classes)
+                continue
+
+            dict.__setitem__(self, new_key, element)
+            if self._owned is not None and (changed or key in self._owned):
+                self._owned.discard(key)
+                self._owned.add(new_key)
+
+        self._version += 1
+        self._spatial = None
+        self._new_points = [mapping.get(pt, pt) for pt in self._new_points]
+
+        self.log(
+            f"resimplified {len(points) - len(remaining)} points, "
+            f"{len(remaining)} remaining"
+        )
+        return remaining
@@ -75,7 +75,9 @@ class PolygonsMixin:
 
         details = Element(poly, parents=poly_pts, classes=classes, ID=ID)
 
-        details.side_lengths = [clean_expr(side.length) for side in poly.sides]
+        details.side_lengths = [
+            self.intern(clean_expr(side.length)) for side in poly.sides
+        ]
 
         self[poly] = details
 
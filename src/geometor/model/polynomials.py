@@ -83,6 +83,8 @@ class Polynomial(Element):
     This class wraps a SymPy Polynomial object, extending it with the :class:`Element` interface for Model integration. It provides property accessors and methods for common polynomial operations like evaluation and intersection finding.
     """
 
+    __slots__ = ("x", "y", "coeffs", "poly")
+
     def __init__(
         self,
         coeffs: list,
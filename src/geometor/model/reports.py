@@ -4,6 +4,12 @@ This module offers tools for visualizing and summarizing the state of the geomet
 """
 #  from geometor.elements.model.common import *
 
+from __future__ import annotations
+
+from collections.abc import Iterator
+from itertools import islice
+from typing import TYPE_CHECKING, TextIO
+
 import sympy as sp
 import sympy.geometry as spg
 from sympy.geometry.entity import GeometryEntity
@@ -14,6 +20,13 @@ from rich.text import Text
 # from .utils import *
 
 from .colors import get_color
+from .memory import element_type, memory_usage
+from .polynomials import Polynomial
+from .sections import Section
+from .wedges import Wedge
+
+if TYPE_CHECKING:
+    from .element import Element
 
 
 def generate_dot(
@@ -26,20 +39,36 @@ def generate_dot(
     
     This function traverses a nested dictionary representing the model's ancestor graph and produces a Graphviz DOT format string. It handles node definition with appropriate shapes (rectangles for lines, ellipses for circles, points for points) and edge creation to visualize dependencies.
 
+    The output is collected in a list and joined once, and shared subtrees
+    are walked once, so each edge is written once. To export a model's graph
+    directly, see :meth:`geometor.model.export.ExportMixin.export_dot`.
+
     Args:
         graph: A dictionary representing the graph structure/ancestors.
-        parent: The key of the parent node (used in recursion).
-        dot_string: The accumulating DOT string (used in recursion).
+        parent: The key of the parent node, if ``graph`` is a subtree. The
+            ``digraph`` wrapper is only written for the top level.
+        dot_string: DOT text to append to.
         defined_nodes: A set of already defined nodes to prevent duplicates.
 
     Returns:
         A string containing the complete DOT graph definition.
     """
+    if defined_nodes is None:
+        defined_nodes = set()
+    parts = [dot_string]
     if parent is None:
-        dot_string += "digraph {\n"
-        defined_nodes = set()  # Keep track of defined nodes
+        parts.append("digraph {\n")
+
+    edges = set()
+    expanded = set()
+    stack = [iter(graph.items())]
+    while stack:
+        item = next(stack[-1], None)
+        if item is None:
+            stack.pop()
+            continue
+        node, children = item
 
-    for node, children in graph.items():
         # Define the node with the appropriate shape and label only if not already defined
         if node not in defined_nodes:
             if node.startswith("["):  # Line
@@ -52,20 +81,21 @@ def generate_dot(
                 shape = "point"
                 label = node
 
-            dot_string += f'    "{node}" [shape={shape}, label="{label}"];\n'
+            parts.append(f'    "{node}" [shape={shape}, label="{label}"];\n')
             defined_nodes.add(node)  # Mark the node as defined
 
-        # Recurse for children if present
-        if isinstance(children, dict) and children:
-            # Add the edge to each child and recurse
-            for child in children.keys():
-                dot_string += f'    "{node}" -> "{child}";\n'  # Define the edge here
-                dot_string = generate_dot(children, child, dot_string, defined_nodes)
+        if isinstance(children, dict) and children and node not in expanded:
+            expanded.add(node)
+            for child in children:
+                if (node, child) not in edges:
+                    edges.add((node, child))
+                    parts.append(f'    "{node}" -> "{child}";\n')
+            stack.append(iter(children.items()))
 
     if parent is None:
-        dot_string += "}\n"
+        parts.append("}\n")
 
-    return dot_string
+    return "".join(parts)
 
 
 class ReportMixin:
@@ -74,6 +104,30 @@ class ReportMixin:
     This mixin provides the Model with methods to output formatted summaries and detailed reports of its contents. It utilizes the `rich` library to create readable console tables of elements, organized by type or sequence, facilitating inspection and debugging.
     """
 
+    @property
+    def stats(self) -> dict[str, str | int]:
+        """Counts of the model's elements by type.
+
+        The counts are plain values, so they can be collected from many
+        models - by the batch runner, for instance - and written out as JSON.
+        """
+        keys = list(self)
+        return {
+            "name": self.name,
+            "elements": len(keys),
+            "points": sum(isinstance(el, spg.Point) for el in keys),
+            "lines": sum(isinstance(el, spg.Line) for el in keys),
+            "circles": sum(isinstance(el, spg.Circle) for el in keys),
+            "segments": sum(isinstance(el, spg.Segment) for el in keys),
+            "polygons": sum(isinstance(el, spg.Polygon) for el in keys),
+            "sections": sum(isinstance(el, Section) for el in keys),
+            "wedges": sum(isinstance(el, Wedge) for el in keys),
+            "polynomials": sum(
+                isinstance(element, Polynomial) for element in self.values()
+            ),
+            "guides": sum(element.guide for element in self.values()),
+        }
+
     def report_summary(self) -> None:
         """Prints a summary of the model's contents to the console.
         
@@ -94,183 +148,340 @@ class ReportMixin:
         console.print("\n")
         console.print(table)
 
-    def report_group_by_type(self) -> None:
-        """Prints a detailed report of all elements grouped by type.
-        
-        This method iterates through the model's collections of points, lines, and circles, generating separate tables for each type. Each table includes detailed information such as IDs, coordinates/equations, parent dependencies, and associated classes.
+    def memory_report(self, show: bool = True) -> dict:
+        """Reports where the model's memory goes.
+
+        The deep size of the model is attributed by element type, by class
+        and to the caches of its subsystems, counting shared objects once.
+        See :func:`geometor.model.memory.memory_usage`.
+
+        Args:
+            show: Whether to print the report tables to the console.
+
+        Returns:
+            The breakdown from :func:`geometor.model.memory.memory_usage`.
         """
-        console = Console()
+        usage = memory_usage(self)
+        if not show:
+            return usage
 
-        console.print(f"\nMODEL report: {self.name}")
-
-        # Points
-        table = Table(title="Points")
-        table.add_column("ID", justify="center")
-        table.add_column("x", justify="center")
-        table.add_column("y", justify="center")
-        table.add_column("classes", justify="center")
-        table.add_column("parents", justify="center")
-
-        for el in self.points:
-            details = self[el]
-            el_classes = list(self[el].classes.keys())
-            el_ID = get_colored_ID(el, self[el].ID, el_classes)
-            el_parents_text = Text()  # Initialize an empty Text object for parents
-            for parent in details.parents.keys():
-                parent_classes = list(self[parent].classes.keys())
-                el_parents_text.append(
-                    get_colored_ID(parent, self[parent].ID, parent_classes)
-                )
-                el_parents_text.append("\n")
+        console = Console()
+        console.print(f"\nMODEL memory: {self.name}  {_kib(usage['total'])}")
 
+        table = Table(title="Element types")
+        table.add_column("type", justify="center")
+        table.add_column("count", justify="right")
+        table.add_column("sympy", justify="right")
+        table.add_column("metadata", justify="right")
+        for name, entry in usage["types"].items():
             table.add_row(
-                el_ID,
-                str(el.x),
-                str(el.y),
-                "\n".join(el_classes),
-                el_parents_text,
+                name,
+                str(entry["count"]),
+                _kib(entry["sympy"]),
+                _kib(entry["metadata"]),
             )
-        console.print("\n")
         console.print(table)
 
-        # Lines
-        table = Table(title="Lines")
-        table.add_column("#", justify="center")
-        table.add_column("pt_1", justify="center")
-        table.add_column("pt_2", justify="center")
-        table.add_column("classes", justify="center")
-        table.add_column("parents", justify="center")
-        table.add_column("equation", justify="center")
-
-        for el in self.lines:
-            pt_1, pt_2 = el.points
-            details = self[el]
-            el_classes = list(self[el].classes.keys())
-            el_ID = get_colored_ID(el, self[el].ID, el_classes)
-            el_parents_text = Text()  # Initialize an empty Text object for parents
-            for parent in details.parents.keys():
-                parent_classes = list(self[parent].classes.keys())
-                el_parents_text.append(
-                    get_colored_ID(parent, self[parent].ID, parent_classes)
-                )
-                el_parents_text.append("\n")
-            table.add_row(
-                el_ID,
-                str(self[pt_1].ID or pt_1),
-                str(self[pt_2].ID or pt_2),
-                "\n".join(el_classes),
-                el_parents_text,
-                str(el.equation()),
-            )
+        table = Table(title="Classes")
+        table.add_column("class", justify="center")
+        table.add_column("size", justify="right")
+        for name, size in sorted(usage["classes"].items(), key=lambda item: -item[1]):
+            table.add_row(name, _kib(size))
+        console.print(table)
 
-        console.print("\n")
+        table = Table(title="Subsystems")
+        table.add_column("subsystem", justify="center")
+        table.add_column("size", justify="right")
+        for name, size in usage["subsystems"].items():
+            table.add_row(name, _kib(size))
         console.print(table)
 
-        # Circles
-        table = Table(title="Circles")
-        table.add_column("ID", style="red", justify="center")
-        table.add_column("pt_ctr", justify="center")
-        table.add_column("pt_rad", justify="center")
-        table.add_column("classes", justify="center")
-        table.add_column("parents", justify="center")
-        table.add_column("equation", justify="center")
-
-        for el in self.circles:
-            pt_1 = el.center
-            pt_2 = self[el].pt_radius
-            #  pt_1, pt_2 = el.points
-            details = self[el]
-            el_classes = list(self[el].classes.keys())
-            el_ID = get_colored_ID(el, self[el].ID, el_classes)
-            el_parents_text = Text()  # Initialize an empty Text object for parents
-            for parent in details.parents.keys():
-                parent_classes = list(self[parent].classes.keys())
-                el_parents_text.append(
-                    get_colored_ID(parent, self[parent].ID, parent_classes)
-                )
-                el_parents_text.append("\n")
-            table.add_row(
-                el_ID,
-                str(self[pt_1].ID or pt_1),
-                str(self[pt_2].ID or pt_2),
-                "\n".join(el_classes),
-                el_parents_text,
-                str(el.equation()),
+        return usage
+
+    def _report_elements(
+        self,
+        types: list[str] | None = None,
+        classes: list[str] | None = None,
+        start: str | None = None,
+        end: str | None = None,
+    ) -> Iterator[tuple[GeometryEntity, Element]]:
+        """Yields the elements selected for a report, in model order.
+
+        Args:
+            types: Only include these element types, such as ``"point"``.
+            classes: Only include elements with at least one of these classes.
+            start: The ID of the first element included.
+            end: The ID of the last element included.
+        """
+        started = start is None
+        for el, details in self.items():
+            if not started:
+                if details.ID != start:
+                    continue
+                started = True
+            if (types is None or element_type(el, details) in types) and (
+                classes is None or any(name in details.classes for name in classes)
+            ):
+                yield el, details
+            if end is not None and details.ID == end:
+                break
+
+    def _parent_IDs(self, details: Element, plain: bool) -> Text | str:
+        """The IDs of an element's parents, one per line."""
+        if plain:
+            return " ".join(str(self[parent].ID) for parent in details.parents)
+        el_parents_text = Text()  # Initialize an empty Text object for parents
+        for parent in details.parents:
+            parent_classes = list(self[parent].classes.keys())
+            el_parents_text.append(
+                get_colored_ID(parent, self[parent].ID, parent_classes)
             )
+            el_parents_text.append("\n")
+        return el_parents_text
+
+    def _element_ID(
+        self, el: GeometryEntity, details: Element, plain: bool
+    ) -> Text | str:
+        if plain:
+            return str(details.ID)
+        return get_colored_ID(el, details.ID, list(details.classes.keys()))
+
+    def report_group_by_type(
+        self,
+        types: list[str] | None = None,
+        classes: list[str] | None = None,
+        start: str | None = None,
+        end: str | None = None,
+        page_size: int | None = None,
+        plain: bool = False,
+        file: TextIO | None = None,
+    ) -> None:
+        """Prints a detailed report of all elements grouped by type.
+        
+        This method iterates through the model's collections of points, lines, and circles, generating separate tables for each type. Each table includes detailed information such as IDs, coordinates/equations, parent dependencies, and associated classes.
 
-        console.print("\n")
-        console.print(table)
+        Rows are rendered as they are produced, a page at a time, so large
+        models start printing at once and never hold the whole report.
+
+        Args:
+            types: Only report these of ``"point"``, ``"line"`` and ``"circle"``.
+            classes: Only report elements with at least one of these classes.
+            start: The ID of the first element reported.
+            end: The ID of the last element reported.
+            page_size: The number of rows in each printed table. Defaults to
+                one table per type.
+            plain: If True, rows are written as tab-separated plain text,
+                skipping rich rendering.
+            file: The stream written to. Defaults to standard output.
+        """
+        console = Console(file=file)
+        if not plain:
+            console.print(f"\nMODEL report: {self.name}")
+        sep = " " if plain else "\n"
+
+        def point_rows() -> Iterator[list]:
+            for el, details in self._report_elements(["point"], classes, start, end):
+                yield [
+                    self._element_ID(el, details, plain),
+                    str(el.x),
+                    str(el.y),
+                    sep.join(details.classes),
+                    self._parent_IDs(details, plain),
+                ]
+
+        def line_rows() -> Iterator[list]:
+            for el, details in self._report_elements(["line"], classes, start, end):
+                pt_1, pt_2 = el.points
+                yield [
+                    self._element_ID(el, details, plain),
+                    str(self[pt_1].ID or pt_1),
+                    str(self[pt_2].ID or pt_2),
+                    sep.join(details.classes),
+                    self._parent_IDs(details, plain),
+                    str(el.equation()),
+                ]
+
+        def circle_rows() -> Iterator[list]:
+            for el, details in self._report_elements(["circle"], classes, start, end):
+                pt_1 = el.center
+                pt_2 = details.pt_radius
+                yield [
+                    self._element_ID(el, details, plain),
+                    str(self[pt_1].ID or pt_1),
+                    str(self[pt_2].ID or pt_2),
+                    sep.join(details.classes),
+                    self._parent_IDs(details, plain),
+                    str(el.equation()),
+                ]
+
+        for name, title, columns, rows in (
+            ("point", "Points", ["ID", "x", "y", "classes", "parents"], point_rows),
+            (
+                "line",
+                "Lines",
+                ["#", "pt_1", "pt_2", "classes", "parents", "equation"],
+                line_rows,
+            ),
+            (
+                "circle",
+                "Circles",
+                ["ID", "pt_ctr", "pt_rad", "classes", "parents", "equation"],
+                circle_rows,
+            ),
+        ):
+            if types is not None and name not in types:
+                continue
+            styles = {"ID": {"style": "red"}} if name == "circle" else {}
+            _print_rows(
+                console,
+                title,
+                [
+                    (column, {"justify": "center", **styles.get(column, {})})
+                    for column in columns
+                ],
+                rows(),
+                page_size,
+                plain,
+                gap=True,
+            )
 
-    def report_sequence(self) -> None:
+    def report_sequence(
+        self,
+        types: list[str] | None = None,
+        classes: list[str] | None = None,
+        start: str | None = None,
+        end: str | None = None,
+        page_size: int | None = None,
+        plain: bool = False,
+        file: TextIO | None = None,
+    ) -> None:
         """Generate a sequential report of the model using rich Console layouts.
         
         This method lists all elements in the order they were added to the model. It presents a comprehensive view including the element's ID, defining points or properties, parents, classes, and algebraic equation, providing a chronological log of the construction.
-        """
-        console = Console()
-
-        console.print(f"\nMODEL report: {self.name}")
-
-        table = Table(title="Sequence", row_styles=["on black", ""])
-
-        table.add_column("ID", style="bold", justify="center")
-        table.add_column("<", justify="center")
-        table.add_column(">", justify="center")
-        table.add_column("classes", justify="center")
-        table.add_column("parents", justify="center")
-        table.add_column("equation", justify="left")
-
-        for el, details in self.items():
-            el_classes = list(details.classes.keys())
-            el_parents_text = Text()  # Initialize an empty Text object for parents
-            #  breakpoint()
-            for parent in details.parents.keys():
-                parent_classes = list(self[parent].classes.keys())
-                el_parents_text.append(
-                    get_colored_ID(parent, self[parent].ID, parent_classes)
-                )
-                el_parents_text.append("\n")
-
-            ID = get_colored_ID(el, details.ID, el_classes)
-            row = [
-                ID,
-                "",
-                "",
-                "\n".join(el_classes),
-                #  el_parents,
-                el_parents_text,
-                "",
-            ]
-            if isinstance(el, spg.Point):
-                row[1] = str(sp.pretty(el.x))
-                row[2] = str(sp.pretty(el.y))
-
-            elif isinstance(el, spg.Line):
-                pt_1, pt_2 = el.points
-                row[1] = str(self[pt_1].ID or pt_1)
-                row[2] = str(self[pt_2].ID or pt_2)
-                row[5] = sp.pretty(el.equation())
-
-            elif isinstance(el, spg.Circle):
-                pt_center = el.center
-                pt_radius = (
-                    details.pt_radius
-                )  # Assuming the radius point is stored in the details
-                row[1] = str(self[pt_center].ID or pt_center)
-                row[2] = str(self[pt_radius].ID or pt_radius)
-                row[5] = sp.pretty(el.equation())
-
-            elif isinstance(el, spg.Segment):
-                pt_1, pt_2 = el.points
-                row[1] = str(self[pt_1].ID or pt_1)
-                row[2] = str(self[pt_2].ID or pt_2)
-
-            elif isinstance(el, spg.Polygon):
-                vertices = ", ".join(str(self[pt].ID or pt) for pt in el.vertices)
-                row[1] = vertices
 
+        Rows are rendered as they are produced, a page at a time, so large
+        models start printing at once and never hold the whole report. The
+        plain text path also skips ``sp.pretty``, which dominates the cost of
+        the rich report.
+
+        Args:
+            types: Only report these element types, such as ``"point"``.
+            classes: Only report elements with at least one of these classes.
+            start: The ID of the first element reported.
+            end: The ID of the last element reported.
+            page_size: The number of rows in each printed table. Defaults to
+                a single table.
+            plain: If True, rows are written as tab-separated plain text,
+                skipping pretty printing and rich rendering.
+            file: The stream written to. Defaults to standard output.
+        """
+        console = Console(file=file)
+        if not plain:
+            console.print(f"\nMODEL report: {self.name}")
+        pretty = str if plain else sp.pretty
+        sep = " " if plain else "\n"
+
+        def rows() -> Iterator[list]:
+            for el, details in self._report_elements(types, classes, start, end):
+                row = [
+                    self._element_ID(el, details, plain),
+                    "",
+                    "",
+                    sep.join(details.classes),
+                    self._parent_IDs(details, plain),
+                    "",
+                ]
+                if isinstance(el, spg.Point):
+                    row[1] = str(pretty(el.x))
+                    row[2] = str(pretty(el.y))
+
+                elif isinstance(el, spg.Line):
+                    pt_1, pt_2 = el.points
+                    row[1] = str(self[pt_1].ID or pt_1)
+                    row[2] = str(self[pt_2].ID or pt_2)
+                    row[5] = pretty(el.equation())
+
+                elif isinstance(el, spg.Circle):
+                    pt_center = el.center
+                    pt_radius = details.pt_radius
+                    row[1] = str(self[pt_center].ID or pt_center)
+                    row[2] = str(self[pt_radius].ID or pt_radius)
+                    row[5] = pretty(el.equation())
+
+                elif isinstance(el, spg.Segment):
+                    pt_1, pt_2 = el.points
+                    row[1] = str(self[pt_1].ID or pt_1)
+                    row[2] = str(self[pt_2].ID or pt_2)
+
+                elif isinstance(el, spg.Polygon):
+                    vertices = ", ".join(str(self[pt].ID or pt) for pt in el.vertices)
+                    row[1] = vertices
+
+                yield row
+
+        _print_rows(
+            console,
+            "Sequence",
+            [
+                ("ID", {"style": "bold", "justify": "center"}),
+                ("<", {"justify": "center"}),
+                (">", {"justify": "center"}),
+                ("classes", {"justify": "center"}),
+                ("parents", {"justify": "center"}),
+                ("equation", {"justify": "left"}),
+            ],
+            rows(),
+            page_size,
+            plain,
+            row_styles=["on black", ""],
+        )
+
+
+def _print_rows(
+    console: Console,
+    title: str,
+    columns: list[tuple[str, dict]],
+    rows: Iterator[list],
+    page_size: int | None,
+    plain: bool,
+    gap: bool = False,
+    row_styles: list[str] | None = None,
+) -> None:
+    """Prints report rows as they are produced, in tables of ``page_size`` rows.
+
+    In plain mode each row is written as a tab-separated line under a single
+    header line, without rich rendering.
+    """
+    if plain:
+        file = console.file
+        file.write(f"# {title}\n")
+        file.write("\t".join(name for name, _ in columns) + "\n")
+        for row in rows:
+            file.write("\t".join(str(cell) for cell in row) + "\n")
+        return
+
+    page = 0
+    while True:
+        chunk = list(islice(rows, page_size)) if page_size else list(rows)
+        if not chunk and page:
+            return
+        page += 1
+        table = Table(
+            title=f"{title} ({page})" if page_size else title, row_styles=row_styles
+        )
+        for name, options in columns:
+            table.add_column(name, **options)
+        for row in chunk:
             table.add_row(*row)
-
+        if gap:
+            console.print("\n")
         console.print(table)
+        if not page_size or len(chunk) < page_size:
+            return
+
+
+def _kib(size: int) -> str:
+    return f"{size / 1024:,.1f} KiB"
 
 
 def get_colored_ID(
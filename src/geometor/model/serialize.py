@@ -10,11 +10,13 @@ import logging
 from typing import TYPE_CHECKING
 
 import sympy as sp
+from sympy.core.operations import AssocOp
 from sympy.parsing.sympy_parser import parse_expr
 
 from .element import CircleElement, Element
 from .polynomials import Polynomial
 from .sections import Section
+from .utils import NUMERIC_DIGITS
 from .wedges import Wedge
 
 if TYPE_CHECKING:
@@ -55,6 +57,8 @@ class SerializeMixin:
                 "parents": [self[p].ID for p in element.parents.keys()],
                 "guide": element.guide,
             }
+            if element.unsimplified:
+                element_data["unsimplified"] = True
             if isinstance(element, CircleElement):
                 element_data["pt_radius"] = self[element.pt_radius].ID
             elif isinstance(element, Polynomial):
@@ -64,6 +68,8 @@ class SerializeMixin:
 
         serializable_model = {
             "name": self.name,
+            "backend": self.backend,
+            "numeric_digits": self.numeric_digits,
             "last_point_id": self.last_point_id,
             "elements": serializable_elements,
         }
@@ -71,6 +77,190 @@ class SerializeMixin:
         with open(file_path, "w") as file:
             json.dump(serializable_model, file, indent=4)
 
+    def __reduce__(self) -> tuple:
+        """Pickle the model through its compact transfer state.
+
+        The default pickling of a dict subclass would carry the logger and the
+        ID generator, which cannot be pickled, and would repeat every shared
+        sub-expression. See :func:`encode_model`.
+        """
+        return (decode_model, (encode_model(self),))
+
+
+def encode_model(model: Model) -> tuple:
+    """Encodes a model as a compact, picklable transfer state.
+
+    Every sympy expression in the model is flattened into a single table of
+    nodes in which each distinct sub-expression - a coordinate shared by a
+    point, its lines and its circles - is stored once. Atoms are stored as
+    themselves and compound expressions as their class and the table indexes
+    of their arguments. Elements keep their IDs, classes and guide flag, with
+    parents and other geometry as references into the table.
+
+    The logger, the ID generator, the analysis hook and any open branch are
+    not encoded; :func:`decode_model` recreates the logger and generator. A
+    quadratic tower keeps its radicands only.
+
+    Args:
+        model: The model to encode.
+
+    Returns:
+        A tuple of plain Python and sympy atom values.
+    """
+    nodes = []
+    index = {}
+
+    def encode_expr(expr: sp.Basic) -> int:
+        # Float(1.0) == Integer(1) in sympy - keep them apart by type
+        lookup = (type(expr), expr)
+        position = index.get(lookup)
+        if position is not None:
+            return position
+        if expr.args:
+            node = (expr.func, tuple(encode_expr(arg) for arg in expr.args))
+        else:
+            node = expr
+        nodes.append(node)
+        position = index[lookup] = len(nodes) - 1
+        return position
+
+    def encode_value(value: object) -> tuple:
+        if isinstance(value, sp.Basic):
+            return ("n", encode_expr(value))
+        if isinstance(value, Section):
+            return ("s", [encode_expr(pt) for pt in value.points])
+        if isinstance(value, Wedge):
+            return ("w", [encode_expr(pt) for pt in value.points], value.direction)
+        if isinstance(value, (list, tuple)):
+            return ("l", [encode_value(item) for item in value])
+        return ("v", value)
+
+    elements = []
+    for element in model.values():
+        attrs = {}
+        for attr, value in _element_attrs(element).items():
+            if attr in ("object", "parents", "classes"):
+                continue
+            attrs[attr] = encode_value(value)
+        elements.append(
+            (
+                type(element),
+                encode_value(element.object),
+                [encode_value(parent) for parent in element.parents],
+                list(element.classes),
+                attrs,
+            )
+        )
+
+    logger = model._logger
+    return (
+        model.name,
+        logger.name if logger else None,
+        model.last_point_id,
+        model._poly_count,
+        nodes,
+        elements,
+        model._simplify_budget,
+        model._tower,
+        model._numeric_digits,
+    )
+
+
+def decode_model(state: tuple) -> Model:
+    """Rebuilds a model from the transfer state made by :func:`encode_model`.
+
+    Shared sub-expressions are rebuilt once, so the decoded model shares
+    them the same way the original did. A new logger and ID generator are
+    created, resuming after the last point ID.
+
+    Args:
+        state: The transfer state.
+
+    Returns:
+        A new :class:`geometor.model.Model` instance.
+    """
+    from geometor.model import Model
+
+    (
+        name,
+        logger_name,
+        last_point_id,
+        poly_count,
+        nodes,
+        elements,
+        budget,
+        tower,
+        numeric_digits,
+    ) = state
+
+    logger = None
+    if logger_name and logger_name != f"geometor.model.{name}":
+        logger = logging.getLogger(logger_name)
+    model = Model(name, logger=logger, numeric_digits=numeric_digits)
+    model.last_point_id = last_point_id
+    model.ID_gen = model.point_ID_generator(last_point_id)
+    model._poly_count = poly_count
+    model._simplify_budget = dict(budget)
+    model._tower = tower
+
+    exprs = []
+    for node in nodes:
+        if isinstance(node, tuple):
+            func, args = node
+            args = [exprs[arg] for arg in args]
+            if issubclass(func, (AssocOp, sp.Pow)):
+                # the arguments are already canonical - rebuild the same tree
+                with sp.evaluate(False):
+                    node = func(*args)
+            else:
+                node = func(*args)
+        exprs.append(node)
+        if isinstance(node, sp.Expr):
+            # the node table is already deduplicated - seed the intern table
+            model._interned[(type(node), node)] = node
+
+    objects = {}
+
+    def decode_value(value: tuple) -> object:
+        tag = value[0]
+        if tag == "n":
+            return exprs[value[1]]
+        if tag in ("s", "w"):
+            points = tuple(exprs[pt] for pt in value[1])
+            if (tag, points) not in objects:
+                if tag == "s":
+                    objects[(tag, points)] = Section(list(points))
+                else:
+                    objects[(tag, points)] = Wedge(list(points), value[2])
+            return objects[(tag, points)]
+        if tag == "l":
+            return [decode_value(item) for item in value[1]]
+        return value[1]
+
+    for cls, key, parents, classes, attrs in elements:
+        element = cls.__new__(cls)
+        element.object = decode_value(key)
+        element.parents = {decode_value(parent): "" for parent in parents}
+        element.classes = {class_name: "" for class_name in classes}
+        for attr, value in attrs.items():
+            setattr(element, attr, decode_value(value))
+        # Bypass the custom __setitem__ - the state is already consistent
+        super(Model, model).__setitem__(element.object, element)
+
+    return model
+
+
+def _element_attrs(element: Element) -> dict[str, object]:
+    """Returns the instance attributes of an element by name, from its slots."""
+    attrs = {}
+    for cls in reversed(type(element).__mro__):
+        for attr in cls.__dict__.get("__slots__", ()):
+            if attr in ("_parents", "_classes") or not hasattr(element, attr):
+                continue
+            attrs[attr] = getattr(element, attr)
+    attrs.update(getattr(element, "__dict__", {}))
+    return attrs
+
 
 def load_model(file_path: str, logger: logging.Logger | None = None) -> Model:
     """Loads a model from a JSON file and returns a new Model instance.
@@ -90,16 +280,19 @@ def load_model(file_path: str, logger: logging.Logger | None = None) -> Model:
     with open(file_path, "r") as file:
         serializable_model = json.load(file)
 
-    model = Model(serializable_model.get("name", ""), logger=logger)
+    model = Model(
+        serializable_model.get("name", ""),
+        logger=logger,
+        backend=serializable_model.get("backend", "sympy"),
+        numeric_digits=serializable_model.get("numeric_digits", NUMERIC_DIGITS),
+    )
 
     # Restore the ID generator state
     last_point_id = serializable_model.get("last_point_id")
     if last_point_id:
         model.last_point_id = last_point_id
-        # Advance the generator to the correct position.
-        for ID in model.ID_gen:
-            if ID == last_point_id:
-                break
+        # Resume the generator after the last generated ID.
+        model.ID_gen = model.point_ID_generator(last_point_id)
 
     id_to_sympy = {}
     id_to_element_data = {}
@@ -125,6 +318,7 @@ def load_model(file_path: str, logger: logging.Logger | None = None) -> Model:
                 parents=parents,
                 pt_radius=pt_radius,
                 guide=element_data.get("guide", False),
+                numeric_digits=model.numeric_digits,
             )
         elif element_data.get("type") == "Polynomial":
             coeffs = [parse_expr(c) for c in element_data["coeffs"]]
@@ -143,7 +337,9 @@ def load_model(file_path: str, logger: logging.Logger | None = None) -> Model:
                 classes=element_data["classes"],
                 parents=parents,
                 guide=element_data.get("guide", False),
+                numeric_digits=model.numeric_digits,
             )
+        element.unsimplified = element_data.get("unsimplified", False)
         # Bypass the custom __setitem__ to avoid triggering intersection searches
         super(Model, model).__setitem__(sympy_obj, element)
 
@@ -0,0 +1,360 @@
+"""Provides a spatial index for viewport queries on the Model class.
+
+This module indexes the points and circles of a model in a uniform grid so a viewer can ask which elements are visible in a rectangle, or which point is nearest the cursor, without evaluating every element. Lines are unbounded, so they are kept beside the grid and tested analytically against the query. The index is built on first use and kept up to date as elements are added and deleted.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING
+
+import sympy.geometry as spg
+
+from geometor.model.bounds import _is_guide
+from geometor.model.utils import point_value
+
+if TYPE_CHECKING:
+    from geometor.model.element import Element
+    from geometor.model.model import GeometryObject
+
+__all__ = ["SpatialIndex", "SpatialMixin"]
+
+#: Circles covering more grid cells than this are kept beside the grid.
+MAX_CELLS = 256
+
+
+class SpatialIndex:
+    """A uniform grid over the points and circles of a model.
+
+    Each point is stored in the cell that contains it and each circle in every cell its bounding box overlaps. Lines, and circles too large for the grid, are kept in separate tables that every query checks.
+
+    Args:
+        cell: The width and height of a grid cell.
+    """
+
+    def __init__(self, cell: float) -> None:
+        self.cell = cell
+        self.cells = {}
+        self.entries = {}
+        self.lines = set()
+        self.large = set()
+        self.span = None
+        self._count = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _index(self, x: float, y: float) -> tuple[int, int]:
+        return math.floor(x / self.cell), math.floor(y / self.cell)
+
+    def _cells(self, box: tuple[float, float, float, float]) -> Iterator[tuple[int, int]]:
+        min_i, min_j = self._index(box[0], box[2])
+        max_i, max_j = self._index(box[1], box[3])
+        for i in range(min_i, max_i + 1):
+            for j in range(min_j, max_j + 1):
+                yield i, j
+
+    def _cell_count(self, box: tuple[float, float, float, float]) -> int:
+        min_i, min_j = self._index(box[0], box[2])
+        max_i, max_j = self._index(box[1], box[3])
+        return (max_i - min_i + 1) * (max_j - min_j + 1)
+
+    def add(
+        self,
+        key: GeometryObject,
+        element: Element,
+        ends: tuple[tuple, tuple] | None = None,
+    ) -> None:
+        """Add a point, line or circle to the index. Other keys are ignored.
+
+        Args:
+            key: The model key.
+            element: The element of the key.
+            ends: For a line, the numeric ``(x, y)`` of its two defining
+                points. Evaluated from the line if not given.
+        """
+        if key in self.entries:
+            self.remove(key)
+
+        if isinstance(key, spg.Point):
+            x, y = (float(value) for value in element.numeric)
+            data = ("point", (x, y))
+            box = (x, x, y, y)
+        elif isinstance(key, spg.Circle):
+            x, y, radius = (float(value) for value in element.numeric)
+            data = ("circle", (x, y, radius))
+            box = (x - radius, x + radius, y - radius, y + radius)
+        elif isinstance(key, spg.Line):
+            (x1, y1), (x2, y2) = ends or (point_value(key.p1), point_value(key.p2))
+            a, b = float(y2 - y1), float(x1 - x2)
+            c = float(x2 * y1 - x1 * y2)
+            norm = math.hypot(a, b)
+            data = ("line", (a / norm, b / norm, c / norm))
+            box = None
+        else:
+            return
+
+        self._count += 1
+        self.entries[key] = (self._count, data, box)
+        if box is None:
+            self.lines.add(key)
+        elif self._cell_count(box) > MAX_CELLS:
+            self.large.add(key)
+        else:
+            for cell in self._cells(box):
+                self.cells.setdefault(cell, set()).add(key)
+            min_i, min_j = self._index(box[0], box[2])
+            max_i, max_j = self._index(box[1], box[3])
+            if self.span is None:
+                self.span = [min_i, max_i, min_j, max_j]
+            else:
+                span = self.span
+                span[0], span[1] = min(span[0], min_i), max(span[1], max_i)
+                span[2], span[3] = min(span[2], min_j), max(span[3], max_j)
+
+    def remove(self, key: GeometryObject) -> None:
+        """Remove a key from the index, if it is indexed."""
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+        box = entry[2]
+        if box is None:
+            self.lines.discard(key)
+        elif key in self.large:
+            self.large.discard(key)
+        else:
+            for cell in self._cells(box):
+                keys = self.cells[cell]
+                keys.discard(key)
+                if not keys:
+                    del self.cells[cell]
+
+    def query_rect(
+        self, x_min: float, x_max: float, y_min: float, y_max: float
+    ) -> list[GeometryObject]:
+        """Returns the keys of the elements that cross a rectangle, in the order added.
+
+        A point crosses the rectangle when it lies inside it or on its edge;
+        a line or circle when its curve passes through it.
+        """
+        box = (x_min, x_max, y_min, y_max)
+        if self._cell_count(box) > len(self.entries):
+            candidates = set(self.entries) - self.lines - self.large
+        else:
+            candidates = set()
+            for cell in self._cells(box):
+                candidates.update(self.cells.get(cell, ()))
+        candidates.update(self.lines, self.large)
+
+        found = []
+        for key in candidates:
+            order, (kind, values), _ = self.entries[key]
+            if kind == "point":
+                x, y = values
+                hit = x_min <= x <= x_max and y_min <= y <= y_max
+            elif kind == "circle":
+                x, y, radius = values
+                near = math.hypot(
+                    max(x_min - x, 0, x - x_max), max(y_min - y, 0, y - y_max)
+                )
+                far = math.hypot(
+                    max(abs(x - x_min), abs(x - x_max)),
+                    max(abs(y - y_min), abs(y - y_max)),
+                )
+                hit = near <= radius <= far
+            else:
+                a, b, c = values
+                sides = [a * cx + b * cy + c for cx in box[:2] for cy in box[2:]]
+                hit = min(sides) <= 0 <= max(sides)
+            if hit:
+                found.append((order, key))
+        return [key for _, key in sorted(found, key=lambda item: item[0])]
+
+    def distance(self, key: GeometryObject, x: float, y: float) -> float:
+        """Returns the distance from ``(x, y)`` to an indexed point, line or circle."""
+        _, (kind, values), _ = self.entries[key]
+        if kind == "point":
+            return math.hypot(values[0] - x, values[1] - y)
+        if kind == "circle":
+            return abs(math.hypot(values[0] - x, values[1] - y) - values[2])
+        a, b, c = values
+        return abs(a * x + b * y + c)
+
+    def nearest(
+        self,
+        x: float,
+        y: float,
+        k: int = 1,
+        accept: Callable[[GeometryObject], bool] | None = None,
+    ) -> list[GeometryObject]:
+        """Returns the keys of the ``k`` elements nearest ``(x, y)``, nearest first.
+
+        The grid is searched in rings of cells around the query, stopping once
+        no unvisited cell can hold anything nearer than the ``k`` found.
+
+        Args:
+            x: The x coordinate of the query.
+            y: The y coordinate of the query.
+            k: The number of keys to return.
+            accept: A filter on the keys considered.
+        """
+        best = []
+        seen = set()
+
+        def consider(keys: set) -> None:
+            for key in keys:
+                if key in seen:
+                    continue
+                seen.add(key)
+                if accept is not None and not accept(key):
+                    continue
+                item = (-self.distance(key, x, y), -self.entries[key][0], key)
+                if len(best) < k:
+                    heapq.heappush(best, item)
+                elif item[:2] > best[0][:2]:
+                    heapq.heapreplace(best, item)
+
+        consider(self.lines)
+        consider(self.large)
+
+        if self.span is not None and k > 0:
+            qi, qj = self._index(x, y)
+            min_i, max_i, min_j, max_j = self.span
+            # rings outside the occupied cells are empty
+            ring = max(0, min_i - qi, qi - max_i, min_j - qj, qj - max_j)
+            last = max(qi - min_i, max_i - qi, qj - min_j, max_j - qj)
+            while ring <= last:
+                for i in range(qi - ring, qi + ring + 1):
+                    step = 1 if abs(i - qi) == ring else 2 * ring
+                    for j in range(qj - ring, qj + ring + 1, max(step, 1)):
+                        keys = self.cells.get((i, j))
+                        if keys:
+                            consider(keys)
+                # anything unvisited is at least a ring of cells away
+                if len(best) == k and -best[0][0] <= ring * self.cell:
+                    break
+                ring += 1
+
+        ordered = sorted(best, key=lambda item: (-item[0], -item[1]))
+        return [key for _, _, key in ordered]
+
+
+class SpatialMixin:
+    """Mixin for the Model class providing viewport queries over a :class:`SpatialIndex`."""
+
+    def _spatial_add(self, key: GeometryObject, element: Element) -> None:
+        """Add an element to the spatial index, with the cached values of line points."""
+        ends = None
+        if isinstance(key, spg.Line) and key.p1 in self and key.p2 in self:
+            ends = self[key.p1].numeric, self[key.p2].numeric
+        self._spatial.add(key, element, ends)
+
+    @property
+    def spatial_index(self) -> SpatialIndex:
+        """The spatial index of the model, built on first use.
+
+        The grid is sized from the :meth:`limits` of the model, and rebuilt
+        with a finer cell when the model has grown well past the size it was
+        built for.
+        """
+        index = self._spatial
+        if index is not None and len(index) <= 4 * self._spatial_size + 64:
+            return index
+
+        keys = [
+            key
+            for key in self
+            if isinstance(key, (spg.Point, spg.Line, spg.Circle))
+        ]
+        points = sum(isinstance(key, spg.Point) for key in keys)
+        try:
+            (x_min, x_max), (y_min, y_max) = self.limits()
+            extent = max(x_max - x_min, y_max - y_min)
+        except ValueError:
+            extent = 0.0
+        cell = extent / math.sqrt(points) if extent > 0 and points else 1.0
+
+        index = SpatialIndex(cell)
+        self._spatial = index
+        for key in keys:
+            self._spatial_add(key, self[key])
+        self._spatial_size = len(index)
+        return index
+
+    def _spatial_filter(
+        self, classes: list[str] | None, guides: bool
+    ) -> Callable[[GeometryObject], bool] | None:
+        if classes is None and guides:
+            return None
+        classes = set(classes) if classes else None
+
+        def accept(key: GeometryObject) -> bool:
+            element = self[key]
+            if not guides and _is_guide(element):
+                return False
+            return classes is None or not classes.isdisjoint(element.classes)
+
+        return accept
+
+    def query_rect(
+        self,
+        x_range: tuple[float, float],
+        y_range: tuple[float, float],
+        classes: list[str] | None = None,
+        guides: bool = True,
+    ) -> list[GeometryObject]:
+        """Find the points, lines and circles visible in a rectangle.
+
+        The ranges take the form returned by :meth:`limits`, so
+        ``model.query_rect(*model.limits())`` returns every point and circle.
+
+        Args:
+            x_range: ``(x_min, x_max)`` of the rectangle.
+            y_range: ``(y_min, y_max)`` of the rectangle.
+            classes: Only include elements with at least one of these classes.
+            guides: Whether to include guide elements.
+
+        Returns:
+            A list of model keys, in model order.
+        """
+        keys = self.spatial_index.query_rect(*x_range, *y_range)
+        accept = self._spatial_filter(classes, guides)
+        if accept is not None:
+            keys = [key for key in keys if accept(key)]
+        return keys
+
+    def nearest(
+        self,
+        x: float,
+        y: float,
+        k: int = 1,
+        structs: bool = False,
+        classes: list[str] | None = None,
+        guides: bool = True,
+    ) -> list[GeometryObject]:
+        """Find the elements nearest a location, such as the cursor.
+
+        Args:
+            x: The x coordinate of the location.
+            y: The y coordinate of the location.
+            k: The number of elements to return.
+            structs: If True, lines and circles are included, measured by the
+                distance to their curve. By default only points are searched.
+            classes: Only include elements with at least one of these classes.
+            guides: Whether to include guide elements.
+
+        Returns:
+            A list of up to ``k`` model keys, nearest first.
+        """
+        accept = self._spatial_filter(classes, guides)
+        if not structs:
+            accept_point = accept
+
+            def accept(key: GeometryObject) -> bool:
+                if not isinstance(key, spg.Point):
+                    return False
+                return accept_point is None or accept_point(key)
+
+        return self.spatial_index.nearest(float(x), float(y), k, accept)
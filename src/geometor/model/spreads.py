@@ -0,0 +1,179 @@
+"""Provides a model-wide spread index for the Model class.
+
+This module computes the rational-trigonometry spread of every pair of lines in a single vectorized pass. Pairs are bucketed by tolerance and confirmed exactly, giving families of parallel, perpendicular and equal-spread lines that reveal regular polygon structure in large constructions.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import sympy as sp
+import sympy.geometry as spg
+from rich.table import Table
+
+from geometor.model.colors import COLORS
+from geometor.model.utils import (
+    clean_expr,
+    group_equal_exprs,
+    spread,
+    tolerance_buckets,
+)
+
+__all__ = ["SpreadsMixin", "SpreadIndex", "SpreadFamily"]
+
+
+class SpreadsMixin:
+    """Mixin for the Model class containing spread analysis.
+
+    This mixin adds :meth:`spread_index`, which classifies every pair of lines in the model by the spread between them.
+    """
+
+    def spread_index(
+        self,
+        lines: list[spg.Line] | None = None,
+        tolerance: float = 1e-9,
+        min_size: int = 2,
+    ) -> SpreadIndex:
+        """Build an index of the spreads between all pairs of lines.
+
+        The line normals are evaluated once in float64, and the spread of
+        every pair is the squared cross product of the unit normals. The pair
+        spreads are bucketed with :func:`geometor.model.utils.tolerance_buckets`
+        and each bucket is confirmed exactly with :func:`geometor.model.utils.spread`.
+
+        Args:
+            lines: The lines to index. If None, all lines of the model are used.
+            tolerance: The relative gap that separates two buckets.
+            min_size: The minimum number of pairs for an equal-spread family to
+                be reported. Parallel and perpendicular pairs are always kept.
+
+        Returns:
+            The :class:`SpreadIndex` for the lines.
+        """
+        if lines is None:
+            lines = self.lines
+
+        index = SpreadIndex(lines, tolerance, min_size)
+
+        self.log(
+            f"[{COLORS['line']} bold]spreads[/{COLORS['line']} bold] : {len(index.families)}"
+        )
+        table = Table(show_header=False, box=None, padding=(0, 4))
+        for family in index.families:
+            table.add_row(
+                f"    {len(family)}:", f"[cyan]{sp.pretty(family.spread)}[/cyan]"
+            )
+        self.log(table)
+
+        return index
+
+
+class SpreadIndex:
+    """The spreads between all pairs of a set of lines.
+
+    Args:
+        lines: The lines to index.
+        tolerance: The relative gap that separates two buckets.
+        min_size: The minimum number of pairs for an equal-spread family.
+    """
+
+    def __init__(
+        self, lines: list[spg.Line], tolerance: float = 1e-9, min_size: int = 2
+    ) -> None:
+        self.lines = list(lines)
+        #: The numerical spread of each pair of lines, as a square matrix.
+        self.spreads = numerical_spreads(self.lines)
+        #: The confirmed equal-spread families, in ascending order of spread.
+        self.families = []
+
+        count = len(self.lines)
+        first, second = np.triu_indices(count, k=1)
+        values = self.spreads[first, second]
+
+        for bucket in tolerance_buckets(values, tolerance):
+            boundary = abs(values[bucket[0]]) <= tolerance or (
+                abs(values[bucket[-1]] - 1) <= tolerance
+            )
+            if len(bucket) < min_size and not boundary:
+                continue
+
+            pairs = [(self.lines[first[i]], self.lines[second[i]]) for i in bucket]
+            exact = [spread(l1, l2) for l1, l2 in pairs]
+
+            for group in group_equal_exprs(exact):
+                value = clean_expr(exact[group[0]])
+                if len(group) < min_size and value not in (0, 1):
+                    continue
+                self.families.append(SpreadFamily(value, [pairs[i] for i in group]))
+
+    def family(self, value: sp.Expr) -> SpreadFamily | None:
+        """Returns the family with the given exact spread, if any."""
+        for family in self.families:
+            if family.spread == value:
+                return family
+        return None
+
+    @property
+    def parallel(self) -> list[list[spg.Line]]:
+        """Groups of mutually parallel lines (spread 0)."""
+        family = self.family(sp.Integer(0))
+        if family is None:
+            return []
+
+        # parallel lines form equivalence classes - merge the pairs
+        groups = {}
+        for l1, l2 in family.pairs:
+            group_1 = groups.get(l1, [l1])
+            group_2 = groups.get(l2, [l2])
+            if group_1 is group_2:
+                continue
+            group_1.extend(group_2)
+            for line in group_1:
+                groups[line] = group_1
+
+        unique = {id(group): group for group in groups.values()}
+        return list(unique.values())
+
+    @property
+    def perpendicular(self) -> list[tuple[spg.Line, spg.Line]]:
+        """Pairs of perpendicular lines (spread 1)."""
+        family = self.family(sp.Integer(1))
+        return family.pairs if family else []
+
+
+class SpreadFamily:
+    """A set of line pairs with the same spread.
+
+    Args:
+        spread: The exact spread shared by every pair.
+        pairs: The line pairs in the family.
+    """
+
+    def __init__(self, spread: sp.Expr, pairs: list[tuple[spg.Line, spg.Line]]) -> None:
+        self.spread = spread
+        self.pairs = pairs
+
+    def __len__(self) -> int:
+        return len(self.pairs)
+
+    def __repr__(self) -> str:
+        return f"SpreadFamily({self.spread}, {len(self)} pairs)"
+
+
+def numerical_spreads(lines: list[spg.Line]) -> np.ndarray:
+    """Returns the float64 spread of every pair of lines as a square matrix.
+
+    Args:
+        lines: The lines to compare.
+
+    Returns:
+        A symmetric ``(n, n)`` array of spreads.
+    """
+    normals = np.array(
+        [[float(coef) for coef in line.coefficients[:2]] for line in lines],
+        dtype=np.float64,
+    ).reshape(-1, 2)
+    normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+    cross = np.outer(normals[:, 0], normals[:, 1]) - np.outer(
+        normals[:, 1], normals[:, 0]
+    )
+    return cross * cross
@@ -7,16 +7,30 @@ This module collects general-purpose utility functions used throughout the packa
 import datetime
 import logging
 import os as os
+import signal
+import threading
 from timeit import default_timer as timer
 
+import mpmath
+import numpy as np
 import sympy as sp
 import sympy.geometry as spg
 from rich import print
 
 __all__ = [
     "clean_expr",
+    "clean_expr_checked",
+    "intern_expr",
+    "classify_lengths",
+    "tolerance_buckets",
+    "group_equal_exprs",
     "spread",
+    "exact_sign",
     "compare_points",
+    "PointKey",
+    "numeric_value",
+    "numeric_coords",
+    "numerically_distinct",
     "point_value",
     "sort_points",
     "log_init",
@@ -43,6 +57,245 @@ def clean_expr(expr: sp.Expr) -> sp.Expr:
     return expr
 
 
+def intern_expr(expr: sp.Expr, table: dict) -> sp.Expr:
+    """Returns the shared instance of an expression from an intern table.
+
+    The expression is interned bottom up, so equal sub-expressions are
+    shared too - the ``sqrt(5)`` in ``1/2 + sqrt(5)/2`` is the same object as
+    every other ``sqrt(5)`` in the table. Interned expressions compare and
+    hash by identity first, which makes them cheap keys for deduplication.
+
+    Entries are keyed by type as well as value, so numbers like ``2`` and
+    ``2.0`` are kept apart.
+
+    Args:
+        expr: The expression to intern.
+        table: The intern table, updated in place.
+
+    Returns:
+        The shared instance.
+    """
+    key = (type(expr), expr)
+    shared = table.get(key)
+    if shared is not None:
+        return shared
+
+    if expr.args:
+        args = tuple(intern_expr(arg, table) for arg in expr.args)
+        if any(new is not old for new, old in zip(args, expr.args)):
+            if isinstance(expr, (sp.core.operations.AssocOp, sp.Pow)):
+                # the arguments are already canonical - rebuild the same tree
+                with sp.evaluate(False):
+                    expr = expr.func(*args)
+            else:
+                expr = expr.func(*args)
+
+    table[key] = expr
+    return expr
+
+
+class _SimplifyTimeout(Exception):
+    pass
+
+
+def clean_expr_checked(
+    expr: sp.Expr, seconds: float | None = None, ops: int | None = None
+) -> tuple[sp.Expr, bool]:
+    """Simplify and denest SymPy expressions within a budget.
+
+    This is :func:`clean_expr` with a limit on the work done. An expression
+    with more than ``ops`` operations is not simplified at all, and
+    simplification is interrupted after ``seconds``. Either way the result is
+    still exact - it is just not in its simplest form.
+
+    The time limit uses ``SIGALRM``, so it only applies in the main thread on
+    platforms with :func:`signal.setitimer`, and not while another interval
+    timer is running. Elsewhere only the operation limit applies.
+
+    Args:
+        expr: The SymPy expression to clean.
+        seconds: The time allowed, or None for no limit.
+        ops: The largest :func:`sympy.count_ops` to simplify, or None for no limit.
+
+    Returns:
+        The expression, as far as it was simplified, and whether it was
+        simplified completely.
+    """
+    if ops is not None and sp.count_ops(expr) > ops:
+        return expr, False
+
+    if (
+        not seconds
+        or not hasattr(signal, "setitimer")
+        or threading.current_thread() is not threading.main_thread()
+        or signal.getitimer(signal.ITIMER_REAL)[0]
+    ):
+        return clean_expr(expr), True
+
+    state = {"active": True}
+
+    def interrupt(signum: int, frame: object) -> None:
+        if state["active"]:
+            raise _SimplifyTimeout
+
+    previous = signal.signal(signal.SIGALRM, interrupt)
+    try:
+        signal.setitimer(signal.ITIMER_REAL, seconds)
+        expr = sp.simplify(expr)
+        expr = sp.sqrtdenest(expr)
+        state["active"] = False
+        return expr, True
+    except _SimplifyTimeout:
+        # keep the simplified form if only the denesting ran out of time
+        return expr, False
+    finally:
+        state["active"] = False
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def classify_lengths(
+    lengths: list[sp.Expr],
+    values: list[float] | None = None,
+    tolerance: float = 1e-9,
+) -> list[int]:
+    """Group lengths into classes of equal value.
+
+    The lengths are sorted by numerical value and each is compared with the
+    first member of the classes whose values are within ``tolerance``
+    (relative to their magnitude) - values further apart are distinct.
+    Identical floats are taken as equal, and only the borderline values in
+    between are confirmed with an exact symbolic comparison. Lengths that are
+    symbolically equal but evaluate slightly differently share a class, and
+    since every member is checked against the same representative, a chain
+    of small gaps does not merge distinct lengths.
+
+    Args:
+        lengths: The symbolic lengths to classify.
+        values: The numerical values of the lengths, if already evaluated.
+        tolerance: The relative distance below which values are compared
+            exactly.
+
+    Returns:
+        The class index of each length, with classes numbered in ascending
+        order of value.
+    """
+    if values is None:
+        values = [float(length.evalf()) for length in lengths]
+
+    order = sorted(range(len(values)), key=values.__getitem__)
+    classes = [0] * len(values)
+    representatives = []
+    for index in order:
+        value = values[index]
+        floor = value - tolerance * max(1.0, abs(value))
+        current = None
+        for candidate in reversed(range(len(representatives))):
+            first = representatives[candidate]
+            if values[first] < floor:
+                break
+            if _equal_lengths(
+                lengths[first], lengths[index], values[first], value, tolerance
+            ):
+                current = candidate
+                break
+        if current is None:
+            current = len(representatives)
+            representatives.append(index)
+        classes[index] = current
+
+    return classes
+
+
+def _equal_lengths(
+    l1: sp.Expr, l2: sp.Expr, v1: float, v2: float, tolerance: float
+) -> bool:
+    """Compare two lengths numerically, falling back to an exact check when close."""
+    if v1 == v2:
+        return True
+    if abs(v1 - v2) > tolerance * max(1.0, abs(v1), abs(v2)):
+        return False
+    return clean_expr(l1 - l2) == 0
+
+
+def exact_sign(expr: sp.Expr, tolerance: float = 1e-9) -> int:
+    """Returns the sign of a real expression, exactly.
+
+    The expression is evaluated numerically, and only a value within
+    ``tolerance`` of zero is cleaned with :func:`clean_expr` to confirm it is
+    zero, or evaluated again at higher precision to find its sign.
+
+    Args:
+        expr: The expression.
+        tolerance: The distance from zero below which the value is checked
+            exactly.
+
+    Returns:
+        -1, 0 or 1.
+    """
+    value = float(expr.evalf())
+    if abs(value) > tolerance:
+        return 1 if value > 0 else -1
+    if clean_expr(expr) == 0:
+        return 0
+    value = expr.evalf(50)
+    return 1 if value > 0 else -1
+
+
+def tolerance_buckets(values: np.ndarray, tolerance: float = 1e-9) -> list[np.ndarray]:
+    """Bucket numerical values that lie within a tolerance of each other.
+
+    The values are sorted and split wherever the gap between neighbours
+    exceeds ``tolerance`` (relative to their magnitude).
+
+    Args:
+        values: A one-dimensional array of values.
+        tolerance: The relative gap that separates two buckets.
+
+    Returns:
+        A list of index arrays into ``values``, one per bucket, in ascending
+        order of value.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if not values.size:
+        return []
+    order = np.argsort(values, kind="stable")
+    ordered = values[order]
+    scale = np.maximum(1.0, np.abs(ordered[1:]))
+    breaks = np.flatnonzero(np.diff(ordered) > tolerance * scale) + 1
+    return np.split(order, breaks)
+
+
+def group_equal_exprs(exprs: list[sp.Expr]) -> list[list[int]]:
+    """Group expressions that are exactly equal.
+
+    Structurally identical expressions are grouped by hashing, then the
+    distinct forms are merged when their difference cleans to zero. Intended
+    for the members of a :func:`tolerance_buckets` bucket, where almost all
+    candidates are equal.
+
+    Args:
+        exprs: The expressions to group.
+
+    Returns:
+        A list of index lists into ``exprs``, one per group of equal values.
+    """
+    forms = {}
+    for index, expr in enumerate(exprs):
+        forms.setdefault(expr, []).append(index)
+
+    groups = []
+    for expr, indices in forms.items():
+        for representative, members in groups:
+            if clean_expr(representative - expr) == 0:
+                members.extend(indices)
+                break
+        else:
+            groups.append((expr, indices))
+
+    return [sorted(members) for _, members in groups]
+
+
 def spread(l1: spg.Line, l2: spg.Line) -> sp.Expr:
     """Calculate the spread of two lines.
     
@@ -55,17 +308,127 @@ def spread(l1: spg.Line, l2: spg.Line) -> sp.Expr:
     Returns:
         The spread as a symbolic expression.
     """
-    a1, a2, a3 = l1.coefficients
-    b1, b2, b3 = l2.coefficients
-    # only the first two coefficients are used
-    spread = ((a1 * b2 - a2 * b1) ** 2) / ((a1**2 + b1**2) * (a2**2 + b2**2))
+    a1, a2, _ = l1.coefficients
+    b1, b2, _ = l2.coefficients
+    spread = ((a1 * b2 - a2 * b1) ** 2) / ((a1**2 + a2**2) * (b1**2 + b2**2))
     return spread
 
 
+#: Default decimal digits of the cached numeric values of points and circles.
+NUMERIC_DIGITS = 30
+
+
+def numeric_value(expr: sp.Expr, digits: int = NUMERIC_DIGITS) -> mpmath.mpf:
+    """Returns the value of a real expression at ``digits`` precision.
+
+    Args:
+        expr: The expression to evaluate.
+        digits: The number of decimal digits.
+
+    Returns:
+        An :class:`mpmath.mpf`, which compares exactly with other ``mpf`` and floats.
+    """
+    value = sp.Float(expr.evalf(digits), digits)
+    with mpmath.workdps(digits):
+        return mpmath.mpf(value._mpf_)
+
+
+def numerically_distinct(
+    values_1: tuple[mpmath.mpf, ...], values_2: tuple[mpmath.mpf, ...]
+) -> bool:
+    """Whether two tuples of cached numeric values certainly differ.
+
+    Values closer than a relative ``1e-12`` are not distinct - they may be
+    exactly equal and need an exact check.
+
+    Args:
+        values_1: Values from :func:`numeric_coords`.
+        values_2: Values from :func:`numeric_coords`.
+
+    Returns:
+        True if some pair of values is clearly apart.
+    """
+    return any(
+        abs(v1 - v2) > 1e-12 * max(1, abs(v1), abs(v2))
+        for v1, v2 in zip(values_1, values_2)
+    )
+
+
+def numeric_coords(
+    obj: object, digits: int = NUMERIC_DIGITS
+) -> tuple[mpmath.mpf, ...] | None:
+    """Returns the numeric values of a point or circle.
+
+    Args:
+        obj: A model key.
+        digits: The number of decimal digits.
+
+    Returns:
+        ``(x, y)`` for a point, ``(x, y, radius)`` for a circle, otherwise None.
+    """
+    if isinstance(obj, spg.Point):
+        return numeric_value(obj.x, digits), numeric_value(obj.y, digits)
+    if isinstance(obj, spg.Circle):
+        center = obj.center
+        return (
+            numeric_value(center.x, digits),
+            numeric_value(center.y, digits),
+            numeric_value(obj.radius, digits),
+        )
+    return None
+
+
+def _compare_values(v1: float, v2: float, e1: sp.Expr, e2: sp.Expr) -> int:
+    """Compare two coordinates by value, checking near ties exactly."""
+    if abs(v1 - v2) > 1e-12 * max(1, abs(v1), abs(v2)):
+        return 1 if v1 > v2 else -1
+    if e1 == e2:
+        return 0
+    return exact_sign(e1 - e2)
+
+
+class PointKey:
+    """A sort key for a point, built once from its numeric values.
+
+    Keys order points by x and then y. Coordinates are compared as floats,
+    and only those closer than a relative ``1e-12`` - which may be equal -
+    are compared exactly.
+
+    Args:
+        pt: The point.
+        values: The point's numeric ``(x, y)``, such as ``model[pt].numeric``.
+            Evaluated from the point if not given.
+    """
+
+    __slots__ = ("pt", "x", "y")
+
+    def __init__(
+        self, pt: spg.Point, values: tuple[mpmath.mpf, mpmath.mpf] | None = None
+    ) -> None:
+        self.pt = pt
+        self.x, self.y = (float(value) for value in values or point_value(pt))
+
+    def compare(self, other: "PointKey") -> int:
+        """Returns -1, 0 or 1 as this point sorts before, with or after another."""
+        return _compare_values(
+            self.x, other.x, self.pt.x, other.pt.x
+        ) or _compare_values(self.y, other.y, self.pt.y, other.pt.y)
+
+    def __lt__(self, other: "PointKey") -> bool:
+        return self.compare(other) < 0
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PointKey):
+            return NotImplemented
+        return self.compare(other) == 0
+
+    __hash__ = None
+
+
 def compare_points(pt1: spg.Point, pt2: spg.Point) -> int:
     """Compare two points for sorting.
     
-    This comparison function orders points primarily by their x-coordinates and secondarily by their y-coordinates. It returns 1 if pt1 > pt2, -1 if pt1 < pt2, and 0 if they are equal.
+    This comparison function orders points primarily by their x-coordinates and secondarily by their y-coordinates. It returns 1 if pt1 > pt2, -1 if pt1 < pt2, and 0 if they are equal. Numeric values of the points are compared, and only coordinates that tie at that precision are compared exactly - see :class:`PointKey`.
 
     Args:
         pt1: The first point.
@@ -74,47 +437,46 @@ def compare_points(pt1: spg.Point, pt2: spg.Point) -> int:
     Returns:
         An integer indicating the relative order (-1, 0, 1).
     """
-    if pt1.x.evalf() > pt2.x.evalf():
-        return 1
-    elif pt1.x.evalf() < pt2.x.evalf():
-        return -1
-    else:
-        if pt1.y.evalf() > pt2.y.evalf():
-            return 1
-        elif pt1.y.evalf() < pt2.y.evalf():
-            return -1
-        else:
-            return 0
+    return PointKey(pt1).compare(PointKey(pt2))
 
 
-def point_value(pt: spg.Point) -> tuple[float, float]:
+def point_value(
+    pt: spg.Point, digits: int = NUMERIC_DIGITS
+) -> tuple[mpmath.mpf, mpmath.mpf]:
     """Get the numerical coordinates of a point.
     
-    This helper extracts the floating-point values of a point's x and y coordinates, suitable for use in sorting keys or numerical comparisons.
+    This helper evaluates the high-precision values of a point's x and y coordinates. Points of a model already hold them, as ``model[pt].numeric``.
 
     Args:
         pt: The point to evaluate.
+        digits: The number of decimal digits.
 
     Returns:
-        A tuple of (x, y) floats.
+        A tuple of (x, y) :class:`mpmath.mpf` values.
     """
-    #  return pt.x.evalf()
-    return (pt.x.evalf(), pt.y.evalf())
+    return numeric_value(pt.x, digits), numeric_value(pt.y, digits)
 
 
-def sort_points(pts: list[spg.Point]) -> list[spg.Point]:
+def sort_points(
+    pts: list[spg.Point], values: list[tuple] | None = None
+) -> list[spg.Point]:
     """Sort a list of points.
     
-    This function sorts a list of points using the `point_value` helper as the key.
+    This function sorts a list of points by their :class:`PointKey`, built once per point, so it works from numeric values and only falls back to exact comparison for ties.
 
     Args:
         pts: The list of points to sort.
+        values: The numeric ``(x, y)`` of each point, such as
+            ``model[pt].numeric``. Evaluated from the points if not given.
 
     Returns:
         The sorted list of points.
     """
-    #  return sorted(list(pts), key=point_value)
-    return sorted(pts, key=point_value)
+    if values is None:
+        keys = [PointKey(pt) for pt in pts]
+    else:
+        keys = [PointKey(pt, value) for pt, value in zip(pts, values)]
+    return [key.pt for key in sorted(keys)]
 
 
 def log_init(name: str) -> None:
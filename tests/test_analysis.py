@@ -0,0 +1,52 @@
+import sympy as sp
+
+from geometor.model import Model
+
+
+def set_square(model):
+    return [
+        model.set_point(0, 0, classes=["given"]),
+        model.set_point(1, 0, classes=["given"]),
+        model.set_point(1, 1, classes=["given"]),
+        model.set_point(0, 1, classes=["given"]),
+    ]
+
+
+def test_find_equal_lengths_classifies_point_pairs():
+    model = Model("lengths")
+    A, B, C, D = set_square(model)
+    existing = model.set_segment(A, B)
+
+    length_classes = model.find_equal_lengths()
+
+    assert [len(length_class) for length_class in length_classes] == [4, 2]
+    sides, diagonals = length_classes
+    assert sides.length == 1
+    assert diagonals.quadrance == 2
+    assert diagonals.length == sp.sqrt(2)
+    assert existing in sides.segments
+
+
+def test_find_equal_lengths_can_add_segments():
+    model = Model("lengths")
+    set_square(model)
+
+    model.find_equal_lengths(set_segments=True, classes=["equal"])
+
+    segments = [el for el in model if isinstance(el, sp.Segment)]
+    assert len(segments) == 6
+    assert all("equal" in model[segment].classes for segment in segments)
+
+
+def test_spread_index_groups_line_pairs():
+    model = Model("spreads")
+    A, B, C, D = set_square(model)
+    for pt_1, pt_2 in [(A, B), (B, C), (C, D), (D, A), (A, C), (B, D)]:
+        model.construct_line(pt_1, pt_2)
+
+    index = model.spread_index()
+
+    assert sorted(len(group) for group in index.parallel) == [2, 2]
+    assert len(index.perpendicular) == 5
+    assert len(index.family(sp.Rational(1, 2))) == 8
+    assert index.spreads.shape == (6, 6)
@@ -0,0 +1,59 @@
+import json
+
+from geometor.model.batch import find_jobs, run_batch
+
+SCRIPT = """
+from geometor.model import Model
+
+model = Model("script")
+A = model.set_point(0, 0, classes=["given"])
+B = model.set_point(1, 0, classes=["given"])
+model.construct_circle(A, B)
+model.construct_circle(B, A)
+model.save("script.json")
+"""
+
+JOURNAL = """
+* 0, 0
+* 1, 0
+[ A B ]
+( A B )
+exit
+"""
+
+
+def test_batch_isolates_failures(tmp_path):
+    jobs = tmp_path / "jobs"
+    jobs.mkdir()
+    (jobs / "script.py").write_text(SCRIPT)
+    (jobs / "journal.txt").write_text(JOURNAL)
+    (jobs / "broken.py").write_text("raise RuntimeError('bad construction')\n")
+    (jobs / "stuck.py").write_text("while True:\n    pass\n")
+    (jobs / "notes.md").write_text("not a job\n")
+
+    paths = find_jobs(jobs)
+    assert [path.name for path in paths] == [
+        "broken.py",
+        "journal.txt",
+        "script.py",
+        "stuck.py",
+    ]
+
+    output = tmp_path / "batch"
+    summary = run_batch(paths, output, workers=2, timeout=5)
+
+    records = {record["job"]: record for record in summary["jobs"]}
+    assert records["broken.py"]["status"] == "error"
+    assert "bad construction" in records["broken.py"]["error"]
+    assert records["stuck.py"]["status"] == "timeout"
+
+    assert records["script.py"]["status"] == "ok"
+    assert records["script.py"]["models"][0]["points"] == 4
+    assert records["script.py"]["outputs"] == ["script.json"]
+
+    assert records["journal.txt"]["status"] == "ok"
+    assert records["journal.txt"]["models"][0]["lines"] == 1
+    assert (output / "journal.txt" / "journal.json").exists()
+
+    assert json.loads((output / "summary.json").read_text()) == summary
+    assert summary["totals"] == {"ok": 2, "error": 1, "timeout": 1}
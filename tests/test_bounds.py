@@ -0,0 +1,57 @@
+import pytest
+
+from geometor.model import Model
+
+
+def _scan(model, guides=True):
+    """The limits recomputed from scratch."""
+    model._bounds_reset()
+    return model.limits(guides=guides)
+
+
+def test_limits_follow_additions_and_deletions():
+    model = Model("bounds")
+    with pytest.raises(ValueError):
+        model.limits()
+
+    A = model.set_point(0, 0, classes=["given"])
+    B = model.set_point(1, 0, classes=["given"])
+    assert model.limits() == [[0.0, 1.0], [0.0, 0.0]]
+    assert model.limits(classes=["given"]) == [[0.0, 1.0], [0.0, 0.0]]
+
+    model.construct_circle(A, B, guide=True)
+    assert model.limits() == [[-1.0, 1.0], [-1.0, 1.0]]
+    assert model.limits(guides=False) == [[0.0, 1.0], [0.0, 0.0]]
+
+    model.construct_circle(B, A)
+    limits = model.limits()
+    assert limits == [[-1.0, 2.0], [-1.0, 1.0]]
+    no_guides = model.limits(guides=False)
+    assert no_guides[0] == [0.0, 2.0]
+    assert no_guides[1] == pytest.approx(limits[1])
+
+    # removing an element inside the bounds keeps them
+    C = model.set_point(0.5, 0.25)
+    assert model.limits() == limits
+    del model[C]
+    assert model.limits() == limits
+
+    # removing an element on the edge rescans
+    model.delete_element(model.get_element_by_ID("A"))
+    assert model.limits() == _scan(model)
+    assert model.limits(guides=False) == _scan(model, guides=False)
+
+
+def test_limits_in_branches():
+    model = Model("bounds")
+    A = model.set_point(0, 0, classes=["given"])
+    B = model.set_point(1, 0, classes=["given"])
+    before = model.limits()
+
+    branch = model.branch()
+    branch.construct_circle(A, B)
+    assert branch.limits() == [[-1.0, 1.0], [-1.0, 1.0]]
+    assert model.limits() == before
+
+    branch.commit()
+    assert model.limits() == [[-1.0, 1.0], [-1.0, 1.0]]
@@ -0,0 +1,56 @@
+import pytest
+
+from geometor.model import Model
+
+
+def build_vesica():
+    model = Model("vesica")
+    A = model.set_point(0, 0, classes=["given"])
+    B = model.set_point(1, 0, classes=["given"])
+    model.construct_circle(A, B)
+    model.construct_circle(B, A)
+    return model, A, B
+
+
+def test_branch_shares_elements_until_modified():
+    model, A, B = build_vesica()
+    branch = model.branch()
+
+    assert len(branch) == len(model)
+    assert branch[A] is model[A]
+
+    line = branch.construct_line(A, B)
+
+    assert line in branch and line not in model
+    # intersections added parents to A and B, so the branch copied them
+    assert branch[A] is not model[A]
+    assert line in branch[A].parents
+    assert line not in model[A].parents
+    assert branch.last_point_id != model.last_point_id
+
+
+def test_commit_and_discard():
+    model, A, B = build_vesica()
+    size = len(model)
+
+    discarded = model.branch()
+    discarded.construct_line(A, B)
+    discarded.discard()
+    assert len(model) == size
+
+    branch = model.branch()
+    line = branch.construct_line(A, B)
+    assert branch.commit() is model
+    assert line in model
+    assert model.last_point_id == branch.last_point_id
+    pt = model.set_point(5, 5)
+    assert model[pt].ID == chr(ord(branch.last_point_id) + 1)
+
+
+def test_commit_rejects_changed_parent():
+    model, A, B = build_vesica()
+    branch = model.branch()
+    model.set_point(5, 5)
+
+    with pytest.raises(ValueError):
+        branch.commit()
@@ -0,0 +1,46 @@
+import json
+
+from geometor.model import Model
+from geometor.model.cache import ScriptCache
+from geometor.model.__main__ import main
+
+SCRIPT = ["* 0, 0", "* 1, 0", "( A B )", "( B A )", "[ C D ]"]
+
+
+def test_edited_script_resumes_from_unchanged_prefix(tmp_path):
+    cache = ScriptCache(tmp_path / "cache", every=2)
+    model, records = cache.run(Model("vesica"), SCRIPT)
+    assert all(record["ok"] and not record["cached"] for record in records)
+
+    edited = ["# vesica", *SCRIPT[:4], "", "[ A B ]"]
+    resumed, records = cache.run(Model("vesica"), edited)
+    assert [record["cached"] for record in records] == [True] * 4 + [False]
+    assert [record["line"] for record in records] == [2, 3, 4, 5, 7]
+    assert resumed.name == "vesica"
+
+    fresh, _ = ScriptCache(tmp_path / "fresh").run(Model("vesica"), edited)
+    assert [resumed[el].ID for el in resumed] == [fresh[el].ID for el in fresh]
+    assert list(resumed) == list(fresh)
+
+
+def test_cli_cache_option(tmp_path, capsys):
+    script = tmp_path / "vesica.txt"
+    script.write_text("\n".join(SCRIPT) + "\n")
+    cache, output = tmp_path / "cache", tmp_path / "out.json"
+
+    assert main([str(script), "-o", str(output), "--cache", str(cache)]) == 0
+    first = json.loads(output.read_text())
+    capsys.readouterr()
+
+    assert main([str(script), "-o", str(output), "--cache", str(cache)]) == 0
+    assert json.loads(output.read_text()) == first
+    assert capsys.readouterr().out.count("cached") == len(SCRIPT)
+
+
+def test_cached_failures_are_replayed(tmp_path):
+    script = tmp_path / "bad.txt"
+    script.write_text("* 0, 0\n[ A Z ]\n")
+    cache, output = tmp_path / "cache", tmp_path / "bad.json"
+
+    assert main([str(script), "-o", str(output), "--cache", str(cache)]) == 1
+    assert main([str(script), "-o", str(output), "--cache", str(cache)]) == 1
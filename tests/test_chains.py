@@ -0,0 +1,74 @@
+import sympy as sp
+
+from geometor.model import Model
+from geometor.model.chains import Chain
+from geometor.model.utils import classify_lengths
+from geometor.model.sections import Section, phi
+
+
+def build_golden_line(model, count=4):
+    """Set points on the x axis whose consecutive gaps grow by phi."""
+    points = [model.set_point(0, 0, classes=["given"])]
+    x = sp.Integer(0)
+    for i in range(count):
+        x = x + phi**i
+        points.append(model.set_point(x, 0))
+    return points
+
+
+def test_find_chains_links_sections_along_line():
+    model = Model("chains")
+    A, B, C, D, E = build_golden_line(model)
+    # sections are given in mixed orientations
+    model.set_section([A, B, C])
+    model.set_section([D, C, B])
+    model.set_section([C, D, E])
+
+    chains = model.find_chains()
+
+    assert len(chains) == 1
+    chain = chains[0]
+    assert isinstance(chain, Chain)
+    assert chain.points == [A, B, C, D, E]
+    assert chain.flow == "<<<"
+
+
+def test_find_chains_reports_each_maximal_chain():
+    model = Model("chains")
+    A, B, C, D, E = build_golden_line(model)
+    model.set_section([A, B, C])
+    model.set_section([C, D, E])
+
+    assert model.find_chains() == []
+    assert len(model.find_chains(min_sections=1)) == 2
+
+
+def test_extract_segments_ignores_orientation():
+    model = Model("chains")
+    A, B, C, D, E = build_golden_line(model)
+    chain = Chain([Section([A, B, C]), Section([D, C, B])])
+
+    assert len(chain.segments) == 3
+    assert chain.lengths[0] == 1
+    assert chain.numerical_lengths == [float(length) for length in chain.lengths]
+
+
+def test_classify_lengths_confirms_near_values_exactly():
+    lengths = [phi, 1 / (phi - 1), sp.Integer(1), phi + sp.Rational(1, 10**12)]
+    # the first two are equal but carry floating-point noise
+    values = [1.618033988749895, 1.6180339887498951, 1.0, 1.618033988751]
+
+    assert classify_lengths(lengths, values) == [1, 1, 0, 2]
+
+
+def test_classify_lengths_is_transitive():
+    # equal lengths with a near but distinct value sorted between them
+    lengths = [sp.sqrt(2), sp.sqrt(2) + sp.Rational(1, 10**12), 2 / sp.sqrt(2)]
+    values = [1.4142135623730951, 1.4142135623730954, 1.4142135623730956]
+    assert classify_lengths(lengths, values) == [0, 1, 0]
+
+    # a chain of small gaps does not merge the ends
+    step = sp.Rational(1, 10**10)
+    lengths = [1 + step * i for i in range(4)]
+    values = [float(length) for length in lengths]
+    assert classify_lengths(lengths, values, tolerance=1.5e-10) == [0, 1, 2, 3]
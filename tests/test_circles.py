@@ -0,0 +1,54 @@
+import sympy as sp
+import sympy.geometry as spg
+
+from geometor.model import Model
+from geometor.model.element import quadrance_intersection
+
+
+def test_quadrance_intersection_matches_sympy():
+    A = spg.Point(0, 0)
+    B = spg.Point(3, 1)
+    circle_1 = spg.Circle(A, sp.sqrt(5))
+    circle_2 = spg.Circle(B, 2)
+    line = spg.Line(spg.Point(-1, 2), spg.Point(4, -1))
+    tangent = spg.Line(spg.Point(-1, 2), spg.Point(1, 2))
+
+    for struct_1, struct_2 in [
+        (circle_1, circle_2),
+        (line, circle_1),
+        (circle_2, line),
+        (tangent, spg.Circle(A, 2)),
+        (circle_1, spg.Circle(spg.Point(10, 0), 1)),
+    ]:
+        expected = struct_1.intersection(struct_2)
+        result = quadrance_intersection(struct_1, struct_2)
+        assert len(result) == len(expected)
+        for pt, other in zip(result, expected):
+            assert sp.simplify(pt.x - other.x) == 0
+            assert sp.simplify(pt.y - other.y) == 0
+
+
+def test_circle_quadrance_and_existence():
+    model = Model("circles")
+    A = model.set_point(0, 0, classes=["given"])
+    B = model.set_point(1, 1, classes=["given"])
+    C = model.set_point(-1, 1, classes=["given"])
+
+    circle = model.construct_circle(A, B)
+    assert model[circle].quadrance == 2
+    assert circle.radius == sp.sqrt(2)
+
+    # the same circle through another point is found by its quadrance
+    assert model.construct_circle(A, C) == circle
+    assert C in model[circle].parents
+    assert len(model.circles) == 1
+
+
+def test_quadrance_intersection_reads_given_quadrance():
+    circle = spg.Circle(spg.Point(0, 0), 1)
+    axis = spg.Line(spg.Point(0, 0), spg.Point(1, 0))
+    # the stored quadrance is used rather than the radius of the key
+    assert quadrance_intersection(axis, circle, None, 4) == [
+        spg.Point(-2, 0),
+        spg.Point(2, 0),
+    ]
@@ -0,0 +1,35 @@
+import json
+
+from geometor.model.__main__ import main
+
+
+def test_batch_mode_runs_script_and_saves(tmp_path, capsys):
+    script = tmp_path / "vesica.txt"
+    script.write_text(
+        "# two circles\n* 0, 0\n* 1, 0\n( A B )\n( B A )\n[ C D ]\nexit\n[ A B ]\n"
+    )
+    output = tmp_path / "out.json"
+
+    assert main([str(script), "-o", str(output)]) == 0
+    saved = json.loads(output.read_text())
+    assert saved["name"] == "vesica"
+    IDs = [element["ID"] for element in saved["elements"]]
+    assert "[ C D ]" in IDs
+    assert "[ A B ]" not in IDs
+
+    printed = capsys.readouterr().out
+    assert "5 commands" in printed
+    assert "[ C D ]" in printed
+
+
+def test_batch_mode_reports_failures(tmp_path):
+    script = tmp_path / "bad.txt"
+    script.write_text("* 0, 0\n[ A Z ]\n")
+    assert main([str(script), "-o", str(tmp_path / "bad.json")]) == 1
+
+
+def test_batch_mode_prints_commands_verbatim(tmp_path, capsys):
+    script = tmp_path / "lower.txt"
+    script.write_text("a = 0, 0\nb = 1, 0\n[a b]\n")
+    assert main([str(script), "-o", str(tmp_path / "lower.json")]) == 0
+    assert "[a b]" in capsys.readouterr().out
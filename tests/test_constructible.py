@@ -0,0 +1,69 @@
+import pickle
+from fractions import Fraction
+
+import sympy as sp
+
+from geometor.model import Model
+from geometor.model.constructible import QuadraticTower
+
+
+def test_tower_arithmetic():
+    tower = QuadraticTower()
+    two = tower.number(2)
+    root_2 = two.sqrt()
+
+    assert len(tower) == 1
+    assert root_2 * root_2 == 2
+    assert hash(root_2 * root_2) == hash(Fraction(2))
+    assert (1 / root_2) * 2 == root_2
+
+    # denested without extending the tower
+    nested = tower.number(sp.sqrt(3 + 2 * sp.sqrt(2)))
+    assert len(tower) == 1
+    assert nested == 1 + root_2
+    assert nested.to_sympy() == 1 + sp.sqrt(2)
+
+    # exact sign of a difference that floats barely separate
+    close = tower.number(sp.Rational(665857, 470832))
+    assert (root_2 - close).sign == -1
+    assert root_2 < close
+
+    root_3 = tower.number(3).sqrt()
+    assert len(tower) == 2
+    assert (root_2 * root_3).sqrt() * (root_2 * root_3).sqrt() == root_2 * root_3
+    assert abs(float(root_2 * root_3) - float(sp.sqrt(6))) < 1e-12
+
+
+def build(backend):
+    model = Model("tower", backend=backend)
+    A = model.set_point(0, 0, classes=["given"])
+    B = model.set_point(1, 0, classes=["given"])
+    model.construct_line(A, B)
+    model.construct_circle(A, B)
+    model.construct_circle(B, A)
+    E = model.get_element_by_ID("E")
+    F = model.get_element_by_ID("F")
+    model.construct_line(E, F)
+    model.construct_circle(model.get_element_by_ID("C"), A)
+    # an existing line through other points is found exactly
+    model.construct_line(B, model.get_element_by_ID("C"))
+    return model
+
+
+def test_tower_backend_matches_sympy():
+    exact = build("sympy")
+    tower = build("tower")
+
+    assert tower.backend == "tower"
+    assert len(tower.tower) > 0
+    assert [el.ID for el in tower.values()] == [el.ID for el in exact.values()]
+    for pt in exact.points:
+        other = tower.get_element_by_ID(exact[pt].ID)
+        assert sp.simplify(other.x - pt.x) == 0
+        assert sp.simplify(other.y - pt.y) == 0
+
+    restored = pickle.loads(pickle.dumps(tower))
+    assert restored.backend == "tower"
+    assert len(restored.tower) == len(tower.tower)
+    pt = restored.set_point(sp.Rational(1, 2), sp.sqrt(3) / 2)
+    assert restored[pt].ID == tower[pt].ID
@@ -0,0 +1,32 @@
+import sympy.geometry as spg
+
+from geometor.model import Model
+from geometor.model.element import Element
+
+
+def test_element_views_behave_like_dicts():
+    A = spg.Point(0, 0)
+    B = spg.Point(1, 0)
+    element = Element(spg.Line(A, B), parents=[A, B, A], classes=["given"])
+
+    assert not hasattr(element, "__dict__")
+    assert list(element.parents) == [A, B]
+    assert element.parents == {A: "", B: ""}
+    assert isinstance(element.parents, dict)
+    assert "given" in element.classes
+
+    copy = element.copy()
+    copy.classes.update({"guide": ""})
+    copy.parents[spg.Point(2, 0)] = ""
+    del copy.parents[A]
+    assert list(copy.classes) == ["given", "guide"]
+    assert list(copy.parents) == [B, spg.Point(2, 0)]
+    assert list(element.classes) == ["given"]
+    assert list(element.parents) == [A, B]
+
+
+def test_class_tuples_are_shared():
+    model = Model("shared")
+    A = model.set_point(0, 0, classes=["given"])
+    B = model.set_point(1, 0, classes=["given"])
+    assert model[A]._classes is model[B]._classes
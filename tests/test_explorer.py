@@ -0,0 +1,36 @@
+from geometor.model import NumericModel
+from geometor.model.explorer import Explorer
+
+
+def build_start():
+    model = NumericModel("start")
+    A = model.set_point(0, 0, classes=["given"])
+    B = model.set_point(1, 0, classes=["given"])
+    model.construct_circle(A, B)
+    model.construct_circle(B, A)
+    return model
+
+
+def score_points(model, path):
+    count = len(model.points)
+    return count if count > 4 else None
+
+
+def test_explore_dedups_and_streams_results():
+    explorer = Explorer(build_start(), depth=1, workers=0)
+    results = list(explorer.explore())
+
+    # lines [A B], [A C], [B C] ... and circles on the four points
+    assert results
+    assert len({result.signature for result in results}) == len(results)
+    assert all(result.depth == 1 for result in results)
+
+
+def test_explore_prunes_with_score_in_worker_processes():
+    explorer = Explorer(build_start(), score=score_points, depth=2, beam=2, workers=2)
+    results = list(explorer.explore())
+
+    assert results
+    assert all(result.score > 4 for result in results)
+    assert max(result.depth for result in results) == 2
+    assert results[0].describe().startswith(("[", "("))
@@ -0,0 +1,80 @@
+import csv
+import io
+import json
+
+from geometor.model import Model
+
+
+def _model():
+    model = Model("export")
+    A = model.set_point(0, 0, classes=["given"])
+    B = model.set_point(1, 0, classes=["given"])
+    model.construct_circle(A, B)
+    model.set_segment(A, B)
+    return model
+
+
+def test_export_jsonl_records():
+    model = _model()
+    stream = io.StringIO()
+    count = model.export_jsonl(stream, floats=True)
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert count == len(records) == len(model)
+
+    by_ID = {record["ID"]: record for record in records}
+    assert by_ID["A"] == {
+        "ID": "A",
+        "type": "point",
+        "classes": ["given"],
+        "parents": [],
+        "guide": False,
+        "x": "0",
+        "y": "0",
+        "x_float": 0.0,
+        "y_float": 0.0,
+    }
+    circle = by_ID["( A B )"]
+    assert circle["parents"] == ["A", "B"]
+    assert circle["radius_float"] == 1.0
+    segment = next(record for record in records if record["type"] == "segment")
+    assert segment["length"] == "1"
+    assert segment["length_float"] == 1.0
+
+
+def test_export_csv_columns_and_filters():
+    model = _model()
+    stream = io.StringIO()
+    count = model.export_csv(stream, exact=False, floats=True, types=["point"])
+    rows = list(csv.DictReader(io.StringIO(stream.getvalue())))
+    assert count == len(rows) == len(model.points)
+    assert "equation" not in rows[0]
+    assert rows[1]["classes"] == "given"
+    assert float(rows[1]["x_float"]) == 1.0
+
+
+def test_graph_exports_ancestor_closure():
+    model = Model("graph")
+    A = model.set_point(0, 0, classes=["given"])
+    B = model.set_point(1, 0, classes=["given"])
+    model.construct_circle(A, B)
+    model.construct_circle(B, A)
+    model.construct_line(A, B)
+    C = model.get_element_by_ID("C")
+
+    nodes, edges = model.graph([C])
+    assert [model[el].ID for el in nodes] == ["A", "B", "( A B )", "( B A )", "C"]
+    assert len(edges) == len(set(edges)) == 6
+
+    stream = io.StringIO()
+    model.export_dot(stream)
+    dot = stream.getvalue()
+    assert dot.startswith("digraph {\n") and dot.endswith("}\n")
+    assert '"( A B )" [shape=ellipse, label="A B"];' in dot
+    assert dot.count('"C" -> "( A B )";') == 1
+
+    stream = io.StringIO()
+    model.export_graphml(stream, [C])
+    graphml = stream.getvalue()
+    assert graphml.count("<node ") == 5
+    assert graphml.count("<edge ") == 6
+    assert '<edge source="C" target="( A B )"/>' in graphml
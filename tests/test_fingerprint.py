@@ -0,0 +1,72 @@
+import sympy as sp
+
+from geometor.model import Model, NumericModel
+from geometor.model.explorer import Explorer
+from geometor.model.fingerprint import ConfigurationTable, fingerprint, invariants
+
+
+def build_vesica(model, A, B):
+    A = model.set_point(*A, classes=["given"])
+    B = model.set_point(*B, classes=["given"])
+    model.construct_line(A, B)
+    model.construct_circle(A, B)
+    model.construct_circle(B, A)
+    return model
+
+
+def test_fingerprint_is_invariant_under_similarity():
+    base = build_vesica(NumericModel("base"), (0, 0), (1, 0))
+    moved = build_vesica(NumericModel("moved"), (2, 3), (2 + 3 * 0.6, 3 + 3 * 0.8))
+    other = NumericModel("other")
+    A = other.set_point(0, 0)
+    B = other.set_point(1, 0)
+    other.construct_circle(A, B)
+
+    assert fingerprint(base) == fingerprint(moved)
+    assert fingerprint(base) != fingerprint(other)
+
+
+def test_configuration_table_confirms_symbolic_matches():
+    table = ConfigurationTable()
+    first = build_vesica(Model("first"), (0, 0), (1, 0))
+    rotated = build_vesica(Model("rotated"), (0, 0), (0, sp.Rational(1, 2)))
+
+    assert table.add(first, "first")
+    assert not table.add(rotated)
+    assert table.get(rotated) == "first"
+    assert len(table) == 1
+
+
+def test_explorer_merges_similar_figures():
+    start = NumericModel("start")
+    start.set_point(0, 0)
+    start.set_point(1, 0)
+
+    results = list(Explorer(start, depth=1, workers=0, similar=True).explore())
+
+    # both circles are the same figure up to reflection
+    assert len(results) == 2
+
+
+def test_configuration_table_checks_neighbouring_buckets():
+    def figure(offset):
+        model = build_vesica(NumericModel("figure"), (0, 0), (1, 0))
+        model.set_point(0.5, 0.3 + offset)
+        return model
+
+    table = ConfigurationTable(decimals=6)
+    first = figure(0)
+
+    # nudge a point until the invariants of two neighbours straddle a bucket boundary
+    keys = table._keys(invariants(first))[0]
+    for step in range(1, 2000):
+        nudged = figure(step * 1e-7)
+        nudged_keys = table._keys(invariants(nudged))[0]
+        if nudged_keys != keys:
+            break
+        first, keys = nudged, nudged_keys
+    assert nudged_keys != keys
+
+    table.add(first)
+    assert nudged in table
+    assert figure(1e-3) not in table
@@ -0,0 +1,34 @@
+import sys
+
+import sympy as sp
+
+from geometor.model import Model
+from geometor.model.memory import deep_size
+
+
+def test_deep_size_counts_shared_objects_once():
+    shared = sp.sqrt(5) / 2
+    seen = set()
+    assert deep_size(shared, seen) > 0
+    assert deep_size([shared, shared], seen) == sys.getsizeof([shared, shared])
+    assert deep_size(shared, seen) == 0
+
+
+def test_memory_report_adds_up():
+    model = Model("memory")
+    A = model.set_point(0, 0, classes=["given"])
+    B = model.set_point(1, 0, classes=["given"])
+    model.construct_circle(A, B)
+    model.construct_circle(B, A)
+    model.limits()
+
+    usage = model.memory_report(show=False)
+    assert usage["types"]["point"]["count"] == 4
+    assert usage["types"]["circle"]["count"] == 2
+    assert usage["classes"]["given"] > 0
+    elements = sum(
+        entry["sympy"] + entry["metadata"] for entry in usage["types"].values()
+    )
+    assert usage["total"] == (
+        sys.getsizeof(model) + elements + sum(usage["subsystems"].values())
+    )
@@ -0,0 +1,65 @@
+import math
+
+import sympy as sp
+
+from geometor.model import Model, NumericModel
+
+
+def build_vesica(model):
+    A = model.set_point(0, 0, classes=["given"])
+    B = model.set_point(1, 0, classes=["given"])
+    model.construct_line(A, B)
+    model.construct_circle(A, B)
+    model.construct_circle(B, A)
+    return A, B
+
+
+def test_numeric_vesica_matches_symbolic():
+    numeric = NumericModel("vesica")
+    build_vesica(numeric)
+    symbolic = Model("vesica")
+    build_vesica(symbolic)
+
+    assert len(numeric) == len(symbolic)
+    numeric_coords = sorted(numeric.point_coords(pt) for pt in numeric.points)
+    symbolic_coords = sorted((float(pt.x), float(pt.y)) for pt in symbolic.points)
+    for (x1, y1), (x2, y2) in zip(numeric_coords, symbolic_coords):
+        assert math.isclose(x1, x2, abs_tol=1e-12)
+        assert math.isclose(y1, y2, abs_tol=1e-12)
+
+
+def test_numeric_dedups_within_tolerance():
+    numeric = NumericModel("dedup")
+    A = numeric.set_point(0, 0)
+    assert numeric.set_point(1e-12, -1e-12) is A
+    assert len(numeric.points) == 1
+
+
+def test_promote_replays_construction():
+    numeric = NumericModel("vesica")
+    A, B = build_vesica(numeric)
+    poles = [pt for pt in numeric.points if abs(numeric.point_coords(pt)[1]) > 0.5]
+    bisector = numeric.construct_line(*poles)
+
+    symbolic = numeric.promote()
+    assert len(symbolic) == len(numeric)
+    assert sp.Point(sp.Rational(1, 2), 0) in symbolic
+
+    partial = numeric.promote([bisector])
+    # the line [ A B ] is not needed for the bisector
+    assert len(partial.lines) == 1
+    assert len(partial.circles) == 2
+
+
+def test_promote_keeps_points_set_with_parents():
+    numeric = NumericModel("parents")
+    A, B = build_vesica(numeric)
+    line = numeric.lines[0]
+    C = numeric.set_point(3, 0, parents=[line])
+    numeric.construct_circle(A, C, guide=True)
+    assert all(not el.guide for el in numeric.structs)
+
+    symbolic = numeric.promote()
+    assert sp.Point(3, 0) in symbolic
+    assert symbolic.lines[0] in symbolic[sp.Point(3, 0)].parents
+    assert len(symbolic) == len(numeric)
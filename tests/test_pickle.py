@@ -0,0 +1,68 @@
+import pickle
+
+import sympy as sp
+import sympy.geometry as spg
+
+from geometor.model import Model
+from geometor.model.element import CircleElement
+from geometor.model.serialize import encode_model
+
+
+def build_model():
+    model = Model("transfer")
+    A = model.set_point(0, 0, classes=["given"])
+    B = model.set_point(1, 0, classes=["given"])
+    model.construct_line(A, B)
+    model.construct_circle(A, B)
+    model.construct_circle(B, A)
+    C = model.get_element_by_ID("C")
+    D = model.get_element_by_ID("D")
+    model.construct_line(C, D)
+    model.set_section([C, A, B])
+    F = model.get_element_by_ID("F")
+    model.set_polygon([A, B, F], classes=["triangle"])
+    model.set_wedge(A, B, C, D)
+    model.add_poly([1, -1, -1])
+    return model
+
+
+def test_pickle_round_trip():
+    model = build_model()
+    restored = pickle.loads(pickle.dumps(model))
+
+    assert len(restored) == len(model)
+    # wedges compare by identity, so compare keys by their repr
+    for (key, element), (other_key, other) in zip(model.items(), restored.items()):
+        assert sp.srepr(other_key) == sp.srepr(key)
+        assert type(other) is type(element)
+        assert other.ID == element.ID
+        assert other.classes == element.classes
+        assert [restored[p].ID for p in other.parents] == [
+            model[p].ID for p in element.parents
+        ]
+        assert other.guide == element.guide
+        if isinstance(element, CircleElement):
+            assert other.pt_radius == element.pt_radius
+
+    assert restored.name == model.name
+    assert restored.last_point_id == model.last_point_id
+
+    # the ID generator resumes where the original stopped
+    pt_1, pt_2 = restored.points[-2:]
+    restored.construct_line(pt_1, pt_2)
+    model.construct_line(pt_1, pt_2)
+    assert [el.ID for el in restored.values()] == [el.ID for el in model.values()]
+
+
+def test_shared_expressions_are_encoded_once():
+    model = build_model()
+    nodes = encode_model(model)[4]
+
+    compound = [node for node in nodes if isinstance(node, tuple)]
+    assert len(compound) == len(set(compound))
+
+    restored = pickle.loads(pickle.dumps(model))
+    line = next(el for el in restored if isinstance(el, spg.Line))
+    point = next(pt for pt in restored.points if pt in line.points)
+    # keys and parents share the same decoded objects
+    assert any(pt is point for pt in line.points)
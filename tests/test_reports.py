@@ -0,0 +1,42 @@
+import io
+
+from geometor.model import Model
+
+
+def _model():
+    model = Model("reports")
+    A = model.set_point(0, 0, classes=["given"])
+    B = model.set_point(1, 0, classes=["given"])
+    model.construct_line(A, B)
+    model.construct_circle(A, B)
+    return model
+
+
+def test_plain_sequence_report_filters():
+    model = _model()
+
+    stream = io.StringIO()
+    model.report_sequence(plain=True, file=stream)
+    lines = stream.getvalue().splitlines()
+    assert lines[:2] == ["# Sequence", "ID\t<\t>\tclasses\tparents\tequation"]
+    assert len(lines) == 2 + len(model)
+
+    stream = io.StringIO()
+    model.report_sequence(types=["point"], start="B", plain=True, file=stream)
+    rows = [line.split("\t") for line in stream.getvalue().splitlines()[2:]]
+    assert [row[0] for row in rows] == ["B", "C"]
+
+    stream = io.StringIO()
+    model.report_group_by_type(classes=["given"], plain=True, file=stream)
+    assert "A\t0\t0\tgiven" in stream.getvalue()
+    assert "( A B )" not in stream.getvalue().split("# Circles")[1]
+
+
+def test_paged_report_prints_each_page():
+    model = _model()
+    stream = io.StringIO()
+    model.report_sequence(page_size=2, file=stream)
+    output = stream.getvalue()
+    pages = (len(model) + 1) // 2
+    assert f"Sequence ({pages})" in output
+    assert f"Sequence ({pages + 1})" not in output
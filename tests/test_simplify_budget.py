@@ -0,0 +1,65 @@
+import sympy as sp
+import sympy.geometry as spg
+
+from geometor.model import Model
+from geometor.model.utils import clean_expr_checked
+
+NESTED = sp.sqrt(3 + 2 * sp.sqrt(2))
+
+
+def test_clean_expr_checked_budget():
+    assert clean_expr_checked(NESTED) == (1 + sp.sqrt(2), True)
+    assert clean_expr_checked(NESTED, ops=1) == (NESTED, False)
+
+    expr, clean = clean_expr_checked(NESTED, seconds=1e-6)
+    assert not clean
+    assert sp.simplify(expr - NESTED) == 0
+
+
+def test_resimplify_rekeys_dependents():
+    model = Model("budget")
+    model.set_simplify_budget(ops=1)
+    A = model.set_point(0, 0, classes=["given"])
+    B = model.set_point(NESTED, 0, classes=["given"])
+
+    assert model[B].unsimplified
+    assert not model[A].unsimplified
+
+    line = model.construct_line(A, B)
+    circle = model.construct_circle(A, B)
+    IDs = [element.ID for element in model.values()]
+
+    assert model.resimplify() == []
+
+    B_new = spg.Point(1 + sp.sqrt(2), 0)
+    assert B not in model and B_new in model
+    assert not model[B_new].unsimplified
+    assert [element.ID for element in model.values()] == IDs
+
+    new_line, new_circle = model.lines[0], model.circles[0]
+    assert new_line.points == (A, B_new)
+    assert new_circle.radius == 1 + sp.sqrt(2)
+    assert model[new_circle].pt_radius == B_new
+    assert line not in model and circle not in model
+
+    # every parent reference points at a key of the model
+    for element in model.values():
+        assert all(parent in model for parent in element.parents)
+    assert new_circle in model[B_new].parents
+
+
+def test_resimplify_rebuilds_circle_quadrance():
+    model = Model("quadrance")
+    model.set_simplify_budget(ops=1)
+    A = model.set_point(0, 0, classes=["given"])
+    B = model.set_point(NESTED + 1, 0, classes=["given"])
+    circle = model.construct_circle(A, B)
+    assert model[circle].quadrance.has(NESTED)
+
+    model.resimplify()
+    new_circle = model.circles[0]
+    quadrance = model[new_circle].quadrance
+    assert not quadrance.has(NESTED)
+    assert sp.simplify(quadrance - (2 + sp.sqrt(2)) ** 2) == 0
+    assert quadrance is model.intern(quadrance)
+    assert new_circle.radius == 2 + sp.sqrt(2)
@@ -0,0 +1,71 @@
+import math
+
+import sympy.geometry as spg
+
+from geometor.model import Model
+
+
+def _model():
+    model = Model("spatial")
+    A = model.set_point(0, 0, classes=["given"])
+    B = model.set_point(1, 0, classes=["given"])
+    model.construct_line(A, B)
+    model.construct_circle(A, B)
+    model.construct_circle(B, A, guide=True)
+    return model
+
+
+def test_query_rect_matches_scan():
+    model = _model()
+    index = model.spatial_index
+
+    x_range, y_range = (0.25, 2.5), (0.5, 1.5)
+    expected = []
+    for key in model:
+        if isinstance(key, spg.Point):
+            x, y = (float(value) for value in model[key].numeric)
+            if 0.25 <= x <= 2.5 and 0.5 <= y <= 1.5:
+                expected.append(key)
+        elif isinstance(key, spg.Circle):
+            x, y, radius = (float(value) for value in model[key].numeric)
+            corners = [
+                math.hypot(cx - x, cy - y) for cx in x_range for cy in y_range
+            ]
+            near = math.hypot(
+                max(0.25 - x, 0, x - 2.5), max(0.5 - y, 0, y - 1.5)
+            )
+            if near <= radius <= max(corners):
+                expected.append(key)
+    assert model.query_rect(x_range, y_range) == expected
+    assert index is model.spatial_index
+
+    # every point and circle is in the limits, and so is the line
+    assert set(model.query_rect(*model.limits())) == {
+        key
+        for key in model
+        if isinstance(key, (spg.Point, spg.Line, spg.Circle))
+    }
+    assert all(
+        not model[key].guide
+        for key in model.query_rect(*model.limits(), guides=False)
+    )
+
+
+def test_nearest_is_kept_up_to_date():
+    model = _model()
+    A, B = model.points[:2]
+
+    assert model.nearest(0.1, 0.1) == [A]
+    assert model.nearest(0.9, -0.1, k=2) == [B, A]
+    assert model.nearest(-5, 0.1, k=1, classes=["given"]) == [A]
+
+    line = next(key for key in model if isinstance(key, spg.Line))
+    assert model.nearest(10, 0.01, structs=True) == [line]
+
+    far = model.set_point(100, 100)
+    assert model.nearest(90, 90) == [far]
+    assert model.query_rect((99, 101), (99, 101)) == [far]
+
+    del model[far]
+    assert far not in model.spatial_index.entries
+    assert model.nearest(90, 90) != [far]
@@ -0,0 +1,80 @@
+import pickle
+
+import mpmath
+import sympy as sp
+import sympy.geometry as spg
+
+from geometor.model import Model
+from geometor.model.utils import compare_points, intern_expr, point_value, sort_points
+
+
+def test_compare_points_breaks_ties_exactly():
+    # equal values written differently tie numerically and compare equal exactly
+    nested = spg.Point(sp.sqrt(3 + 2 * sp.sqrt(2)), 0, evaluate=False)
+    denested = spg.Point(1 + sp.sqrt(2), 0)
+    assert compare_points(nested, denested) == 0
+
+    # values that agree to 40 digits are still ordered exactly
+    tiny = sp.Integer(10) ** -40
+    low = spg.Point(sp.sqrt(2), 0)
+    high = spg.Point(sp.sqrt(2) + tiny, 0)
+    assert compare_points(low, high) == -1
+    assert compare_points(high, low) == 1
+
+    points = [spg.Point(1, 1), high, spg.Point(-1, 5), low, spg.Point(1, -1)]
+    assert sort_points(points) == [
+        spg.Point(-1, 5),
+        spg.Point(1, -1),
+        spg.Point(1, 1),
+        low,
+        high,
+    ]
+
+
+def test_elements_cache_numeric_values():
+    model = Model("numeric")
+    A = model.set_point(0, 0, classes=["given"])
+    B = model.set_point(1, 0, classes=["given"])
+    circle = model.construct_circle(A, B)
+
+    assert model[A].numeric == point_value(A)
+    assert sort_points([B, A], [model[B].numeric, model[A].numeric]) == [A, B]
+    assert float(model[circle].numeric[2]) == 1.0
+    assert model.limits() == [[-1.0, 1.0], [-1.0, 1.0]]
+
+
+def test_intern_expr_shares_subexpressions():
+    table = {}
+    first = intern_expr(sp.Rational(1, 2) + sp.sqrt(5) / 2, table)
+    second = intern_expr(sp.sqrt(5) / 2 + sp.Rational(1, 2), table)
+    assert first is second
+
+    root = intern_expr(sp.sqrt(5), table)
+    assert any(arg is root for arg in first.atoms(sp.Pow))
+    assert intern_expr(sp.Float(2.0), table) is not intern_expr(sp.Integer(2), table)
+
+    model = Model("interned")
+    A = model.set_point(0, 0)
+    B = model.set_point(1, 0)
+    model.construct_circle(A, B)
+    model.construct_circle(B, A)
+    C, D = model.points[2:4]
+    assert model.intern(-C.y) is D.y
+    assert model.branch().intern(C.y) is C.y
+
+
+def test_numeric_digits_set_the_cached_precision():
+    with mpmath.workdps(60):
+        root = mpmath.sqrt(2)
+
+        model = Model("digits", numeric_digits=50)
+        A = model.set_point(sp.sqrt(2), 0)
+        B = model.set_point(0, 0)
+        circle = model.construct_circle(B, A)
+        assert abs(model[A].numeric[0] - root) < 1e-45
+        assert abs(model[circle].numeric[2] - root) < 1e-45
+        assert pickle.loads(pickle.dumps(model)).numeric_digits == 50
+
+        model.numeric_digits = 10
+        assert 1e-25 < abs(model[A].numeric[0] - root) < 1e-9
+        assert model.branch().numeric_digits == 10